@@ -4,37 +4,96 @@ A point can be referenced by:
 1. Lines (start_id or end_id)
 2. Curves (arc_point_ids)
 """
-import json
-from collections import defaultdict
-
-# Load the file
-with open('calibrated.dig', 'r') as f:
-    data = json.load(f)
-
-# Count references for each point
-point_refs = defaultdict(lambda: {'lines': [], 'curves': [], 'count': 0})
-
-# Count line references
-for line in data.get('lines', []):
-    if not line.get('hidden', False):
-        start_id = line.get('start_id')
-        end_id = line.get('end_id')
-        line_id = line.get('id')
-        
-        if start_id:
-            point_refs[start_id]['lines'].append(f"line_{line_id}_start")
-            point_refs[start_id]['count'] += 1
-        if end_id:
-            point_refs[end_id]['lines'].append(f"line_{line_id}_end")
-            point_refs[end_id]['count'] += 1
-
-# Count curve references
-for curve in data.get('curves', []):
-    if not curve.get('hidden', False):
-        curve_id = curve.get('id')
-        for point_id in curve.get('arc_point_ids', []):
-            point_refs[point_id]['curves'].append(f"curve_{curve_id}")
-            point_refs[point_id]['count'] += 1
+import numpy as np
+from digitizer.jsonio import load_json
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+PROJECT_FILE = 'calibrated.dig'
+
+# Reference kinds; refs are stored as (kind, id) tuples and only formatted when printed
+LINE_START, LINE_END, CURVE = 0, 1, 2
+_REF_FORMATS = {LINE_START: "line_{}_start", LINE_END: "line_{}_end", CURVE: "curve_{}"}
+
+
+def format_refs(refs):
+    return [_REF_FORMATS[kind].format(ref_id) for kind, ref_id in refs]
+
+
+def _count_refs_loop(start_ids, end_ids, curve_ids, max_id):
+    """Count references per point id (index = point id); loop form for numba."""
+    counts = np.zeros(max_id + 1, np.int32)
+    for i in range(start_ids.size):
+        counts[start_ids[i]] += 1
+    for i in range(end_ids.size):
+        counts[end_ids[i]] += 1
+    for i in range(curve_ids.size):
+        counts[curve_ids[i]] += 1
+    return counts
+
+
+def _count_refs_scatter(start_ids, end_ids, curve_ids, max_id):
+    """Count references per point id with a single unbuffered scatter-add."""
+    counts = np.zeros(max_id + 1, np.int32)
+    np.add.at(counts, np.concatenate([start_ids, end_ids, curve_ids]), 1)
+    return counts
+
+
+# Compile the counting loop when numba is available, otherwise scatter-add in numpy
+count_refs = njit(cache=True)(_count_refs_loop) if njit is not None else _count_refs_scatter
+
+_loaded = {}
+
+
+def iter_section(path, name):
+    """Yield the records of a top-level list ('lines' or 'curves').
+
+    Streams with ijson when it is installed so the whole project never has
+    to be materialized; otherwise loads the file once (orjson if available).
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, f'{name}.item')
+        return
+    if path not in _loaded:
+        _loaded[path] = load_json(path)
+    yield from _loaded[path].get(name, [])
+
+
+# Keep only the fields needed for counting: (id, start_id, end_id) and (id, arc_point_ids)
+visible_lines = [(l.get('id'), l.get('start_id'), l.get('end_id'))
+                 for l in iter_section(PROJECT_FILE, 'lines') if not l.get('hidden', False)]
+visible_curves = [(c.get('id'), c.get('arc_point_ids', []))
+                  for c in iter_section(PROJECT_FILE, 'curves') if not c.get('hidden', False)]
+
+# Materialize referenced ids as integer arrays (falsy ids are ignored, as before)
+start_ids = np.fromiter((s for _, s, _ in visible_lines if s), dtype=np.int64)
+end_ids = np.fromiter((e for _, _, e in visible_lines if e), dtype=np.int64)
+curve_ids = np.fromiter((pid for _, arc_ids in visible_curves for pid in arc_ids), dtype=np.int64)
+
+max_id = int(max((a.max() for a in (start_ids, end_ids, curve_ids) if a.size), default=0))
+counts = count_refs(start_ids, end_ids, curve_ids, max_id)
+
+# Only points over the limit need their reference labels reconstructed
+hot_ids = set(np.nonzero(counts > 3)[0].tolist())
+point_refs = {pid: {'lines': [], 'curves': [], 'count': int(counts[pid])} for pid in hot_ids}
+for line_id, start_id, end_id in visible_lines:
+    if start_id in hot_ids:
+        point_refs[start_id]['lines'].append((LINE_START, line_id))
+    if end_id in hot_ids:
+        point_refs[end_id]['lines'].append((LINE_END, line_id))
+for curve_id, arc_ids in visible_curves:
+    for point_id in arc_ids:
+        if point_id in hot_ids:
+            point_refs[point_id]['curves'].append((CURVE, curve_id))
 
 # Find points with more than 3 references
 print("Points with more than 3 references:")
@@ -43,22 +102,19 @@ print("=" * 80)
 over_limit = []
 for point_id in sorted(point_refs.keys()):
     refs = point_refs[point_id]
-    if refs['count'] > 3:
-        over_limit.append((point_id, refs))
-        print(f"\nPoint ID: {point_id}")
-        print(f"  Total references: {refs['count']}")
-        print(f"  Line refs ({len(refs['lines'])}): {refs['lines']}")
-        print(f"  Curve refs ({len(refs['curves'])}): {refs['curves']}")
+    over_limit.append((point_id, refs))
+    print(f"\nPoint ID: {point_id}")
+    print(f"  Total references: {refs['count']}")
+    print(f"  Line refs ({len(refs['lines'])}): {format_refs(refs['lines'])}")
+    print(f"  Curve refs ({len(refs['curves'])}): {format_refs(refs['curves'])}")
 
 print("\n" + "=" * 80)
 print(f"Total points with >3 refs: {len(over_limit)}")
 print(f"Maximum references: {max((r['count'] for _, r in over_limit), default=0)}")
 
-# Show distribution
-ref_counts = defaultdict(int)
-for refs in point_refs.values():
-    ref_counts[refs['count']] += 1
+# Show distribution (only referenced points, as before)
+dist_values, dist_points = np.unique(counts[counts > 0], return_counts=True)
 
 print("\nReference count distribution:")
-for count in sorted(ref_counts.keys()):
-    print(f"  {count} refs: {ref_counts[count]} points")
+for count, n_points in zip(dist_values.tolist(), dist_points.tolist()):
+    print(f"  {count} refs: {n_points} points")
@@ -1,20 +1,18 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-import fitz
-from PIL import Image, ImageTk
-import io
-import configparser
+from tkinter import filedialog, messagebox, simpledialog, colorchooser, ttk
 import shutil
 import datetime
 import os
+import copy
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 import numpy as np
-import json
-import csv
 from calibration import CalibrationMixin
 from points_lines import PointsLinesMixin
 from curves import CurvesMixin
 from deletion import DeletionMixin
-from utils import UtilsMixin
+from utils import UtilsMixin, ListSnapshotCache, index_by_id
 from pyvista_view import PyVistaViewMixin
 
 # digitizer helpers (migration, id allocation, schema validation)
@@ -27,6 +25,72 @@ except Exception:
     migrate_project = None
     validate_project = None
 
+from digitizer.jsonio import load_json, dump_json
+from digitizer.kernels import warm_kernels, padded_bounds
+from digitizer.exporter import (write_lines_z_csv, sql_batches, SQL_COORD_INSERT,
+                                 SQL_EDGE_INSERT, SQL_EDGE)
+
+# fitz and PIL are imported on first use (opening a PDF / first render) so the
+# window comes up without loading MuPDF or Pillow; see _import_fitz/_import_pil
+fitz = None
+Image = ImageTk = None
+
+
+def _import_fitz():
+    global fitz
+    if fitz is None:
+        import fitz as _fitz
+        fitz = _fitz
+    return fitz
+
+
+def _import_pil():
+    global Image, ImageTk
+    if ImageTk is None:
+        from PIL import Image as _Image, ImageTk as _ImageTk
+        Image, ImageTk = _Image, _ImageTk
+    return Image, ImageTk
+
+
+# Parsed config files keyed by (path, st_mtime_ns); see _read_config_cached
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _read_config_cached(path):
+    """Parse a JSON config file, reusing the last parse while its mtime is unchanged.
+
+    Callers get a deep copy so edits to their config do not leak into the cache.
+    """
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = load_json(path)
+        with _CONFIG_CACHE_LOCK:
+            # one entry per path: drop parses of older versions of the file
+            for old in [k for k in _CONFIG_CACHE if k[0] == key[0]]:
+                del _CONFIG_CACHE[old]
+            _CONFIG_CACHE[key] = cached
+    return copy.deepcopy(cached)
+
+
+# Viewer-specific row templates for the SQL export (shared ones are in digitizer.exporter)
+_SQL_COORD = "({id}, {x}, {y}, {z}, '{desc}')"
+_SQL_CURVE_INSERT = "INSERT INTO SeasPathDB.dbo.Visualization_Curve (PositionNumber, CoordinateId, EdgeId) VALUES\n"
+_SQL_CURVE = "({0}, {1}, {2})"
+
+# Canvas tag expression covering every item hide/show_all_elements toggles
+_TOGGLEABLE_TAGS = "user_point||user_line||line_label||user_curve||arc_point"
+
+
+def _drawable_point_xy(points):
+    # structure-of-arrays view of the points that have pdf coordinates; see _point_xy
+    drawable = [p for p in points if 'pdf_x' in p and 'pdf_y' in p]
+    xy = np.array([(p['pdf_x'], p['pdf_y']) for p in drawable], dtype=np.float64).reshape(-1, 2)
+    row_of = {p['id']: i for i, p in enumerate(drawable)}
+    return drawable, xy, row_of
+
 
 class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixin, UtilsMixin, PyVistaViewMixin):
     def __init__(self, root):
@@ -40,7 +104,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         except Exception:
             # fallback to a sensible default size
             self.master.geometry("1400x900")
-        Image.MAX_IMAGE_PIXELS = None
 
         self.A, self.B = 0, 1
 
@@ -54,11 +117,52 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self._zoom_render_job = None
         self._pending_zoom_level = None
         self._pending_zoom_pdf_coords = None
+        # wheel-zoom previews are coalesced into one resize per ~30 ms; _preview_zoom is
+        # the zoom the on-screen preview was scaled to (None when showing a real render)
+        self._zoom_preview_job = None
+        self._preview_zoom = None
         self._last_rendered_pil = None
+        self._last_rendered_zoom = 1.0
+        # LRU of rendered pages keyed by (page, zoom, clip) -> (PIL image, PhotoImage, bytes),
+        # bounded by entry count and by the memory its images hold
+        self._pix_cache = OrderedDict()
+        self._pix_cache_max = 8
+        self._pix_cache_budget = 256 * 1024 * 1024
+        self._pix_cache_bytes = 0
+        # clipped (high zoom) renders are assembled from square tiles; tiles are
+        # cached on their own so scrolling only rasterizes newly exposed ones
+        self._tile_px = 512
+        self._tile_cache = OrderedDict()
+        self._tile_cache_budget = 128 * 1024 * 1024
+        self._tile_cache_bytes = 0
+        # pages larger than this (in pixels at the current zoom) are rendered only
+        # around the visible viewport via get_pixmap(clip=...)
+        self._clip_render_min_pixels = 4096 * 4096
+        self._render_clip_px = None
+        self._render_origin = (0, 0)
+        # set while a viewport re-render is queued via after_idle (coalesces pan/scroll events)
+        self._pending_render = False
+        # pan and zoom re-renders are rasterized one tile per Tk after() step while the
+        # current (or preview) image stays up; see _request_render. PyMuPDF is not
+        # thread-safe, so all rendering stays on the Tk thread.
+        self._render_job_id = None
+        self._render_queue = None
+        # nesting depth of _batch_updates() and the refreshes deferred while it is open
+        self._batch_depth = 0
+        self._batch_pending = {}
+        # one redraw per idle cycle for repeated edits (see _schedule_redraw)
+        self._redraw_pending = False
+        self._redraw_status = None
+        # discrete zoom ladder (powers of 1.2) so repeated zooms hit the page cache
+        self._zoom_steps = np.array([1.2 ** k for k in range(-12, 25)])
 
         self.reference_points_pdf = []
         self.reference_points_real = []
         self.user_points = []
+        # lazily rebuilt id -> entity indexes (ListSnapshotCache per list); see _id_index()
+        self._id_indexes = {}
+        # highest id handed out by the allocator-less fallback; see _fallback_point_id()
+        self._fallback_point_max = 0
         
         # Track backup file created on project load for cleanup
         self._current_backup_file = None
@@ -68,12 +172,16 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self._modified = False
 
         self._drag_data = {"x": 0, "y": 0}
+        # latest pointer position and the pending job that shows it (see on_mouse_move)
+        self._mouse_pos = None
+        self._mouse_move_job = None
         self.calibration_mode = False
         self.calibration_step = 0
         self.transformation_matrix = None
 
-        self.config_file = "config.ini"
-        self.config = configparser.ConfigParser()
+        self.config_file = "config.json"
+        # config is a plain dict of sections: {'General': {...}, 'View': {...}, ...}
+        self.config = {}
         self.load_config()
 
         self.lines = []
@@ -83,6 +191,13 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
         self.elevation_var = tk.StringVar(value="0.0")
         self.mode_var = tk.StringVar(value="calibration")
+        # arc-point ovals are only drawn while in curves mode; see _create_markers()
+        self._arc_markers_shown = False
+        # left-click handler for the current mode, refreshed whenever mode_var changes
+        self._click_handlers = self._build_click_handlers()
+        self._active_click_handler = None
+        self.mode_var.trace_add('write', self._on_mode_var_changed)
+        self._on_mode_var_changed()
         # legacy counters removed; IDs are allocated deterministically via next_* helpers
         # Configurable number of interior points for curves (default 4 -> total 6 points per curve)
         try:
@@ -96,6 +211,12 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         else:
             self.allocator = None
 
+        # Compile the hit-test kernels now rather than on the first click
+        try:
+            warm_kernels()
+        except Exception:
+            pass
+
         # Deletion log to track removed items
         self.deletion_log = []
         
@@ -105,6 +226,10 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.point_markers = {}
         self.point_labels = {}
         self.calibration_markers = {}
+        # display options the current canvas markers were styled with; see _create_markers
+        self._marker_style = None
+        # cached structure-of-arrays view of the drawable points; see _point_xy()
+        self._point_xy_cache = ListSnapshotCache(_drawable_point_xy)
         self.zoom_entry = None
         self.points_label = None
         self.calib_status = None
@@ -116,61 +241,54 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.selected_item = None
         # sort state for treeviews: map (tree, column) -> ascending(bool)
         self._tv_sort_state = {}
+        # rows currently shown per editor treeview ({iid: (values, tags)}), for diffing
+        self._tv_state = {}
+        self._editor_lists_stale = False
         # store base heading texts per tree so we can add visual sort indicators
         self._tv_heading_texts = {}
 
         self.build_ui()
 
-    # Centralized ID helpers to keep legacy counters synchronized with allocator
-    def next_point_id(self):
-        try:
-            if hasattr(self, 'allocator') and self.allocator is not None:
-                nid = self.allocator.next_point_id()
-                return nid
-        except Exception:
-            pass
-        # Deterministic fallback: use max existing point id + 1
-        try:
-            max_id = max((p.get('id', 0) for p in self.user_points), default=0)
-            return max_id + 1
-        except Exception:
-            # final fallback
-            return 1
-
-    def next_line_id(self):
-        try:
-            if hasattr(self, 'allocator') and self.allocator is not None:
-                lid = self.allocator.next_line_id()
-                try:
-                    # if allocator tracks line counter, keep in sync
-                    pass
-                except Exception:
-                    pass
-                return lid
-        except Exception:
-            pass
-        try:
-            max_id = max((l.get('id', 0) for l in self.lines), default=0)
-            return max_id + 1
-        except Exception:
-            return 1
-
-    def next_curve_id(self):
-        try:
-            if hasattr(self, 'allocator') and self.allocator is not None:
-                cid = self.allocator.next_curve_id()
-                try:
-                    pass
-                except Exception:
-                    pass
-                return cid
-        except Exception:
-            pass
-        try:
-            max_id = max((c.get('id', 0) for c in self.curves), default=0)
-            return max_id + 1
-        except Exception:
-            return 1
+    # Centralized ID helpers. Assigning self.allocator binds next_point_id,
+    # next_point_ids, next_line_id and next_curve_id straight to the allocator's
+    # methods (or to the max-id fallbacks below when there is none), so the hot
+    # add paths make a plain call with no per-call checks.
+    @property
+    def allocator(self):
+        return self._allocator
+
+    @allocator.setter
+    def allocator(self, allocator):
+        self._allocator = allocator
+        if allocator is not None:
+            self.next_point_id = allocator.next_point_id
+            self.next_point_ids = allocator.allocate_point_ids
+            self.next_line_id = allocator.next_line_id
+            self.next_curve_id = allocator.next_curve_id
+        else:
+            self.next_point_id = self._fallback_point_id
+            self.next_point_ids = self._fallback_point_ids
+            self.next_line_id = self._fallback_line_id
+            self.next_curve_id = self._fallback_curve_id
+
+    def _fallback_point_id(self):
+        # Deterministic fallback: use max existing point id + 1; ids already handed
+        # out for points a duplicate has staged but not appended yet are not reused
+        max_id = max((p.get('id', 0) for p in self.user_points), default=0)
+        pid = max(max_id, self._fallback_point_max) + 1
+        self._fallback_point_max = pid
+        return pid
+
+    def _fallback_point_ids(self, n):
+        """Allocate n consecutive point ids at once (see _fallback_point_id)."""
+        start = self._fallback_point_id()
+        return range(start, start + n)
+
+    def _fallback_line_id(self):
+        return max((l.get('id', 0) for l in self.lines), default=0) + 1
+
+    def _fallback_curve_id(self):
+        return max((c.get('id', 0) for c in self.curves), default=0) + 1
 
     def build_ui(self):
         menu_bar = tk.Menu(self.master)
@@ -237,7 +355,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.canvas = tk.Canvas(view2d_frame, bg="grey", cursor="crosshair")
         self.vscroll = tk.Scrollbar(view2d_frame, orient="vertical", command=self.canvas.yview)
         self.hscroll = tk.Scrollbar(view2d_frame, orient="horizontal", command=self.canvas.xview)
-        self.canvas.configure(yscrollcommand=self.vscroll.set, xscrollcommand=self.hscroll.set)
+        self.canvas.configure(yscrollcommand=self._on_canvas_yscroll, xscrollcommand=self._on_canvas_xscroll)
         self.canvas.grid(row=0, column=0, sticky="nsew")
         self.vscroll.grid(row=0, column=1, sticky="ns")
         self.hscroll.grid(row=1, column=0, sticky="ew")
@@ -245,7 +363,11 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         # Editor tab for listing and editing entities
         self.editor_frame = tk.Frame(self.notebook)
         self.notebook.add(self.editor_frame, text="Editor")
-        self._build_editor_tab(self.editor_frame)
+        # the editor widgets (treeviews and edit forms) are built the first time the
+        # tab is selected, see _on_notebook_tab_changed
+        self._editor_built = False
+        self.points_tv = self.lines_tv = self.curves_tv = self.rfid_tv = None
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_notebook_tab_changed, add='+')
         
         # 3D view tab (matplotlib) - created lazily
         self.view3d_frame = tk.Frame(self.notebook)
@@ -345,7 +467,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
         # NOTE: Display controls moved to a separate Options window (View -> Options...)
         # Default display params (2D) are still initialized here so other code can rely on them.
-        from tkinter import colorchooser
         self.point_color_2d = 'blue'
         self.line_color_2d = 'orange'
         self.curve_color_2d = 'purple'
@@ -380,6 +501,9 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
         # Initialize 3D plotting support (lazy import)
         self._3d_initialized = False
+        # set when a redraw was skipped because the 3D tab was hidden; the plot is
+        # brought up to date when the tab is selected (_on_notebook_tab_changed)
+        self._3d_dirty = True
         # 3D view preferences
         self._3d_point_size = 20
         self._3d_point_color = 'b'
@@ -388,6 +512,28 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self._3d_highlight_color = '#ff00ff'
         self._3d_theme = 'default'
         self._3d_show_grid = True
+        # per-point/per-line id labels are one Text artist each; they can be turned
+        # off from the 3D toolbar when they dominate redraw time on large projects
+        self._3d_show_labels = True
+        # minimum screen spacing in pixels between id labels; labels that would land
+        # closer than this to one already placed are skipped (0 draws every label)
+        self._3d_label_density = 20
+        # Wheel zoom blits the data artists over a background cached after each full
+        # draw (see _on_3d_draw_event); a full redraw follows once the wheel settles
+        self._3d_bg = None
+        self._3d_artists = []
+        self._3d_settle_job = None
+        # persistent scatter/collection artists of the 3D plot (see _build_3d_artists),
+        # the style they were built with, and the id label Text artists of the last update
+        self._3d_plot_artists = None
+        self._3d_plot_style = None
+        self._3d_label_artists = []
+        # (k,3) vertex arrays of curves whose arc_points_real carry their own Z,
+        # keyed by curve id and validated against the arc list identity and length
+        self._3d_curve_cache = {}
+        # wheel ticks arriving before Tk goes idle are folded into one zoom step
+        self._3d_pending_factor = 1.0
+        self._3d_redraw_scheduled = False
         self._3d_elev = 30
         self._3d_azim = -60
         # Line audit state
@@ -441,7 +587,10 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         grid_btn.config(variable=grid_btn_var)
         grid_btn.pack(side='left', padx=(8, 0))
 
-        self._3d_toolbar_vars = {'theme_cb': theme_cb, 'grid_var': grid_btn_var}
+        labels_var = tk.BooleanVar(value=self._3d_show_labels)
+        tk.Checkbutton(toolbar, text='Labels', variable=labels_var, command=self.toggle_3d_labels).pack(side='left')
+
+        self._3d_toolbar_vars = {'theme_cb': theme_cb, 'grid_var': grid_btn_var, 'labels_var': labels_var}
 
         self._3d_canvas.get_tk_widget().pack(fill='both', expand=True)
         # Add Matplotlib navigation toolbar (rotate/pan/zoom)
@@ -472,8 +621,75 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self._3d_canvas.mpl_connect('button_press_event', self._on_3d_click)
         except Exception:
             pass
+        try:
+            self._3d_canvas.mpl_connect('draw_event', self._on_3d_draw_event)
+        except Exception:
+            pass
         self._3d_initialized = True
 
+    def _on_3d_draw_event(self, event=None):
+        """Cache the axes background after a full draw and paint the data artists on top.
+
+        The data artists are animated, so a full draw leaves them out and the
+        bbox copied here is everything else (panes, grid, ticks, labels).
+        """
+        try:
+            canvas = self._3d_canvas
+            ax = self._3d_ax
+            self._3d_bg = canvas.copy_from_bbox(ax.bbox)
+            for artist in sorted(self._3d_artists, key=lambda a: a.get_zorder()):
+                ax.draw_artist(artist)
+        except Exception:
+            self._3d_bg = None
+
+    def _redraw_3d_zoomed(self):
+        """Show new 3D axis limits: blit the data now, redraw everything once settled."""
+        blitted = False
+        if self._3d_bg is not None and self._3d_artists:
+            try:
+                canvas = self._3d_canvas
+                ax = self._3d_ax
+                # Reproject with the new limits; Axes3D.draw would normally do this
+                ax.M = ax.get_proj()
+                try:
+                    ax.invM = np.linalg.inv(ax.M)
+                except Exception:
+                    pass
+                for artist in self._3d_artists:
+                    if hasattr(artist, 'do_3d_projection'):
+                        artist.do_3d_projection()
+                canvas.restore_region(self._3d_bg)
+                for artist in sorted(self._3d_artists, key=lambda a: a.get_zorder()):
+                    ax.draw_artist(artist)
+                canvas.blit(ax.bbox)
+                blitted = True
+            except Exception:
+                blitted = False
+        if not blitted:
+            try:
+                self._3d_canvas.draw_idle()
+            except Exception:
+                try:
+                    self._3d_canvas.draw()
+                except Exception:
+                    pass
+            return
+        # The cached background still shows the old ticks and grid; refresh them
+        # with one full draw after the last wheel event
+        if self._3d_settle_job:
+            try:
+                self.master.after_cancel(self._3d_settle_job)
+            except Exception:
+                pass
+        self._3d_settle_job = self.master.after(250, self._settle_3d_view)
+
+    def _settle_3d_view(self):
+        self._3d_settle_job = None
+        try:
+            self._3d_canvas.draw_idle()
+        except Exception:
+            pass
+
     def _do_full_zoom_render(self):
         """Perform a full high-quality PDF render for the pending zoom level and re-center view."""
         try:
@@ -483,6 +699,12 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 except Exception:
                     pass
                 self._zoom_render_job = None
+            if self._zoom_preview_job is not None:
+                try:
+                    self.master.after_cancel(self._zoom_preview_job)
+                except Exception:
+                    pass
+                self._zoom_preview_job = None
 
             if self._pending_zoom_level is None:
                 return
@@ -496,15 +718,18 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 self.zoom_level = float(self._pending_zoom_level)
             except Exception:
                 pass
-            # trigger the normal full rendering path
-            self.display_page()
+            in_place = bool(self.canvas_image and self.pdf_doc)
+            if in_place:
+                self.canvas.config(scrollregion=(0, 0, *self._page_pixel_size()))
+            else:
+                # the normal full rendering path if there is no image item yet
+                self.display_page()
 
             # if we have a center point, recenter the canvas so that the same PDF point
             # remains under the original cursor location
             try:
-                if x_pdf is not None and y_pdf is not None and self.photo_image is not None:
-                    img_width = self.photo_image.width()
-                    img_height = self.photo_image.height()
+                if x_pdf is not None and y_pdf is not None and self.pdf_doc is not None:
+                    img_width, img_height = self._page_pixel_size()
                     x_scroll_new = x_pdf * self.zoom_level
                     y_scroll_new = y_pdf * self.zoom_level
                     frac_x = (x_scroll_new - (self.canvas.winfo_width() // 2)) / img_width if img_width > 0 else 0
@@ -519,9 +744,21 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             except Exception:
                 pass
 
+            if in_place:
+                # swap the page image in place (rendered in the background for the
+                # recentered view; the preview stays up until then) and move
+                # existing markers instead of recreating them
+                self._request_render()
+                self._rescale_markers()
+                self.zoom_entry.delete(0, tk.END)
+                self.zoom_entry.insert(0, f"{self.zoom_level*100:.0f}")
+            else:
+                self._ensure_viewport_rendered()
+
             # clear pending state
             self._pending_zoom_level = None
             self._pending_zoom_pdf_coords = None
+            self._preview_zoom = None
         except Exception:
             return
 
@@ -852,12 +1089,64 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 pass
             self.update_status(f'Z-Level validation found {len(issues)} inconsistencies')
 
-    def _get_point_by_id(self, pid):
+    @property
+    def points_by_id(self):
+        """id -> point dict for self.user_points (see _id_index)."""
+        return self._id_index('user_points')
+
+    def _add_point(self, point):
+        """Append a point to user_points."""
+        self.user_points.append(point)
+
+    def _id_index(self, name):
+        """Return an id -> dict index for the list attribute `name`.
+
+        The lists are mutated in many places, so rather than maintaining the
+        index everywhere it is kept in a ListSnapshotCache and rebuilt when the
+        list changes.
+        """
+        cache = self._id_indexes.get(name)
+        if cache is None:
+            cache = self._id_indexes[name] = ListSnapshotCache(index_by_id)
+        return cache.get(getattr(self, name, None) or [])
+
+    def _lookup_by_id(self, name, eid):
         try:
-            return next((p for p in self.user_points if p.get('id') == pid), None)
+            item = self._id_index(name).get(eid)
+            if item is not None and item.get('id') == eid:
+                return item
+            # miss or stale entry: fall back to a scan so lookups stay exact
+            return next((x for x in getattr(self, name, []) if x.get('id') == eid), None)
         except Exception:
             return None
 
+    def _canonicalize_project(self):
+        """Give every point, line and curve an explicit 'hidden' flag.
+
+        Older projects may omit it; after this pass (run on load, and by _visible
+        if an entity without the flag turns up) redraws read it without fallbacks.
+        """
+        for items in (self.user_points, self.lines, self.curves):
+            for entity in items:
+                entity.setdefault('hidden', False)
+
+    def _visible(self, items):
+        """Return the entries of items that are not hidden."""
+        try:
+            return [e for e in items if not e['hidden']]
+        except KeyError:
+            self._canonicalize_project()
+            return [e for e in items if not e['hidden']]
+
+    def _get_point_by_id(self, pid):
+        return self._lookup_by_id('user_points', pid)
+
+    def _get_line_by_id(self, lid):
+        return self._lookup_by_id('lines', lid)
+
+    def _get_curve_by_id(self, cid):
+        return self._lookup_by_id('curves', cid)
+
     def editor_line_new_start(self):
         """For selected line(s), create a new start point using start's coords and end's z, then update line start_id."""
         rows = self.lines_tv.selection()
@@ -868,7 +1157,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         for r in rows:
             try:
                 lid = int(self.lines_tv.set(r, 'id'))
-                line = next((l for l in self.lines if l.get('id') == lid), None)
+                line = self._get_line_by_id(lid)
                 if not line:
                     continue
                 s_id = line.get('start_id')
@@ -926,7 +1215,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         for r in rows:
             try:
                 lid = int(self.lines_tv.set(r, 'id'))
-                line = next((l for l in self.lines if l.get('id') == lid), None)
+                line = self._get_line_by_id(lid)
                 if not line:
                     continue
                 s_id = line.get('start_id')
@@ -975,47 +1264,149 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self.update_status(f'Created {changed} new end point(s) and updated lines')
 
     def refresh_editor_lists(self):
+        if self._batch_depth:
+            self._batch_pending['editor'] = True
+            return
+        # The treeviews are only diffed while the Editor tab is showing; when
+        # hidden they are marked stale and caught up by _on_notebook_tab_changed
+        try:
+            visible = self._editor_built and bool(self.points_tv.winfo_ismapped())
+        except Exception:
+            visible = True
+        if visible:
+            self._editor_lists_stale = False
+            self._refresh_editor_trees()
+        else:
+            self._editor_lists_stale = True
+
+        # Update combobox options for point IDs
+        try:
+            ids = [p['id'] for p in self.user_points]
+            self.line_start_cb['values'] = ids
+            self.line_end_cb['values'] = ids
+        except Exception:
+            pass
+        # Ensure UI updates immediately
+        try:
+            self.master.update_idletasks()
+        except Exception:
+            pass
+
+        # Update Lines/Curves counters if present (keep in sync with lists)
+        try:
+            if hasattr(self, 'lines_label') and self.lines_label is not None:
+                try:
+                    self.lines_label.config(text=f"Lines: {len(self.lines)}")
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        try:
+            if hasattr(self, 'curves_label') and self.curves_label is not None:
+                try:
+                    self.curves_label.config(text=f"Curves: {len(self.curves)}")
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+    def _on_notebook_tab_changed(self, event=None):
+        """Build the editor on first use and catch up views skipped while hidden."""
+        try:
+            current = self.notebook.select()
+        except Exception:
+            return
+        try:
+            if current == str(self.editor_frame):
+                if not self._editor_built:
+                    self._editor_built = True
+                    self._build_editor_tab(self.editor_frame)
+                    self._editor_lists_stale = True
+                if self._editor_lists_stale:
+                    self._editor_lists_stale = False
+                    self._refresh_editor_trees()
+                    # combobox choices are filled by refresh_editor_lists, which
+                    # may have run before the widgets existed
+                    ids = [p['id'] for p in self.user_points]
+                    self.line_start_cb['values'] = ids
+                    self.line_end_cb['values'] = ids
+        except Exception:
+            pass
+        try:
+            if self._3d_dirty and current == str(self.view3d_frame):
+                self.update_3d_plot()
+        except Exception:
+            pass
+
+    def _sync_treeview(self, tree, key, rows):
+        """Bring `tree` in line with `rows` [(iid, values, tags), ...].
+
+        Only the difference against the previously shown rows is sent to Tk:
+        new rows are inserted, removed ones deleted and changed ones updated.
+        """
+        shown = self._tv_state.setdefault(key, {})
+        present = tree.get_children('')
+        if len(present) != len(shown) or any(iid not in shown for iid in present):
+            # tree changed behind our back (or first run): start from scratch
+            if present:
+                tree.delete(*present)
+            shown.clear()
+        target = {}
+        for iid, values, tags in rows:
+            target.setdefault(iid, (values, tags))
+        removed = [iid for iid in shown if iid not in target]
+        if removed:
+            tree.delete(*removed)
+            for iid in removed:
+                del shown[iid]
+        for iid, row in target.items():
+            old = shown.get(iid)
+            if old is None:
+                tree.insert('', 'end', iid=iid, values=row[0], tags=row[1])
+            elif old != row:
+                tree.item(iid, values=row[0], tags=row[1])
+            shown[iid] = row
+        order = list(target)
+        if list(tree.get_children('')) != order:
+            tree.set_children('', *order)
+
+    def _refresh_editor_trees(self):
         # Points
         try:
-            # treeview: clear and populate
-            for it in self.points_tv.get_children():
-                self.points_tv.delete(it)
+            # reference counts for every point in one pass over lines and curves
+            ref_counts = {}
+            for l in self.lines:
+                if not l.get('hidden', False):
+                    for pid in {l.get('start_id'), l.get('end_id')}:
+                        ref_counts[pid] = ref_counts.get(pid, 0) + 1
+            for c in self.curves:
+                if not c.get('hidden', False):
+                    arc_ids = set(c.get('arc_point_ids', []))
+                    # start/end only count when not already in arc_point_ids (avoid double-counting)
+                    for pid in arc_ids | ({c.get('start_id'), c.get('end_id')} - arc_ids):
+                        ref_counts[pid] = ref_counts.get(pid, 0) + 1
+            rows = []
             for p in self.user_points:
                 real_x = p.get('real_x', p.get('pdf_x'))
                 real_y = p.get('real_y', p.get('pdf_y'))
                 z_val = p.get('z', 0)
                 coords = f"({real_x}, {real_y})"
                 hidden_mark = '✓' if p.get('hidden', False) else ''
-                # count references from lines and curves
-                try:
-                    pid = p['id']
-                    refs = 0
-                    # Count line references (skip hidden lines)
-                    for l in self.lines:
-                        if not l.get('hidden', False):
-                            if l.get('start_id') == pid or l.get('end_id') == pid:
-                                refs += 1
-                    # Count curve references (skip hidden curves)
-                    for c in self.curves:
-                        if not c.get('hidden', False):
-                            # Count arc point reference
-                            if pid in c.get('arc_point_ids', []):
-                                refs += 1
-                            # Only count start/end if NOT already in arc_point_ids (avoid double-counting)
-                            elif c.get('start_id') == pid or c.get('end_id') == pid:
-                                refs += 1
-                except Exception:
-                    refs = 0
+                refs = ref_counts.get(p['id'], 0)
                 description = p.get('description', '3D Visualisation')
                 tags = ('new',) if p.get('just_duplicated') else ()
-                self.points_tv.insert('', 'end', iid=f"p_{p['id']}", values=(p['id'], coords, real_x, real_y, z_val, refs, description, hidden_mark), tags=tags)
+                rows.append((f"p_{p['id']}", (p['id'], coords, real_x, real_y, z_val, refs, description, hidden_mark), tags))
+            self._sync_treeview(self.points_tv, 'points', rows)
         except Exception:
             pass
 
         # Lines
         try:
-            for it in self.lines_tv.get_children():
-                self.lines_tv.delete(it)
+            pbid = self.points_by_id
+            curves_by_base = {}
+            for c in self.curves:
+                curves_by_base.setdefault(c.get('base_line_id'), []).append(c.get('id'))
+            rows = []
             for l in self.lines:
                 hidden_mark = '✓' if l.get('hidden', False) else ''
                 start = l.get('start_id', '')
@@ -1026,34 +1417,36 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     if 'z' in l:
                         zval = l.get('z')
                     else:
-                        s = next((p for p in self.user_points if p['id'] == start), None)
-                        e = next((p for p in self.user_points if p['id'] == end), None)
+                        s = pbid.get(start)
+                        e = pbid.get(end)
                         if s is not None and e is not None:
                             zval = (float(s.get('z', 0)) + float(e.get('z', 0))) / 2.0
                 except Exception:
                     zval = ''
-                related_curves = [c.get('id') for c in self.curves if c.get('base_line_id') == l.get('id')]
+                related_curves = curves_by_base.get(l.get('id'))
                 curve_display = ','.join(map(str, related_curves)) if related_curves else ''
-                self.lines_tv.insert('', 'end', iid=f"l_{l['id']}", values=(l['id'], start, end, zval, curve_display, hidden_mark))
+                rows.append((f"l_{l['id']}", (l['id'], start, end, zval, curve_display, hidden_mark), ()))
+            self._sync_treeview(self.lines_tv, 'lines', rows)
         except Exception:
             pass
 
         # Curves
         try:
-            for it in self.curves_tv.get_children():
-                self.curves_tv.delete(it)
-
             total_positions = max(2, int(getattr(self, 'curve_interior_points', 4)) + 2)
 
+            # first line joining each endpoint pair, in either direction
+            line_by_ends = {}
+            for l in self.lines:
+                line_by_ends.setdefault((l['start_id'], l['end_id']), l['id'])
+                line_by_ends.setdefault((l['end_id'], l['start_id']), l['id'])
+
+            rows = []
             for c in self.curves:
                 curve_id = c.get('id')
                 zval = c.get('z_level', c.get('z', 0))
                 hidden_mark = '✓' if c.get('hidden', False) else ''
 
-                line_id = next((l['id'] for l in self.lines if
-                                (l['start_id'] == c.get('start_id') and l['end_id'] == c.get('end_id')) or
-                                (l['start_id'] == c.get('end_id') and l['end_id'] == c.get('start_id'))
-                                ), 0)
+                line_id = line_by_ends.get((c.get('start_id'), c.get('end_id')), 0)
                 base_line_id = c.get('base_line_id', line_id)
 
                 ids = list(c.get('arc_point_ids', []))
@@ -1068,12 +1461,9 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     else:
                         pid = ''
 
-                    self.curves_tv.insert(
-                        '',
-                        'end',
-                        iid=f"c_{curve_id}_{position}",
-                        values=(curve_id, position, pid, base_line_id, zval, hidden_mark)
-                    )
+                    rows.append((f"c_{curve_id}_{position}",
+                                 (curve_id, position, pid, base_line_id, zval, hidden_mark), ()))
+            self._sync_treeview(self.curves_tv, 'curves', rows)
         except Exception:
             pass
 
@@ -1085,37 +1475,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         except Exception:
             pass
 
-        # Update combobox options for point IDs
-        try:
-            ids = [p['id'] for p in self.user_points]
-            self.line_start_cb['values'] = ids
-            self.line_end_cb['values'] = ids
-        except Exception:
-            pass
-        # Ensure UI updates immediately
-        try:
-            self.master.update_idletasks()
-        except Exception:
-            pass
-
-        # Update Lines/Curves counters if present (keep in sync with lists)
-        try:
-            if hasattr(self, 'lines_label') and self.lines_label is not None:
-                try:
-                    self.lines_label.config(text=f"Lines: {len(self.lines)}")
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if hasattr(self, 'curves_label') and self.curves_label is not None:
-                try:
-                    self.curves_label.config(text=f"Curves: {len(self.curves)}")
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
     def _treeview_sort(self, tree, column):
         """Sort a Treeview by `column`. Toggles ascending/descending each click."""
         try:
@@ -1213,7 +1572,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             pid = int(values[0])
         except Exception:
             return
-        p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+        p = self._get_point_by_id(pid)
         if p is None:
             return
         self.point_id_var.set(str(p['id']))
@@ -1232,7 +1591,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             pid = int(self.point_id_var.get())
         except Exception:
             return
-        p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+        p = self._get_point_by_id(pid)
         if p is None:
             return
         try:
@@ -1267,7 +1626,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             lid = int(values[0])
         except Exception:
             return
-        l = next((ll for ll in self.lines if ll['id'] == lid), None)
+        l = self._get_line_by_id(lid)
         if l is None:
             return
         self.line_id_var.set(str(l['id']))
@@ -1285,7 +1644,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             lid = int(self.line_id_var.get())
         except Exception:
             return
-        l = next((ll for ll in self.lines if ll['id'] == lid), None)
+        l = self._get_line_by_id(lid)
         if l is None:
             return
         try:
@@ -1315,7 +1674,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             cid = int(values[0])
         except Exception:
             return
-        c = next((cc for cc in self.curves if cc['id'] == cid), None)
+        c = self._get_curve_by_id(cid)
         if c is None:
             return
         self.curve_id_var.set(str(c['id']))
@@ -1437,7 +1796,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         try:
             if tree is self.points_tv:
                 pid = int(tree.item(iid, 'values')[0])
-                p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+                p = self._get_point_by_id(pid)
                 if p is None:
                     return
                 if key == 'coords':
@@ -1528,7 +1887,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     pass
             elif tree is self.lines_tv:
                 lid = int(tree.item(iid, 'values')[0])
-                l = next((ll for ll in self.lines if ll['id'] == lid), None)
+                l = self._get_line_by_id(lid)
                 if l is None:
                     return
                 if key == 'from':
@@ -1558,7 +1917,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     id_map = {}
                     for pid in (start_id, end_id):
                         try:
-                            p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+                            p = self._get_point_by_id(pid)
                             if p is None:
                                 continue
                             cur_z = float(p.get('z', 0))
@@ -1613,7 +1972,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     pass
             elif tree is self.curves_tv:
                 cid = int(tree.item(iid, 'values')[0])
-                c = next((cc for cc in self.curves if cc['id'] == cid), None)
+                c = self._get_curve_by_id(cid)
                 if c is None:
                     return
                 if key == 'z':
@@ -1627,7 +1986,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                         ids = c.get('arc_point_ids', [])
                         differing = []
                         for pid in ids:
-                            p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+                            p = self._get_point_by_id(pid)
                             if p and float(p.get('z', 0)) != new_z:
                                 differing.append(p)
                     except Exception:
@@ -1743,7 +2102,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 return
             
             # Find point details
-            point = next((p for p in self.user_points if p['id'] == src_id), None)
+            point = self._get_point_by_id(src_id)
             if not point:
                 messagebox.showerror('Error', f'Point {src_id} not found.')
                 return
@@ -2148,8 +2507,8 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 return
 
             # validate points exist
-            s = next((p for p in self.user_points if p['id'] == start_id), None)
-            e = next((p for p in self.user_points if p['id'] == end_id), None)
+            s = self._get_point_by_id(start_id)
+            e = self._get_point_by_id(end_id)
             if s is None or e is None:
                 messagebox.showerror('Invalid ID', 'One or both point IDs do not exist.')
                 return
@@ -2197,14 +2556,13 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             if not sel:
                 messagebox.showwarning('No Selection', 'Select one or more points to duplicate.')
                 return
-            from tkinter import simpledialog
             new_ids = []
             for iid in sel:
                 try:
                     src_id = int(self.points_tv.item(iid, 'values')[0])
                 except Exception:
                     continue
-                src = next((p for p in self.user_points if p['id'] == src_id), None)
+                src = self._get_point_by_id(src_id)
                 if src is None:
                     continue
                 # create duplicate with same Z initially; user can edit Z afterwards via editor
@@ -2326,7 +2684,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             for item in self.points_tv.selection():
                 try:
                     pid = int(self.points_tv.item(item, 'values')[0])
-                    p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+                    p = self._get_point_by_id(pid)
                     if p is not None:
                         p['hidden'] = not bool(p.get('hidden', False))
                         changed = True
@@ -2339,7 +2697,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             for item in self.lines_tv.selection():
                 try:
                     lid = int(self.lines_tv.item(item, 'values')[0])
-                    l = next((ll for ll in self.lines if ll['id'] == lid), None)
+                    l = self._get_line_by_id(lid)
                     if l is not None:
                         l['hidden'] = not bool(l.get('hidden', False))
                         changed = True
@@ -2352,7 +2710,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             for item in self.curves_tv.selection():
                 try:
                     cid = int(self.curves_tv.item(item, 'values')[0])
-                    c = next((cc for cc in self.curves if cc['id'] == cid), None)
+                    c = self._get_curve_by_id(cid)
                     if c is not None:
                         c['hidden'] = not bool(c.get('hidden', False))
                         changed = True
@@ -2384,7 +2742,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             cid = int(self.curve_id_var.get())
         except Exception:
             return
-        c = next((cc for cc in self.curves if cc['id'] == cid), None)
+        c = self._get_curve_by_id(cid)
         if c is None:
             return
         try:
@@ -2411,7 +2769,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     pid = int(self.points_tv.item(item, 'values')[0])
                 except Exception:
                     continue
-                p = next((pp for pp in self.user_points if pp['id'] == pid), None)
+                p = self._get_point_by_id(pid)
                 if p is None:
                     continue
                 try:
@@ -2429,7 +2787,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     lid = int(self.lines_tv.item(item, 'values')[0])
                 except Exception:
                     continue
-                l = next((ll for ll in self.lines if ll['id'] == lid), None)
+                l = self._get_line_by_id(lid)
                 if l is None:
                     continue
                 try:
@@ -2447,7 +2805,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     cid = int(self.curves_tv.item(item, 'values')[0])
                 except Exception:
                     continue
-                c = next((cc for cc in self.curves if cc['id'] == cid), None)
+                c = self._get_curve_by_id(cid)
                 if c is None:
                     continue
                 try:
@@ -2471,6 +2829,24 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
     # note: clearing of 'just_duplicated' is handled when the user makes an edit
 
     def update_3d_plot(self):
+        if self._batch_depth:
+            self._batch_pending['3d'] = True
+            return
+        # Matplotlib redraws are only worth doing while the 3D tab is showing
+        try:
+            visible = self.notebook.select() == str(self.view3d_frame)
+        except Exception:
+            visible = True
+        if not visible:
+            self._3d_dirty = True
+            # the PyVista window is separate from the notebook, keep it current
+            try:
+                self.update_pyvista_plot()
+            except Exception:
+                pass
+            return
+        self._3d_dirty = False
+
         # Initialize if needed
         if not self._3d_initialized:
             self._init_3d_canvas()
@@ -2478,52 +2854,63 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 return
 
         ax = self._3d_ax
-        ax.cla()
-
-        # Apply theme
-        if self._3d_theme == 'dark':
-            ax.set_facecolor('#222222')
-            self._3d_fig.patch.set_facecolor('#222222')
-        else:
-            ax.set_facecolor('white')
-            self._3d_fig.patch.set_facecolor('white')
-
-        # Prepare accumulators for autoscaling and plotting
-        all_x = []
-        all_y = []
-        all_z = []
+        # The axes and its data artists persist between updates and only get new
+        # data; they are cleared and rebuilt on the first call and on style changes.
+        # The theme is not part of the style, set_3d_theme recolours in place
+        style = (self._3d_point_size, self._3d_point_color, self._3d_line_color,
+                 self._3d_curve_color, self._3d_highlight_color)
+        artists = self._3d_plot_artists
+        if artists is None or style != self._3d_plot_style:
+            ax.cla()
+            self._apply_3d_theme()
+            artists = self._build_3d_artists(ax)
+            self._3d_plot_artists = artists
+            self._3d_plot_style = style
+            self._3d_label_artists = []
+        # Id labels are recreated on every update
+        for text in self._3d_label_artists:
+            try:
+                text.remove()
+            except Exception:
+                pass
+        labels = []
+        self._3d_label_artists = labels
+        self._3d_bg = None
+        empty = np.empty(0)
+
+        # (k, 3) coordinate blocks of everything plotted; reduced once for autoscaling
+        extents = []
+        # (coords, ids) candidate id labels, point labels first so they win over line labels
+        label_sets = []
         point_lookup = {p.get('id'): p for p in self.user_points if p.get('id') is not None}
         highlight_info = getattr(self, '_line_audit_highlights', None) or {}
         highlight_line_ids = set(highlight_info.get('lines', set()))
         highlight_curve_ids = set(highlight_info.get('curves', set()))
         highlight_endpoints = set(highlight_info.get('endpoints', set()))
 
-        # Plot points (mirror along Y by negating Y coordinates)
-        pts = [p for p in self.user_points if not p.get('hidden', False)]
-        xs = [p.get('real_x', p.get('pdf_x')) for p in pts]
-        ys = [-(p.get('real_y', p.get('pdf_y'))) for p in pts]
-        zs = [float(p.get('z', 0)) for p in pts]
-        if xs and ys and zs:
-            ax.scatter(xs, ys, zs, c=self._3d_point_color, s=self._3d_point_size)
-            # Add labels for each visible point (ID) near the point marker
-            try:
-                for p in pts:
-                    px = p.get('real_x', p.get('pdf_x'))
-                    py = -(p.get('real_y', p.get('pdf_y')))
-                    pz = float(p.get('z', 0))
-                    pid = p.get('id')
-                    if pid is not None:
-                        ax.text(px, py, pz + 0.01, str(pid), color='white' if self._3d_theme == 'dark' else 'black', fontsize=8)
-                    all_x.append(px)
-                    all_y.append(py)
-                    all_z.append(pz)
-            except Exception:
-                pass
-        
-        # Also update PyVista plot if initialized
-        self.update_pyvista_plot()
+        # Plot points (mirror along Y by negating Y coordinates); the coordinates come
+        # from the point table as whole columns rather than per-dict lookups
+        table = self.point_table()
+        # (N, 3) plot coordinates for every point, hidden ones included since lines
+        # may still reference them; missing values fall back to 0 as before
+        xyz = np.column_stack((
+            np.nan_to_num(np.where(np.isnan(table['real_x']), table['pdf_x'], table['real_x'])),
+            -np.nan_to_num(np.where(np.isnan(table['real_y']), table['pdf_y'], table['real_y'])),
+            np.nan_to_num(table['z'], nan=0.0)))
+        shown = ~table['hidden']
+        pt_x, pt_y, pt_z = xyz[shown].T
+        show_labels = self._3d_show_labels
+        label_color = 'white' if self._3d_theme == 'dark' else 'black'
+        artists['points']._offsets3d = (pt_x, pt_y, pt_z)
+        if pt_x.size:
+            extents.append(xyz[shown])
+            # Label each visible point (ID) near the point marker; the Text artists are
+            # created after autoscaling so crowded labels can be culled on screen
+            if show_labels:
+                label_sets.append((xyz[shown] + (0.0, 0.0, 0.01), table['id'][shown].tolist()))
 
         # Overlay highlighted endpoints (if any)
+        artists['endpoints']._offsets3d = (empty, empty, empty)
         if highlight_endpoints:
             hx = []
             hy = []
@@ -2538,16 +2925,12 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 hx.append(px)
                 hy.append(py)
                 hz.append(pz)
-                all_x.append(px)
-                all_y.append(py)
-                all_z.append(pz)
             if hx and hy and hz:
-                try:
-                    ax.scatter(hx, hy, hz, c=self._3d_highlight_color, s=self._3d_point_size * 1.6, depthshade=False)
-                except Exception:
-                    pass
+                extents.append(np.column_stack((hx, hy, hz)))
+                artists['endpoints']._offsets3d = (np.array(hx), np.array(hy), np.array(hz))
 
         # Highlight selected point (if any)
+        artists['selected']._offsets3d = (empty, empty, empty)
         if self._3d_selected_point_id:
             selected_point = point_lookup.get(self._3d_selected_point_id)
             if selected_point and not selected_point.get('hidden', False):
@@ -2556,69 +2939,66 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 sz = float(selected_point.get('z', 0))
                 try:
                     # Draw selection highlight with distinctive color and size
-                    ax.scatter([sx], [sy], [sz], c='#00ff00', s=self._3d_point_size * 2.0, 
-                              marker='o', edgecolors='black', linewidths=2, depthshade=False, zorder=1000)
+                    artists['selected']._offsets3d = (np.array([sx]), np.array([sy]), np.array([sz]))
                     # Add text annotation
-                    label_color = 'white' if self._3d_theme == 'dark' else 'black'
-                    ax.text(sx, sy, sz + 0.02, f"Selected: {self._3d_selected_point_id}", 
-                           color=label_color, fontsize=10, weight='bold')
+                    labels.append(ax.text(sx, sy, sz + 0.02, f"Selected: {self._3d_selected_point_id}", 
+                                          color=label_color, fontsize=10, weight='bold'))
                 except Exception:
                     pass
 
-        # Plot lines (use safe lookups so missing keys don't abort the entire 3D update)
-        for line in self.lines:
-            try:
-                # Skip lines flagged hidden
-                if line.get('hidden', False):
-                    continue
-                start = next(p for p in self.user_points if p['id'] == line['start_id'])
-                end = next(p for p in self.user_points if p['id'] == line['end_id'])
-                # Safe coordinate extraction with fallbacks
-                sx = start.get('real_x', start.get('pdf_x', 0.0))
-                sy = -(start.get('real_y', start.get('pdf_y', 0.0)))
-                sz = float(start.get('z', 0.0))
-
-                ex = end.get('real_x', end.get('pdf_x', 0.0))
-                ey = -(end.get('real_y', end.get('pdf_y', 0.0)))
-                ez = float(end.get('z', 0.0))
-                highlighted = line.get('id') in highlight_line_ids if line.get('id') is not None else False
-                line_color = self._3d_highlight_color if highlighted else self._3d_line_color
-                line_width = 6 if highlighted else 2
-
-                ax.plot([sx, ex], [sy, ey], [sz, ez], c=line_color, linewidth=line_width)
-
-                # Add a label at the midpoint of the line
-                try:
-                    mid_x = (sx + ex) / 2.0
-                    mid_y = (sy + ey) / 2.0
-                    mid_z = (sz + ez) / 2.0
-                    label_color = 'white' if self._3d_theme == 'dark' else 'black'
-                    lid = line.get('id')
-                    if lid is not None:
-                        ax.text(mid_x, mid_y, mid_z + 0.01, str(lid), color=label_color, fontsize=8)
-                except Exception:
-                    pass
-                # include endpoints in autoscale
-                all_x.extend([sx, ex])
-                all_y.extend([sy, ey])
-                all_z.extend([sz, ez])
-            except Exception:
-                # If anything goes wrong for this line, skip it but continue plotting others
+        # Lines and curves are gathered as segments and drawn as one collection per
+        # style below, instead of one Line3D artist per entity
+        line_segs, hl_line_segs = [], []
+        curve_segs, hl_curve_segs = [], []
+
+        # Plot lines: collect endpoint rows into the point table in one pass, then
+        # build all (n, 2, 3) segment arrays with a single fancy-index
+        row_of = {pid: i for i, pid in enumerate(table['id'].tolist())}
+        starts, ends, highlighted, line_ids = [], [], [], []
+        for line in self._visible(self.lines):
+            # Skip lines referencing missing points
+            s_row = row_of.get(line.get('start_id'))
+            e_row = row_of.get(line.get('end_id'))
+            if s_row is None or e_row is None:
                 continue
+            starts.append(s_row)
+            ends.append(e_row)
+            lid = line.get('id')
+            highlighted.append(lid is not None and lid in highlight_line_ids)
+            line_ids.append(lid)
+        if starts:
+            segs = np.stack((xyz[starts], xyz[ends]), axis=1)
+            hl_mask = np.array(highlighted, dtype=bool)
+            line_segs = segs[~hl_mask]
+            hl_line_segs = segs[hl_mask]
+            # include endpoints in autoscale
+            extents.append(segs.reshape(-1, 3))
+            # Add a label at the midpoint of each line
+            if show_labels:
+                has_id = np.array([lid is not None for lid in line_ids], dtype=bool)
+                mids = segs[has_id].mean(axis=1) + (0.0, 0.0, 0.01)
+                label_sets.append((mids, [lid for lid in line_ids if lid is not None]))
 
         # Plot curves
-        for curve in self.curves:
-            # Skip curves flagged hidden
-            if curve.get('hidden', False):
-                continue
-
-            pts = []
-            if curve.get('arc_points_real'):
-                arc = curve['arc_points_real']
-                # If arc entries already include Z values, use them
-                if all(len(t) > 2 for t in arc):
-                    pts = [(t[0], t[1], float(t[2])) for t in arc]
+        curve_cache = self._3d_curve_cache
+        live_curve_ids = set()
+        for curve in self._visible(self.curves):
+            cid = curve.get('id')
+            arc = curve.get('arc_points_real')
+            verts = None
+            if arc and all(len(t) > 2 for t in arc):
+                # Arc entries already include Z values; these do not depend on any
+                # point, so the converted array is reused until the arc list changes
+                live_curve_ids.add(cid)
+                cached = curve_cache.get(cid)
+                if cached is not None and cached[0] is arc and cached[1] == len(arc):
+                    verts = cached[2]
                 else:
+                    verts = np.array([(t[0], -(t[1]), float(t[2])) for t in arc], dtype=float)
+                    curve_cache[cid] = (arc, len(arc), verts)
+            else:
+                pts = []
+                if arc:
                     # Fall back: try to map each arc entry to the corresponding arc_point_id to fetch Z
                     ids = curve.get('arc_point_ids', [])
                     for i, t in enumerate(arc):
@@ -2627,51 +3007,63 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                         z = None
                         if i < len(ids):
                             pid = ids[i]
-                            p = next((u for u in self.user_points if u['id'] == pid), None)
+                            p = self._get_point_by_id(pid)
                             if p:
                                 z = float(p.get('z', 0))
                         if z is None:
                             z = float(curve.get('z_level', curve.get('z', 0)))
                         pts.append((x, y, z))
-            else:
-                for pid in curve.get('arc_point_ids', []):
-                    p = next((u for u in self.user_points if u['id'] == pid), None)
-                    if p:
-                        pts.append((p.get('real_x', p.get('pdf_x')), p.get('real_y', p.get('pdf_y')), float(p.get('z', 0))))
-
-            if not pts:
+                else:
+                    for pid in curve.get('arc_point_ids', []):
+                        p = self._get_point_by_id(pid)
+                        if p:
+                            pts.append((p.get('real_x', p.get('pdf_x')), p.get('real_y', p.get('pdf_y')), float(p.get('z', 0))))
+                if pts:
+                    verts = np.array([(t[0], -(t[1]), t[2]) for t in pts], dtype=float)
+
+            if verts is None or not len(verts):
                 continue
 
-            xs = [t[0] for t in pts]
-            ys = [-(t[1]) for t in pts]
-            zs = [t[2] for t in pts]
-            highlighted = curve.get('id') in highlight_curve_ids if curve.get('id') is not None else False
-            curve_color = self._3d_highlight_color if highlighted else self._3d_curve_color
-            curve_width = 6 if highlighted else 2
-            ax.plot(xs, ys, zs, c=curve_color, linewidth=curve_width)
-            all_x.extend(xs)
-            all_y.extend(ys)
-            all_z.extend(zs)
+            highlighted = cid in highlight_curve_ids if cid is not None else False
+            (hl_curve_segs if highlighted else curve_segs).append(verts)
+            extents.append(verts)
+        # drop entries of curves that were deleted, hidden or lost their Z values
+        for cid in list(curve_cache):
+            if cid not in live_curve_ids:
+                del curve_cache[cid]
+
+        for name, segs in (('lines', line_segs), ('hl_lines', hl_line_segs),
+                           ('curves', curve_segs), ('hl_curves', hl_curve_segs)):
+            try:
+                artists[name].set_segments(segs)
+            except Exception:
+                pass
         # Autoscale axes to include all plotted items with padding to avoid clipping
         try:
-            if all_x and all_y and all_z:
-                xmin, xmax = min(all_x), max(all_x)
-                ymin, ymax = min(all_y), max(all_y)
-                zmin, zmax = min(all_z), max(all_z)
+            if extents:
+                bounds = np.ascontiguousarray(np.concatenate(extents), dtype=np.float64)
                 # add small padding (8%) or minimal epsilon
-                def pad(a, b):
-                    rng = b - a
-                    padv = max(1e-6, rng * 0.08)
-                    return a - padv, b + padv
-
-                nx0, nx1 = pad(xmin, xmax)
-                ny0, ny1 = pad(ymin, ymax)
-                nz0, nz1 = pad(zmin, zmax)
+                lo, hi = padded_bounds(bounds, 0.08, 1e-6)
+                (nx0, ny0, nz0), (nx1, ny1, nz1) = lo.tolist(), hi.tolist()
                 ax.set_xlim3d(nx0, nx1)
                 ax.set_ylim3d(ny0, ny1)
                 ax.set_zlim3d(nz0, nz1)
         except Exception:
             pass
+        # Id labels, thinned to the configured screen density now that the limits are final
+        try:
+            taken = {}
+            for coords, ids in label_sets:
+                keep = self._thin_3d_labels(ax, coords, taken)
+                for (lx, ly, lz), lid in zip(coords[keep].tolist(), [ids[i] for i in keep.tolist()]):
+                    labels.append(ax.text(lx, ly, lz, str(lid), color=label_color, fontsize=8))
+        except Exception:
+            pass
+        # Data artists are animated so wheel zoom can blit them (see _redraw_3d_zoomed);
+        # _on_3d_draw_event paints them after every full draw
+        for text in labels:
+            text.set_animated(True)
+        self._3d_artists = list(artists.values()) + labels
         # Ensure the Matplotlib canvas redraws so visibility changes appear immediately
         try:
             if hasattr(self, '_3d_canvas') and self._3d_canvas is not None:
@@ -2689,15 +3081,79 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         try:
             if hasattr(self, 'update_pyvista_plot'):
                 self.update_pyvista_plot()
-        except Exception as e:
+        except Exception:
             pass
-        
-        # Also update PyVista view if available
+    def _thin_3d_labels(self, ax, coords, taken):
+        """Return the indices of the (k, 3) label positions in coords to draw.
+
+        Positions are projected to display pixels and accepted greedily, skipping any
+        that fall within self._3d_label_density pixels of a label already accepted.
+        taken maps coarse grid cells to accepted pixel positions and is shared across
+        calls so later label sets yield to earlier ones.
+        """
+        k = len(coords)
+        spacing = float(self._3d_label_density or 0)
+        if spacing <= 0 or k == 0:
+            return np.arange(k)
         try:
-            if hasattr(self, 'update_pyvista_plot'):
-                self.update_pyvista_plot()
+            proj = np.column_stack((coords, np.ones(k))) @ ax.get_proj().T
+            screen = ax.transData.transform(proj[:, :2] / proj[:, 3:4])
         except Exception:
-            pass
+            return np.arange(k)
+        cells = np.floor(screen / spacing).astype(np.int64).tolist()
+        min_d2 = spacing * spacing
+        keep = []
+        for i, ((sx, sy), (cx, cy)) in enumerate(zip(screen.tolist(), cells)):
+            crowded = False
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    for ox, oy in taken.get((gx, gy), ()):
+                        if (sx - ox) ** 2 + (sy - oy) ** 2 < min_d2:
+                            crowded = True
+                            break
+                    if crowded:
+                        break
+                if crowded:
+                    break
+            if not crowded:
+                taken.setdefault((cx, cy), []).append((sx, sy))
+                keep.append(i)
+        return np.array(keep, dtype=np.intp)
+
+    def _apply_3d_theme(self):
+        """Colour the 3D axes, figure and id labels for the current theme without touching data."""
+        dark = self._3d_theme == 'dark'
+        face = '#222222' if dark else 'white'
+        self._3d_ax.set_facecolor(face)
+        self._3d_fig.patch.set_facecolor(face)
+        label_color = 'white' if dark else 'black'
+        for text in self._3d_label_artists:
+            try:
+                text.set_color(label_color)
+            except Exception:
+                pass
+
+    def _build_3d_artists(self, ax):
+        """Create the (empty) persistent data artists of the 3D plot on a cleared axes."""
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        size = self._3d_point_size
+        artists = {
+            'points': ax.scatter([], [], [], c=self._3d_point_color, s=size),
+            'endpoints': ax.scatter([], [], [], c=self._3d_highlight_color, s=size * 1.6, depthshade=False),
+            'selected': ax.scatter([], [], [], c='#00ff00', s=size * 2.0, marker='o',
+                                   edgecolors='black', linewidths=2, depthshade=False, zorder=1000),
+        }
+        for name, color, width in (('lines', self._3d_line_color, 2),
+                                   ('hl_lines', self._3d_highlight_color, 6),
+                                   ('curves', self._3d_curve_color, 2),
+                                   ('hl_curves', self._3d_highlight_color, 6)):
+            coll = Line3DCollection([], colors=color, linewidths=width)
+            ax.add_collection3d(coll)
+            artists[name] = coll
+        for artist in artists.values():
+            artist.set_animated(True)
+        return artists
+
     def increase_point_size(self):
         self._3d_point_size = min(200, int(self._3d_point_size * 1.25) + 1)
         self.update_3d_plot()
@@ -2711,7 +3167,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         try:
             if not getattr(self, '_3d_initialized', False):
                 return
-            ax = self._3d_ax
             # Determine wheel direction; Windows uses event.delta, X11 uses Button-4/5
             factor = 1.0
             if hasattr(event, 'delta'):
@@ -2723,7 +3178,26 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     factor = 1.1 if int(getattr(event, 'num', 0)) == 4 else 0.9
                 except Exception:
                     factor = 1.0
+            self._queue_3d_zoom(factor)
+        except Exception:
+            pass
 
+    def _queue_3d_zoom(self, factor):
+        """Accumulate a wheel zoom factor; all ticks seen before Tk goes idle share one redraw."""
+        self._3d_pending_factor *= factor
+        if not self._3d_redraw_scheduled:
+            self._3d_redraw_scheduled = True
+            self.master.after_idle(self._flush_3d_zoom)
+
+    def _flush_3d_zoom(self):
+        """Apply the accumulated wheel zoom to the 3D axis limits and redraw once."""
+        factor = self._3d_pending_factor
+        self._3d_pending_factor = 1.0
+        self._3d_redraw_scheduled = False
+        if factor == 1.0:
+            return
+        try:
+            ax = self._3d_ax
             # Current limits
             try:
                 x0, x1 = ax.get_xlim3d()
@@ -2747,14 +3221,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             ax.set_ylim3d(ny0, ny1)
             ax.set_zlim3d(nz0, nz1)
 
-            try:
-                # Use draw_idle to be more responsive
-                self._3d_canvas.draw_idle()
-            except Exception:
-                try:
-                    self._3d_canvas.draw()
-                except Exception:
-                    pass
+            self._redraw_3d_zoomed()
         except Exception:
             pass
 
@@ -2874,37 +3341,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     step = 1 if getattr(event, 'guiEvent', None) is None else 0
 
             factor = 1.1 if step > 0 else 0.9
-
-            ax = self._3d_ax
-            try:
-                x0, x1 = ax.get_xlim3d()
-                y0, y1 = ax.get_ylim3d()
-                z0, z1 = ax.get_zlim3d()
-            except Exception:
-                return
-
-            cx = 0.5 * (x0 + x1)
-            cy = 0.5 * (y0 + y1)
-            cz = 0.5 * (z0 + z1)
-
-            nx0 = cx + (x0 - cx) * (1.0 / factor)
-            nx1 = cx + (x1 - cx) * (1.0 / factor)
-            ny0 = cy + (y0 - cy) * (1.0 / factor)
-            ny1 = cy + (y1 - cy) * (1.0 / factor)
-            nz0 = cz + (z0 - cz) * (1.0 / factor)
-            nz1 = cz + (z1 - cz) * (1.0 / factor)
-
-            ax.set_xlim3d(nx0, nx1)
-            ax.set_ylim3d(ny0, ny1)
-            ax.set_zlim3d(nz0, nz1)
-
-            try:
-                self._3d_canvas.draw_idle()
-            except Exception:
-                try:
-                    self._3d_canvas.draw()
-                except Exception:
-                    pass
+            self._queue_3d_zoom(factor)
         except Exception:
             pass
 
@@ -2928,7 +3365,17 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 cb.set(theme_name)
         except Exception:
             pass
-        self.update_3d_plot()
+        # Only colours change; recolour the live axes and artists instead of
+        # rebuilding the plot (update_3d_plot applies the theme when it does rebuild)
+        if not self._3d_initialized or self._3d_plot_artists is None:
+            self.update_3d_plot()
+            return
+        try:
+            self._apply_3d_theme()
+            self._3d_bg = None
+            self._3d_canvas.draw_idle()
+        except Exception:
+            self.update_3d_plot()
 
     def toggle_3d_grid(self):
         try:
@@ -2938,14 +3385,35 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self._3d_show_grid = not self._3d_show_grid
         self.update_3d_plot()
 
+    def toggle_3d_labels(self):
+        try:
+            var = self._3d_toolbar_vars.get('labels_var')
+            self._3d_show_labels = bool(var.get())
+        except Exception:
+            self._3d_show_labels = not self._3d_show_labels
+        self.update_3d_plot()
+
     def load_config(self):
+        config = None
         if os.path.exists(self.config_file):
-            self.config.read(self.config_file)
-        else:
-            self.config['General'] = {}
-            self.config['View'] = {}
-            self.config['Calibration'] = {}
-            self.config['Points'] = {}
+            try:
+                config = _read_config_cached(self.config_file)
+            except Exception:
+                config = None
+        elif os.path.exists('config.ini'):
+            # one-time migration from the old INI config
+            try:
+                import configparser
+                parser = configparser.ConfigParser()
+                parser.read('config.ini')
+                config = {name: dict(parser[name]) for name in parser.sections()}
+            except Exception:
+                config = None
+        if not isinstance(config, dict):
+            config = {}
+        for section in ('General', 'View', 'Calibration', 'Points'):
+            config.setdefault(section, {})
+        self.config = config
 
     def open_display_options(self):
         """Open a separate Options window to edit display colors and sizes."""
@@ -2956,7 +3424,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             dlg.title('Display Options')
             dlg.grab_set()
 
-            from tkinter import colorchooser
 
             def choose_point_color():
                 c = colorchooser.askcolor(title='Choose point color', color=self.point_color_2d)
@@ -3067,14 +3534,70 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             return
 
     def save_config(self):
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
+        dump_json(self.config, self.config_file, indent=4)
         self.update_status("Configuration saved")
 
     def update_status(self, message):
+        if self._batch_depth:
+            self._batch_pending['status'] = message
+            return
         self.status_label.config(text=message)
         self.master.update_idletasks()
 
+    def _schedule_redraw(self, status=None):
+        """Redraw markers, the points label and (optionally) the status once Tk is idle.
+
+        Several edits before the event loop drains share one redraw; the last
+        status message wins.
+        """
+        if status is not None:
+            self._redraw_status = status
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        try:
+            self.master.after_idle(self._flush_redraw)
+        except Exception:
+            self._flush_redraw()
+
+    def _flush_redraw(self):
+        if not self._redraw_pending:
+            return
+        self._redraw_pending = False
+        status, self._redraw_status = self._redraw_status, None
+        self.redraw_markers()
+        self.update_points_label()
+        if status is not None:
+            self.update_status(status)
+
+    @contextmanager
+    def _batch_updates(self):
+        """Defer marker redraws, editor lists, the 3D plot, the points label and
+        status updates until the block exits.
+
+        Nested blocks are allowed; everything requested inside is applied once
+        when the outermost block finishes.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._batch_pending = self._batch_pending, {}
+                if pending.get('redraw'):
+                    # also refreshes the editor lists and the 3D plot
+                    self.redraw_markers()
+                else:
+                    if pending.get('editor'):
+                        self.refresh_editor_lists()
+                    if pending.get('3d'):
+                        self.update_3d_plot()
+                if pending.get('points_label'):
+                    self.update_points_label()
+                if 'status' in pending:
+                    self.update_status(pending['status'])
+
     def _update_pdf_fade(self):
         """Update the PDF fade overlay based on slider value without re-rendering the page."""
         try:
@@ -3121,7 +3644,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         if file_path:
             try:
                 self.close_file()
-                self.pdf_doc = fitz.open(file_path)
+                self.pdf_doc = _import_fitz().open(file_path)
                 self.current_page = 0
                 self.total_pages = len(self.pdf_doc)
                 self.zoom_level = 1.0
@@ -3136,6 +3659,11 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         if self.pdf_doc:
             self.pdf_doc.close()
             self.pdf_doc = None
+            self._pix_cache.clear()
+            self._pix_cache_bytes = 0
+            self._tile_cache.clear()
+            self._tile_cache_bytes = 0
+            self._cancel_render()
             self.current_page = 0
             self.total_pages = 0
             self.canvas.delete("all")
@@ -3143,83 +3671,370 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self.calibration_markers.clear()
             self.update_status("PDF closed")
 
-    def display_page(self):
+    def _render_page_image(self, page_index, zoom, clip_px=None):
+        """Render a page at the given zoom, reusing cached renders where possible.
+
+        clip_px is an optional (x0, y0, x1, y1) region in canvas pixels; when given
+        only that part of the page is rasterized.
+        Returns a (PIL image, PhotoImage) tuple.
+        """
+        key = (page_index, round(zoom, 3), clip_px)
+        cached = self._pix_cache.get(key)
+        if cached is not None:
+            self._pix_cache.move_to_end(key)
+            return cached[:2]
+        _import_pil()
+        if clip_px is not None:
+            pil_img = self._compose_tiles(page_index, zoom, clip_px)
+        else:
+            pil_img = self._rasterize(self.pdf_doc, page_index, zoom)
+        return self._cache_page_image(key, pil_img)
+
+    @staticmethod
+    def _rasterize(doc, page_index, zoom, rect_px=None):
+        """Rasterize a page (or the canvas-pixel rect of it) to a PIL image."""
+        clip = None
+        if rect_px is not None:
+            x0, y0, x1, y1 = rect_px
+            clip = fitz.Rect(x0 / zoom, y0 / zoom, x1 / zoom, y1 / zoom)
+        pix = doc[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip, alpha=False)
+        # wrap the raw RGB samples directly instead of round-tripping through PPM
+        return Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", pix.stride, 1)
+
+    def _cache_page_image(self, key, pil_img):
+        """Wrap pil_img in a PhotoImage, add it to the page cache and return both."""
+        photo = ImageTk.PhotoImage(pil_img)
+        # Tk keeps 4 bytes per pixel for the PhotoImage and the PIL image one
+        # byte per band; the size is stored so eviction subtracts what was added
+        pixels = pil_img.width * pil_img.height
+        nbytes = pixels * (4 + len(pil_img.getbands()))
+        self._pix_cache[key] = (pil_img, photo, nbytes)
+        self._pix_cache_bytes += nbytes
+        # evict least recently used renders, but never the one just made
+        while len(self._pix_cache) > 1 and (len(self._pix_cache) > self._pix_cache_max
+                                            or self._pix_cache_bytes > self._pix_cache_budget):
+            _, (_, _, old_bytes) = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= old_bytes
+        return pil_img, photo
+
+    def _render_tile(self, page_index, zoom, rect_px):
+        """Render one tile (x0, y0, x1, y1 in canvas pixels) as a PIL image, cached."""
+        key = (page_index, round(zoom, 3), rect_px)
+        img = self._tile_cache.get(key)
+        if img is not None:
+            self._tile_cache.move_to_end(key)
+            return img
+        img = self._rasterize(self.pdf_doc, page_index, zoom, rect_px)
+        self._cache_tile(key, img)
+        return img
+
+    def _cache_tile(self, key, img):
+        self._tile_cache[key] = img
+        self._tile_cache_bytes += img.width * img.height * 3
+        while len(self._tile_cache) > 1 and self._tile_cache_bytes > self._tile_cache_budget:
+            _, old = self._tile_cache.popitem(last=False)
+            self._tile_cache_bytes -= old.width * old.height * 3
+        return img
+
+    def _compose_tiles(self, page_index, zoom, clip_px):
+        """Assemble a tile-aligned clip region from (cached) tiles into one image."""
+        x0, y0, x1, y1 = clip_px
+        img = Image.new("RGB", (x1 - x0, y1 - y0), "white")
+        for rect in self._tile_rects(clip_px):
+            img.paste(self._render_tile(page_index, zoom, rect), (rect[0] - x0, rect[1] - y0))
+        return img
+
+    def _tile_rects(self, clip_px):
+        """Tile rects (x0, y0, x1, y1) covering a tile-aligned clip region, row by row."""
+        x0, y0, x1, y1 = clip_px
+        tile = self._tile_px
+        return [(tx, ty, min(tx + tile, x1), min(ty + tile, y1))
+                for ty in range(y0, y1, tile) for tx in range(x0, x1, tile)]
+
+    def _request_render(self):
+        """Bring the page image up to date for the current view without blocking.
+
+        Cached renders, and clips whose tiles are all cached, are shown at once.
+        Otherwise the missing tiles are rasterized one per Tk after() step by
+        _render_step while the current image stays on screen, and the result is
+        shown once the last one is done. An unclipped page is split into tiles the
+        same way and assembled into one page image at the end.
+        """
         if not self.pdf_doc:
             return
+        if self._render_job_id is not None:
+            # one job at a time; the view is looked at again when it finishes
+            return
+        page_index, zoom = self.current_page, self.zoom_level
+        zkey = round(zoom, 3)
+        clip_px = self._render_clip_for_view()
+        if (page_index, zkey, clip_px) in self._pix_cache:
+            self._show_page_image()
+            return
+        full_rect = None
+        if clip_px is None:
+            page_w, page_h = self._page_pixel_size(zoom)
+            full_rect = (0, 0, max(1, int(round(page_w))), max(1, int(round(page_h))))
+        rects = [rect for rect in self._tile_rects(clip_px or full_rect) if (page_index, zkey, rect) not in self._tile_cache]
+        _import_pil()
+        if not rects:
+            if full_rect is not None:
+                self._cache_page_image((page_index, zkey, None), self._compose_tiles(page_index, zoom, full_rect))
+            self._show_page_image()
+            return
+        self._render_queue = (self.pdf_doc, page_index, zoom, zkey, rects, full_rect)
+        self._render_job_id = self.master.after(1, self._render_step)
+
+    def _render_step(self):
+        """Rasterize the next queued tile; show the result after the last."""
+        self._render_job_id = None
+        job = self._render_queue
+        if job is None:
+            return
+        doc, page_index, zoom, zkey, rects, full_rect = job
+        if self.pdf_doc is not doc:
+            self._render_queue = None
+            return  # document closed or replaced meanwhile
         try:
-            page = self.pdf_doc[self.current_page]
-            mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("ppm")
-            # create a PIL image and cache it for fast preview resizing during interactive zoom
+            rect = rects.pop(0)
+            self._cache_tile((page_index, zkey, rect), self._rasterize(doc, page_index, zoom, rect))
+            if not rects and full_rect is not None:
+                # whole page done: assemble it from the (just cached) tiles
+                self._cache_page_image((page_index, zkey, None), self._compose_tiles(page_index, zoom, full_rect))
+        except Exception:
+            # render synchronously instead so errors surface the usual way
+            self._render_queue = None
             try:
-                pil_img = Image.open(io.BytesIO(img_data)).convert('RGBA')
-                self._last_rendered_pil = pil_img
-                self.photo_image = ImageTk.PhotoImage(pil_img)
+                self._show_page_image()
+            except Exception as e:
+                self.update_status(f"Error displaying page: {e}")
+            return
+        if rects:
+            # yield to the event loop between tiles so input stays responsive
+            self._render_job_id = self.master.after(1, self._render_step)
+            return
+        self._render_queue = None
+        if self._pending_zoom_level is not None:
+            return  # a zoom preview is showing; the debounced zoom render re-requests
+        # shows the result, or queues whatever the view has moved on to meanwhile
+        self._request_render()
+
+    def _cancel_render(self):
+        """Drop any queued tile rendering."""
+        if self._render_job_id is not None:
+            try:
+                self.master.after_cancel(self._render_job_id)
             except Exception:
-                # fallback: keep previous photo_image if any
-                try:
-                    self.photo_image = ImageTk.PhotoImage(Image.open(io.BytesIO(img_data)))
-                except Exception:
-                    pass
+                pass
+            self._render_job_id = None
+        self._render_queue = None
+
+    def _page_pixel_size(self, zoom=None):
+        """Size of the whole current page in canvas pixels at the given zoom."""
+        zoom = self.zoom_level if zoom is None else zoom
+        rect = self.pdf_doc[self.current_page].rect
+        return rect.width * zoom, rect.height * zoom
+
+    def _visible_canvas_rect(self):
+        """Currently visible region in canvas (scroll) coordinates."""
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        return (x0, y0, x0 + max(1, self.canvas.winfo_width()), y0 + max(1, self.canvas.winfo_height()))
+
+    def _render_clip_for_view(self, zoom=None):
+        """Return the canvas-pixel clip to render for the current view, or None for the full page.
+
+        Small pages are always rendered whole. Large ones are clipped to the viewport
+        plus half a viewport of margin, snapped to the tile grid so nearby views
+        share cached tiles.
+        """
+        zoom = self.zoom_level if zoom is None else zoom
+        page_w, page_h = self._page_pixel_size(zoom)
+        if page_w * page_h <= self._clip_render_min_pixels:
+            return None
+        vx0, vy0, vx1, vy1 = self._visible_canvas_rect()
+        mx = (vx1 - vx0) / 2
+        my = (vy1 - vy0) / 2
+        grid = self._tile_px
+        x0 = max(0, int((vx0 - mx) // grid) * grid)
+        y0 = max(0, int((vy0 - my) // grid) * grid)
+        x1 = min(int(page_w), int(-(-(vx1 + mx) // grid)) * grid)
+        y1 = min(int(page_h), int(-(-(vy1 + my) // grid)) * grid)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return (x0, y0, x1, y1)
+
+    def _show_page_image(self):
+        """Render (or fetch from cache) the page image for the current view and place it on the canvas."""
+        clip_px = self._render_clip_for_view()
+        # keep the PIL image around for fast preview resizing during interactive zoom
+        pil_img, photo = self._render_page_image(self.current_page, self.zoom_level, clip_px)
+        origin = (clip_px[0], clip_px[1]) if clip_px else (0, 0)
+        # the same cached PhotoImage already sits at this spot: leave the canvas item alone
+        unchanged = photo is self.photo_image and origin == self._render_origin
+        self._last_rendered_pil = pil_img
+        self._last_rendered_zoom = self.zoom_level
+        self.photo_image = photo
+        self._render_clip_px = clip_px
+        self._render_origin = origin
+        if self.canvas_image:
+            if not unchanged:
+                self.canvas.itemconfig(self.canvas_image, image=photo)
+                self.canvas.coords(self.canvas_image, *origin)
+        else:
+            self.canvas_image = self.canvas.create_image(*self._render_origin, anchor="nw", image=photo)
+            self.canvas.tag_lower(self.canvas_image)
+
+    def _ensure_viewport_rendered(self):
+        """Re-render a clipped page image when the view has scrolled past the rendered area."""
+        if not self.pdf_doc or not self.canvas_image or self._render_clip_px is None:
+            return
+        rx0, ry0, rx1, ry1 = self._render_clip_px
+        page_w, page_h = self._page_pixel_size()
+        vx0, vy0, vx1, vy1 = self._visible_canvas_rect()
+        if (rx0 <= max(0, vx0) and ry0 <= max(0, vy0)
+                and min(page_w, vx1) <= rx1 and min(page_h, vy1) <= ry1):
+            return
+        self._request_render()
+
+    def _schedule_pending_render(self):
+        """Queue one viewport re-render for the next idle cycle.
+
+        Dragging or scrolling fires many view changes per second; they all
+        collapse into a single render once the event queue drains.
+        """
+        if self._pending_render or self._render_clip_px is None:
+            return
+        self._pending_render = True
+        try:
+            self.master.after_idle(self._do_pending_render)
+        except Exception:
+            self._pending_render = False
+
+    def _do_pending_render(self):
+        if not self._pending_render:
+            return
+        self._pending_render = False
+        if self._pending_zoom_level is not None:
+            return  # a zoom preview is showing; the debounced zoom render handles it
+        try:
+            self._ensure_viewport_rendered()
+        except Exception:
+            pass
+
+    def _on_canvas_xscroll(self, first, last):
+        self.hscroll.set(first, last)
+        self._schedule_pending_render()
+
+    def _on_canvas_yscroll(self, first, last):
+        self.vscroll.set(first, last)
+        self._schedule_pending_render()
+
+    def display_page(self):
+        if not self.pdf_doc:
+            return
+        try:
             self.canvas.delete("all")
-            self.canvas_image = self.canvas.create_image(0, 0, anchor="nw", image=self.photo_image)
+            self.canvas_image = None
+            # set the full-page scrollregion first so a clipped render sees the final view
+            page_w, page_h = self._page_pixel_size()
+            self.canvas.config(scrollregion=(0, 0, page_w, page_h))
+            self._show_page_image()
             self.redraw_markers()
-            img_width = self.photo_image.width()
-            img_height = self.photo_image.height()
-            self.canvas.config(scrollregion=(0, 0, img_width, img_height))
-            self.canvas.tag_raise("calibration_point")
-            self.canvas.tag_raise("user_point")
-            self.canvas.tag_raise("user_line")
-            self.canvas.tag_raise("line_label")
-            self.canvas.tag_raise("user_curve")
-            self.canvas.tag_raise("arc_point")
+            # stacking order is already set at the end of redraw_markers
             self.zoom_entry.delete(0, tk.END)
             self.zoom_entry.insert(0, f"{self.zoom_level*100:.0f}")
         except Exception as e:
             self.update_status(f"Error displaying page: {e}")
 
-    def zoom_with_focus(self, zoom_factor, x, y):
-        if not self.pdf_doc:
-            return
-        old_zoom = self.zoom_level
-        x_scroll = self.canvas.canvasx(x)
-        y_scroll = self.canvas.canvasy(y)
-        x_pdf = x_scroll / old_zoom
-        y_pdf = y_scroll / old_zoom
-        new_zoom = self.zoom_level * zoom_factor
+    def _snap_zoom(self, zoom, direction=0, current=None):
+        """Snap a zoom level to the nearest rung of the zoom ladder.
 
-        # Quick preview: if we have a cached PIL image for the page, resize it quickly
+        If direction is non-zero and snapping would leave the current zoom
+        (self.zoom_level unless given) unchanged, move one rung in that
+        direction instead.
+        """
+        steps = self._zoom_steps
+        current = self.zoom_level if current is None else current
+        idx = int(np.abs(np.log(steps) - np.log(max(zoom, 1e-6))).argmin())
+        if direction and np.isclose(steps[idx], current):
+            idx = max(0, min(len(steps) - 1, idx + (1 if direction > 0 else -1)))
+        return float(steps[idx])
+
+    def _flush_zoom_preview(self):
+        """Show the last rendered page image resized to the pending zoom level."""
+        self._zoom_preview_job = None
+        new_zoom = self._pending_zoom_level
+        if new_zoom is None:
+            return
+        old_zoom = self._last_rendered_zoom
         try:
             pil = getattr(self, '_last_rendered_pil', None)
             if pil is not None:
-                # Compute scale relative to last rendered PIL (which represents current zoom)
+                # Compute scale relative to last rendered PIL (made at old_zoom)
                 try:
                     scale = new_zoom / old_zoom if old_zoom != 0 else 1.0
                 except Exception:
                     scale = 1.0
                 try:
-                    new_w = max(1, int(pil.width * scale))
-                    new_h = max(1, int(pil.height * scale))
-                    preview = pil.resize((new_w, new_h), resample=Image.BILINEAR)
+                    # Only the part of the last render that lands in the viewport at the
+                    # new zoom is resized, so the preview never exceeds the window size
+                    # however many notches are pending. The render sits at its origin
+                    # (non-zero for a clipped render) in canvas pixels at old_zoom.
+                    ox, oy = self._render_origin
+                    vx0, vy0, vx1, vy1 = self._visible_canvas_rect()
+                    cx0 = max(0, int(vx0 / scale - ox))
+                    cy0 = max(0, int(vy0 / scale - oy))
+                    cx1 = min(pil.width, int(vx1 / scale - ox) + 1)
+                    cy1 = min(pil.height, int(vy1 / scale - oy) + 1)
+                    if cx1 <= cx0 or cy1 <= cy0:
+                        # the view is off the last render; keep what is on screen
+                        return
+                    new_w = max(1, int((cx1 - cx0) * scale))
+                    new_h = max(1, int((cy1 - cy0) * scale))
+                    preview = pil.crop((cx0, cy0, cx1, cy1)).resize((new_w, new_h), resample=Image.BILINEAR)
                     self.photo_image = ImageTk.PhotoImage(preview)
+                    px, py = (ox + cx0) * scale, (oy + cy0) * scale
                     if self.canvas_image:
                         try:
                             self.canvas.itemconfig(self.canvas_image, image=self.photo_image)
+                            self.canvas.coords(self.canvas_image, px, py)
                         except Exception:
-                            self.canvas_image = self.canvas.create_image(0, 0, anchor='nw', image=self.photo_image)
+                            self.canvas_image = self.canvas.create_image(px, py, anchor='nw', image=self.photo_image)
                     else:
-                        self.canvas_image = self.canvas.create_image(0, 0, anchor='nw', image=self.photo_image)
-                    # adjust scrollregion to preview size
+                        self.canvas_image = self.canvas.create_image(px, py, anchor='nw', image=self.photo_image)
+                    # adjust scrollregion to the full page size at the new zoom
                     try:
-                        self.canvas.config(scrollregion=(0, 0, new_w, new_h))
+                        page_w, page_h = self._page_pixel_size(new_zoom)
+                        self.canvas.config(scrollregion=(0, 0, page_w, page_h))
                     except Exception:
                         pass
+                    self._preview_zoom = new_zoom
                 except Exception:
                     pass
         except Exception:
             pass
 
+    def zoom_with_focus(self, zoom_factor, x, y):
+        if not self.pdf_doc:
+            return
+        # notches arriving before the full render build on the zoom already pending,
+        # and the cursor maps through whatever zoom is currently on screen
+        base_zoom = self._pending_zoom_level if self._pending_zoom_level is not None else self.zoom_level
+        shown_zoom = self._preview_zoom or self.zoom_level
+        x_scroll = self.canvas.canvasx(x)
+        y_scroll = self.canvas.canvasy(y)
+        x_pdf = x_scroll / shown_zoom
+        y_pdf = y_scroll / shown_zoom
+        new_zoom = self._snap_zoom(base_zoom * zoom_factor, 1 if zoom_factor > 1 else -1, current=base_zoom)
+
+        # Quick preview of the cached render, at most once per ~30 ms of wheel events
+        if self._zoom_preview_job is None:
+            try:
+                self._zoom_preview_job = self.master.after(30, self._flush_zoom_preview)
+            except Exception:
+                self._zoom_preview_job = None
+
         # Schedule a full quality render after a short debounce interval
         self._pending_zoom_pdf_coords = (x_pdf, y_pdf)
         self._pending_zoom_level = new_zoom
@@ -3239,142 +4054,200 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             except Exception:
                 pass
 
+    @staticmethod
+    def _oval_boxes(xy, size):
+        """Return [x-size, y-size, x+size, y+size] rows for an (N, 2) array of centers."""
+        return np.hstack([xy - size, xy + size]).tolist()
+
     def redraw_markers(self):
-        # Remove existing canvas items for our element tags so redraw reflects size/font changes
-        try:
-            self.canvas.delete("user_point")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("point_label")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("user_line")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("line_label")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("user_curve")
-        except Exception:
-            pass
+        if self._batch_depth:
+            self._batch_pending['redraw'] = True
+            return
+        self._create_markers()
+        # Ensure editor lists and 3D view reflect the current markers immediately.
+        # Use try/except to avoid crashing the UI if either subsystem isn't ready.
         try:
-            self.canvas.delete("arc_point")
+            self.refresh_editor_lists()
         except Exception:
             pass
         try:
-            self.canvas.delete("calibration_point")
+            # update_3d_plot will initialize 3D canvas lazily if needed
+            self.update_3d_plot()
         except Exception:
             pass
 
-        self.point_markers.clear()
-        self.point_labels.clear()
-        self.calibration_markers.clear()
-        size = getattr(self, 'point_marker_size', 5)
+    def _create_markers(self):
+        """Bring the canvas markers in line with the data, reusing existing items.
 
-        for i, (px, py) in enumerate(self.reference_points_pdf):
-            x = px * self.zoom_level
-            y = py * self.zoom_level
-            m_id = self.canvas.create_oval(x - size, y - size, x + size, y + size,
-                                          outline="red", fill="red", tags="calibration_point", width=2)
-            self.calibration_markers[i] = m_id
+        Items left from the previous draw are moved with canvas.coords; items of
+        new entities are created and those no longer backed by data deleted in
+        one call. Display options are applied per tag, and only when they changed.
+        """
+        canvas = self.canvas
+        coords = canvas.coords
 
-        for point in self.user_points:
-            if 'pdf_x' in point and 'pdf_y' in point:
-                x = point['pdf_x'] * self.zoom_level
-                y = point['pdf_y'] * self.zoom_level
-                clr = getattr(self, 'point_color_2d', 'blue')
-                m_id = self.canvas.create_oval(x - size, y - size, x + size, y + size,
-                                              outline=clr, fill=clr, tags="user_point", width=2)
-                self.point_markers[point['id']] = m_id
-                # create or update a label for the point id
-                # always compute a safe label font size (at least 1)
-                lbl_size = max(1, int(getattr(self, 'label_font_size', 10) or 10))
-                text_x = x + (size + 6)
-                text_y = y - (size + 2)
-                # if a previous text canvas id exists, remove it to avoid stale references
+        def unclaimed(tag):
+            # items currently carrying `tag`; whatever is not reused below gets deleted
+            try:
+                return set(canvas.find_withtag(tag))
+            except Exception:
+                return set()
+
+        free_cal = unclaimed("calibration_point")
+        free_pts = unclaimed("user_point")
+        free_lbl = unclaimed("point_label")
+        free_lines = unclaimed("user_line")
+        free_line_lbl = unclaimed("line_label")
+        free_curves = unclaimed("user_curve")
+        free_arc = unclaimed("arc_point")
+
+        size = getattr(self, 'point_marker_size', 5)
+        clr = getattr(self, 'point_color_2d', 'blue')
+        lw = getattr(self, 'line_width_2d', 4)
+        lclr = getattr(self, 'line_color_2d', 'orange')
+        cwidth = getattr(self, 'curve_width_2d', 2)
+        cclr = getattr(self, 'curve_color_2d', 'purple')
+        # always compute a safe label font size (at least 1)
+        point_font = ("Helvetica", max(1, int(getattr(self, 'label_font_size', 10) or 10)))
+        line_font = ("Helvetica", max(1, int(getattr(self, 'label_font_size', 12) or 12)))
+
+        # Restyle surviving items with one itemconfigure per tag when an option changed
+        style = (clr, lw, lclr, cwidth, cclr, point_font, line_font)
+        if style != self._marker_style:
+            for tag, opts in (("user_point", {'outline': clr, 'fill': clr}),
+                              ("point_label", {'fill': clr, 'font': point_font}),
+                              ("user_line", {'fill': lclr, 'width': lw}),
+                              ("line_label", {'fill': lclr, 'font': line_font}),
+                              ("user_curve", {'fill': cclr, 'width': cwidth}),
+                              ("arc_point", {'outline': cclr, 'fill': cclr})):
                 try:
-                    old_tid = point.get('text_id') or self.point_labels.get(point['id'])
-                    if old_tid:
-                        try:
-                            self.canvas.delete(old_tid)
-                        except Exception:
-                            pass
+                    canvas.itemconfigure(tag, **opts)
                 except Exception:
                     pass
-                # create a fresh label with the current font size
+            self._marker_style = style
+
+        zoom = self.zoom_level
+        # Scale all calibration points in one vectorized pass
+        ref_scaled = np.asarray(self.reference_points_pdf, dtype=np.float64).reshape(-1, 2) * zoom
+        old_cal = dict(self.calibration_markers)
+        self.calibration_markers.clear()
+        for i, box in enumerate(self._oval_boxes(ref_scaled, size)):
+            m_id = old_cal.get(i)
+            if m_id in free_cal:
+                free_cal.discard(m_id)
+                coords(m_id, *box)
+            else:
+                m_id = canvas.create_oval(*box,
+                                          outline="red", fill="red", tags="calibration_point", width=2)
+            self.calibration_markers[i] = m_id
+
+        # Scale user point coordinates in one vectorized pass
+        drawable, xy, row_of = self._point_xy()
+        pts_scaled = xy * zoom
+        pts_boxes = self._oval_boxes(pts_scaled, size)
+        old_markers = dict(self.point_markers)
+        old_labels = dict(self.point_labels)
+        self.point_markers.clear()
+        self.point_labels.clear()
+        markers = self.point_markers
+        scaled = pts_scaled.tolist()
+        for point, (x, y), box in zip(drawable, scaled, pts_boxes):
+            pid = point['id']
+            m_id = old_markers.get(pid)
+            if m_id in free_pts:
+                free_pts.discard(m_id)
+                coords(m_id, *box)
+            else:
+                m_id = canvas.create_oval(*box,
+                                          outline=clr, fill=clr, tags="user_point", width=2)
+            markers[pid] = m_id
+            # label for the point id, placed up and to the right of the marker
+            text_x = x + (size + 6)
+            text_y = y - (size + 2)
+            try:
+                t_id = old_labels.get(pid) or point.get('text_id')
+                if t_id in free_lbl:
+                    free_lbl.discard(t_id)
+                    coords(t_id, text_x, text_y)
+                else:
+                    t_id = canvas.create_text(text_x, text_y, text=str(pid), fill=clr, tags="point_label", font=point_font)
+                self.point_labels[pid] = t_id
                 try:
-                    t_id = self.canvas.create_text(text_x, text_y, text=str(point['id']), fill=clr, tags="point_label", font=("Helvetica", lbl_size))
-                    self.point_labels[point['id']] = t_id
-                    try:
-                        point['text_id'] = t_id
-                    except Exception:
-                        pass
+                    point['text_id'] = t_id
                 except Exception:
                     pass
+            except Exception:
+                pass
 
+        # Line endpoints are read from the already scaled point rows
         for line in self.lines:
-            start = next(p for p in self.user_points if p['id'] == line['start_id'])
-            end = next(p for p in self.user_points if p['id'] == line['end_id'])
-            x1 = start['pdf_x'] * self.zoom_level
-            y1 = start['pdf_y'] * self.zoom_level
-            x2 = end['pdf_x'] * self.zoom_level
-            y2 = end['pdf_y'] * self.zoom_level
-            lw = getattr(self, 'line_width_2d', 4)
-            lclr = getattr(self, 'line_color_2d', 'orange')
-            line_id = self.canvas.create_line(x1, y1, x2, y2, fill=lclr, width=lw, tags="user_line")
-            if 'canvas_id' in line:
-                try:
-                    self.canvas.delete(line['canvas_id'])
-                except:
-                    pass
+            s_row = row_of.get(line['start_id'])
+            e_row = row_of.get(line['end_id'])
+            if s_row is None or e_row is None:
+                continue
+            x1, y1 = scaled[s_row]
+            x2, y2 = scaled[e_row]
+            line_id = line.get('canvas_id')
+            if line_id in free_lines:
+                free_lines.discard(line_id)
+                coords(line_id, x1, y1, x2, y2)
+            else:
+                line_id = canvas.create_line(x1, y1, x2, y2, fill=lclr, width=lw, tags="user_line")
             line['canvas_id'] = line_id
             mid_x = (x1 + x2) / 2
             mid_y = (y1 + y2) / 2
             text_offset = 15
             text_y = mid_y - text_offset if y1 < y2 else mid_y + text_offset
-            # robust text label handling: treat falsy or missing text_id as absent
-            # always recreate line label to ensure font/position are correct
-            try:
-                old_tid = line.get('text_id')
-                if old_tid:
-                    try:
-                        self.canvas.delete(old_tid)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            # treat a falsy, missing or already deleted text_id as absent
             try:
-                lbl_size = max(1, int(getattr(self, 'label_font_size', 12) or 12))
-                t_id = self.canvas.create_text(mid_x, text_y, text=str(line['id']), fill=lclr, tags="line_label", font=("Helvetica", lbl_size))
+                t_id = line.get('text_id')
+                if t_id in free_line_lbl:
+                    free_line_lbl.discard(t_id)
+                    coords(t_id, mid_x, text_y)
+                else:
+                    t_id = canvas.create_text(mid_x, text_y, text=str(line['id']), fill=lclr, tags="line_label", font=line_font)
                 line['text_id'] = t_id
             except Exception:
                 pass
 
+        arc_size = 4
+        # Curves are drawn as a single polyline each; the per-vertex ovals are only
+        # needed to edit curves, so other modes leave them out (and delete old ones)
+        show_arcs = self.mode_var.get() == 'curves'
+        self._arc_markers_shown = show_arcs
         for curve in self.curves:
-            coords = []
-            for px, py in curve['arc_points_pdf']:
-                coords.extend([px * self.zoom_level, py * self.zoom_level])
-            cwidth = getattr(self, 'curve_width_2d', 2)
-            cclr = getattr(self, 'curve_color_2d', 'purple')
-            curve_id = self.canvas.create_line(*coords, fill=cclr, width=cwidth, smooth=True, splinesteps=36, tags="user_curve")
-            if 'canvas_id' in curve:
-                try:
-                    self.canvas.delete(curve['canvas_id'])
-                except:
-                    pass
+            arc_scaled = np.asarray(curve['arc_points_pdf'], dtype=np.float64).reshape(-1, 2) * zoom
+            flat = arc_scaled.ravel().tolist()
+            curve_id = curve.get('canvas_id')
+            if curve_id in free_curves:
+                free_curves.discard(curve_id)
+                coords(curve_id, *flat)
+            else:
+                curve_id = canvas.create_line(*flat, fill=cclr, width=cwidth, smooth=True, splinesteps=36, tags="user_curve")
             curve['canvas_id'] = curve_id
-            size = 4
-            curve['arc_point_marker_ids'] = []
-            for px, py in curve['arc_points_pdf']:
-                x = px * self.zoom_level
-                y = py * self.zoom_level
-                marker_id = self.canvas.create_oval(x - size, y - size, x + size, y + size,
+            old_ids = curve.get('arc_point_marker_ids') or []
+            marker_ids = []
+            if not show_arcs:
+                curve['arc_point_marker_ids'] = marker_ids
+                continue
+            for k, box in enumerate(self._oval_boxes(arc_scaled, arc_size)):
+                marker_id = old_ids[k] if k < len(old_ids) else None
+                if marker_id in free_arc:
+                    free_arc.discard(marker_id)
+                    coords(marker_id, *box)
+                else:
+                    marker_id = canvas.create_oval(*box,
                                                    outline=cclr, fill=cclr, tags="arc_point", width=2)
-                curve['arc_point_marker_ids'].append(marker_id)
+                marker_ids.append(marker_id)
+            curve['arc_point_marker_ids'] = marker_ids
+
+        # Drop items whose entity is gone, all in one call
+        stale = free_cal | free_pts | free_lbl | free_lines | free_line_lbl | free_curves | free_arc
+        if stale:
+            try:
+                canvas.delete(*stale)
+            except Exception:
+                pass
 
         self.canvas.tag_raise("calibration_point")
         self.canvas.tag_raise("user_point")
@@ -3382,17 +4255,75 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.canvas.tag_raise("line_label")
         self.canvas.tag_raise("user_curve")
         self.canvas.tag_raise("arc_point")
-        # Ensure editor lists and 3D view reflect the current markers immediately.
-        # Use try/except to avoid crashing the UI if either subsystem isn't ready.
-        try:
-            self.refresh_editor_lists()
-        except Exception:
-            pass
+
+    def _point_xy(self):
+        """Return (points, xy, row_of) for the points that have pdf coordinates.
+
+        xy is an (N, 2) array of unscaled pdf coordinates and row_of maps point id
+        to row. A point's pdf position never changes after creation, so the arrays
+        are only rebuilt when points are added or removed (see ListSnapshotCache).
+        """
+        return self._point_xy_cache.get(self.user_points)
+
+    def _rescale_markers(self):
+        """Move existing marker items to the current zoom level without recreating them.
+
+        Only geometry changes on zoom, so canvas.coords is enough. Falls back to a
+        full _create_markers() if any expected item is missing.
+        """
+        zoom = self.zoom_level
+        size = getattr(self, 'point_marker_size', 5)
+        coords = self.canvas.coords
         try:
-            # update_3d_plot will initialize 3D canvas lazily if needed
-            self.update_3d_plot()
+            ref_scaled = np.asarray(self.reference_points_pdf, dtype=np.float64).reshape(-1, 2) * zoom
+            for i, box in enumerate(self._oval_boxes(ref_scaled, size)):
+                coords(self.calibration_markers[i], *box)
+
+            # Every screen position is derived from the cached pdf arrays with one
+            # multiply-add per array; the loops below only hand rows to canvas.coords
+            drawable, xy, row_of = self._point_xy()
+            pts_scaled = xy * zoom
+            pts_boxes = self._oval_boxes(pts_scaled, size)
+            label_xy = (pts_scaled + (size + 6, -(size + 2))).tolist()
+            markers = self.point_markers
+            labels = self.point_labels
+            for point, box, text_xy in zip(drawable, pts_boxes, label_xy):
+                pid = point['id']
+                coords(markers[pid], *box)
+                coords(labels[pid], *text_xy)
+
+            drawn_lines = []
+            s_rows = []
+            e_rows = []
+            for line in self.lines:
+                s_row = row_of.get(line['start_id'])
+                e_row = row_of.get(line['end_id'])
+                if s_row is None or e_row is None:
+                    continue
+                drawn_lines.append(line)
+                s_rows.append(s_row)
+                e_rows.append(e_row)
+            if drawn_lines:
+                segs = np.hstack((pts_scaled[s_rows], pts_scaled[e_rows]))
+                mid_x = (segs[:, 0] + segs[:, 2]) / 2
+                mid_y = (segs[:, 1] + segs[:, 3]) / 2
+                text_y = np.where(segs[:, 1] < segs[:, 3], mid_y - 15, mid_y + 15)
+                for line, seg, tx, ty in zip(drawn_lines, segs.tolist(), mid_x.tolist(), text_y.tolist()):
+                    coords(line['canvas_id'], *seg)
+                    coords(line['text_id'], tx, ty)
+
+            if self.curves:
+                arc_size = 4
+                arcs = [np.asarray(curve['arc_points_pdf'], dtype=np.float64).reshape(-1, 2) for curve in self.curves]
+                all_scaled = np.concatenate(arcs) * zoom
+                bounds = np.cumsum([len(a) for a in arcs])[:-1]
+                for curve, arc_scaled in zip(self.curves, np.split(all_scaled, bounds)):
+                    coords(curve['canvas_id'], *arc_scaled.ravel().tolist())
+                    for marker_id, box in zip(curve['arc_point_marker_ids'], self._oval_boxes(arc_scaled, arc_size)):
+                        coords(marker_id, *box)
         except Exception:
-            pass
+            # item bookkeeping out of sync: rebuild everything
+            self._create_markers()
 
     # --- Display setters used by the sliders ---
     def _set_point_size(self, v):
@@ -3448,9 +4379,9 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             zoom_percent = float(self.zoom_entry.get())
             if zoom_percent < 10 or zoom_percent > 1000:
                 raise ValueError("Zoom must be between 10 and 1000")
-            self.zoom_level = zoom_percent / 100.0
+            self.zoom_level = self._snap_zoom(zoom_percent / 100.0)
             self.display_page()
-            self.update_status(f"Zoom set to {zoom_percent:.1f}%")
+            self.update_status(f"Zoom set to {self.zoom_level*100:.1f}%")
         except ValueError as e:
             messagebox.showerror("Invalid Zoom", f"Invalid zoom value: {e}")
             self.zoom_entry.delete(0, tk.END)
@@ -3496,6 +4427,8 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
     def on_right_button_press(self, event):
         self._drag_data["x"] = event.x
         self._drag_data["y"] = event.y
+        # no position readout while panning; restored on release
+        self.canvas.unbind("<Motion>")
 
     def on_right_button_move(self, event):
         delta_x = (self._drag_data["x"] - event.x)
@@ -3506,66 +4439,94 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self._drag_data["y"] = event.y
 
     def on_right_button_release(self, event):
-        pass
+        self.canvas.bind("<Motion>", self.on_mouse_move)
 
     def on_mouse_move(self, event):
-        if not self.pdf_doc:
+        # Only calibration shows the pointer position; updates are coalesced to
+        # one per 16 ms (~60 Hz) instead of one per Tk motion event
+        if not self.pdf_doc or not self.calibration_mode:
             return
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
+        self._mouse_pos = (event.x, event.y)
+        if self._mouse_move_job is None:
+            try:
+                self._mouse_move_job = self.master.after(16, self._flush_mouse_move)
+            except Exception:
+                self._mouse_move_job = None
+
+    def _flush_mouse_move(self):
+        self._mouse_move_job = None
+        if not self.pdf_doc or not self.calibration_mode or self._mouse_pos is None:
+            return
+        x, y = self._mouse_pos
+        canvas_x = self.canvas.canvasx(x)
+        canvas_y = self.canvas.canvasy(y)
         pdf_x = canvas_x / self.zoom_level
         pdf_y = canvas_y / self.zoom_level
-        if self.calibration_mode:
-            self.calib_status.config(text=f"Pos: ({pdf_x:.1f}, {pdf_y:.1f})\nStep: {self.calibration_step}")
+        self.calib_status.config(text=f"Pos: ({pdf_x:.1f}, {pdf_y:.1f})\nStep: {self.calibration_step}")
+
+    def _build_click_handlers(self):
+        """Map each mode to its left-click handler.
+
+        Every handler takes (event, canvas_x, canvas_y, pdf_x, pdf_y).
+        """
+        def duplication(event, cx, cy, px, py):
+            self.handle_duplication_click(event)
+        return {
+            "deletion": lambda event, cx, cy, px, py: self.handle_deletion_click(event),
+            "calibration": lambda event, cx, cy, px, py: self.handle_calibration_click(cx, cy, px, py),
+            "coordinates": lambda event, cx, cy, px, py: self.handle_coordinates_click(cx, cy, px, py),
+            "lines": lambda event, cx, cy, px, py: self.handle_lines_click(cx, cy),
+            "curves": lambda event, cx, cy, px, py: self.handle_curves_click(cx, cy),
+            "duplicate_points": duplication,
+            "duplicate_lines": duplication,
+            "duplicate_curves": duplication,
+            "identify": lambda event, cx, cy, px, py: self._identify_click(px, py),
+        }
+
+    def _on_mode_var_changed(self, *args):
+        mode = self.mode_var.get()
+        handler = self._click_handlers.get(mode)
+        if handler is None:
+            def handler(event, cx, cy, px, py, mode=mode):
+                self.update_status(f"Unknown mode: {mode}")
+        self._active_click_handler = handler
+        # add or drop the arc-point ovals when entering or leaving curves mode
+        if (mode == 'curves') != self._arc_markers_shown and self.curves:
+            try:
+                self._create_markers()
+            except Exception:
+                pass
 
     def on_left_click(self, event):
         if not self.pdf_doc:
             return
-        mode = self.mode_var.get()
-        if mode == "deletion":
-            self.handle_deletion_click(event)
-            return
-
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
-        pdf_x = canvas_x / self.zoom_level
-        pdf_y = canvas_y / self.zoom_level
+        self._active_click_handler(event, canvas_x, canvas_y,
+                                   canvas_x / self.zoom_level, canvas_y / self.zoom_level)
 
-        if mode == "calibration":
-            self.handle_calibration_click(canvas_x, canvas_y, pdf_x, pdf_y)
-        elif mode == "coordinates":
-            self.handle_coordinates_click(canvas_x, canvas_y, pdf_x, pdf_y)
-        elif mode == "lines":
-            self.handle_lines_click(canvas_x, canvas_y)
-        elif mode == "curves":
-            self.handle_curves_click(canvas_x, canvas_y)
-        elif mode in ["duplicate_points", "duplicate_lines", "duplicate_curves"]:
-            self.handle_duplication_click(event)
-        elif mode == "identify":
-            # Identify multiple nearby items at this location and present details
-            try:
-                candidates = self.find_items_near(pdf_x, pdf_y)
-            except Exception:
-                candidates = None
-            if not candidates:
-                self.update_status("No nearby items found")
-                return
-            # Build a readable listing
-            lines = []
-            for kind, item, dist in candidates:
-                if kind == 'point':
-                    lines.append(f"Point id={item.get('id')} pdf=({item.get('pdf_x')},{item.get('pdf_y')}) z={item.get('z', '')}")
-                elif kind == 'line':
-                    lines.append(f"Line id={item.get('id')} start={item.get('start_id')} end={item.get('end_id')}")
-                else:
-                    lines.append(f"Curve id={item.get('id')} z={item.get('z_level', item.get('z',''))} arc_points={len(item.get('arc_point_ids',[]))}")
-            try:
-                from tkinter import messagebox
-                messagebox.showinfo("Identify Results", "\n".join(lines))
-            except Exception:
-                self.update_status("Identified: " + "; ".join(lines))
-        else:
-            self.update_status(f"Unknown mode: {mode}")
+    def _identify_click(self, pdf_x, pdf_y):
+        # Identify multiple nearby items at this location and present details
+        try:
+            candidates = self.find_items_near(pdf_x, pdf_y)
+        except Exception:
+            candidates = None
+        if not candidates:
+            self.update_status("No nearby items found")
+            return
+        # Build a readable listing
+        lines = []
+        for kind, item, dist in candidates:
+            if kind == 'point':
+                lines.append(f"Point id={item.get('id')} pdf=({item.get('pdf_x')},{item.get('pdf_y')}) z={item.get('z', '')}")
+            elif kind == 'line':
+                lines.append(f"Line id={item.get('id')} start={item.get('start_id')} end={item.get('end_id')}")
+            else:
+                lines.append(f"Curve id={item.get('id')} z={item.get('z_level', item.get('z',''))} arc_points={len(item.get('arc_point_ids',[]))}")
+        try:
+            messagebox.showinfo("Identify Results", "\n".join(lines))
+        except Exception:
+            self.update_status("Identified: " + "; ".join(lines))
 
     def save_project(self):
         # Allow saving once a PDF is loaded or calibration exists.
@@ -3624,8 +4585,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         except Exception:
             pass
         try:
-            with open(project_path, 'w') as f:
-                json.dump(project_data, f, indent=4)
+            dump_json(project_data, project_path, indent=4)
             self._modified = False  # Reset modified flag after successful save
             messagebox.showinfo("Saved", f"Project saved to {project_path}")
             self.update_status(f"Project saved to {project_path}")
@@ -3650,8 +4610,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         if not project_path:
             return
         try:
-            with open(project_path, 'r') as f:
-                project_data = json.load(f)
+            project_data = load_json(project_path)
 
             # Backup original project before any migration
             try:
@@ -3678,7 +4637,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 messagebox.showwarning("PDF Missing", f"PDF file not found: {pdf_path}")
                 return
             self.close_file()
-            self.pdf_doc = fitz.open(pdf_path)
+            self.pdf_doc = _import_fitz().open(pdf_path)
             self.current_page = 0
             self.total_pages = len(self.pdf_doc)
             self.reference_points_pdf = project_data.get("calibration_pdf_points", [])
@@ -3690,8 +4649,10 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 self.transformation_matrix = None
             self.update_calibration_status()
             self.user_points = project_data.get("points", [])
+            self._fallback_point_max = 0
             self.lines = project_data.get("lines", [])
             self.curves = project_data.get("curves", [])
+            self._canonicalize_project()
             self.zoom_level = project_data.get("zoom_level", 1.0)
             # Restore display settings if present
             try:
@@ -3767,32 +4728,35 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             if self.zoom_entry:
                 self.zoom_entry.delete(0, tk.END)
                 self.zoom_entry.insert(0, f"{self.zoom_level*100:.0f}")
-            self.display_page()
-            self.update_points_label()
-            # ID counters are deterministic via next_* helpers; no legacy counter sync required
+            # the page, markers, editor lists and 3D view are requested several times
+            # below; the batch collapses them into one refresh of each at the end
+            with self._batch_updates():
+                self.display_page()
+                self.update_points_label()
+                # ID counters are deterministic via next_* helpers; no legacy counter sync required
 
-            # Refresh editor lists and 3D view to reflect loaded project
-            try:
-                self.refresh_editor_lists()
-            except Exception:
-                pass
-            try:
-                self.update_3d_plot()
-            except Exception:
-                pass
-            self.update_status(f"Project loaded: {project_path}")
-            last_mode = project_data.get("last_mode", "coordinates")
-            self.mode_var.set(last_mode)
-            self.set_mode(last_mode)
-            # Force immediate redraw of calibration points and IDs so they appear right after loading
-            try:
-                self.redraw_markers()
-            except Exception:
-                pass
-            try:
-                self.refresh_editor_lists()
-            except Exception:
-                pass
+                # Refresh editor lists and 3D view to reflect loaded project
+                try:
+                    self.refresh_editor_lists()
+                except Exception:
+                    pass
+                try:
+                    self.update_3d_plot()
+                except Exception:
+                    pass
+                self.update_status(f"Project loaded: {project_path}")
+                last_mode = project_data.get("last_mode", "coordinates")
+                self.mode_var.set(last_mode)
+                self.set_mode(last_mode)
+                # Force immediate redraw of calibration points and IDs so they appear right after loading
+                try:
+                    self.redraw_markers()
+                except Exception:
+                    pass
+                try:
+                    self.refresh_editor_lists()
+                except Exception:
+                    pass
             try:
                 # Ensure canvas refresh
                 if self.canvas is not None:
@@ -3822,7 +4786,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             messagebox.showwarning("Export Error", "Calibration required before export.")
             return
 
-        from tkinter import simpledialog
         
         # Propose project name based on current file
         default_name = ""
@@ -3844,13 +4807,32 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
         # Ensure each curve has a fixed number of positions (interior + 2 endpoints)
         total_positions = max(2, int(getattr(self, 'curve_interior_points', 4)) + 2)
+        # interpolation parameters of the interior positions (i / (n - 1) for 0 < i < n - 1)
+        interior_t = np.arange(1, total_positions - 1) / (total_positions - 1)
+
+        # local copy: points created below are added to it as they are appended
+        points_by_id = dict(self.points_by_id)
+
+        # Existing points hashed by their pdf_x/pdf_y quantized to the match tolerance, so
+        # find_or_create_point probes a few cells instead of scanning every point
+        tol = 1e-6
+        coord_index = {}
+        for p in self.user_points:
+            try:
+                key = (int(round(p['pdf_x'] / tol)), int(round(p['pdf_y'] / tol)))
+            except (KeyError, TypeError, ValueError, OverflowError):
+                continue
+            coord_index.setdefault(key, p)
 
         def find_or_create_point(px, py, z_val=None):
-            # Try to find an existing point by pdf coords (exact match, small tolerance)
-            tol = 1e-6
-            for p in self.user_points:
-                if abs(p.get('pdf_x', 1e12) - px) < tol and abs(p.get('pdf_y', 1e12) - py) < tol:
-                    return p['id']
+            # Try to find an existing point by pdf coords (exact match, small tolerance);
+            # a match can sit in a neighbouring cell when it straddles a rounding boundary
+            kx, ky = int(round(px / tol)), int(round(py / tol))
+            for gx in (kx, kx - 1, kx + 1):
+                for gy in (ky, ky - 1, ky + 1):
+                    p = coord_index.get((gx, gy))
+                    if p is not None and abs(p['pdf_x'] - px) < tol and abs(p['pdf_y'] - py) < tol:
+                        return p['id']
             # Create new point
             rx, ry = self.transform_point(px, py)
             # Use centralized helper to allocate a new point id
@@ -3864,6 +4846,8 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 'z': float(z_val) if z_val is not None else 0.0
             }
             self.user_points.append(new_pt)
+            points_by_id[new_id] = new_pt
+            coord_index.setdefault((kx, ky), new_pt)
             return new_id
 
         # Reconstruct or normalize arc_point_ids for each curve (may create new points)
@@ -3906,12 +4890,12 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     # ensure start/end pdf present
                     try:
                         if start_id is not None:
-                            sp = next((p for p in self.user_points if p['id'] == start_id), None)
+                            sp = points_by_id.get(start_id)
                             if sp:
                                 if (sp['pdf_x'], sp['pdf_y']) not in pdf_coords:
                                     pdf_coords.insert(0, (sp['pdf_x'], sp['pdf_y']))
                         if end_id is not None:
-                            ep = next((p for p in self.user_points if p['id'] == end_id), None)
+                            ep = points_by_id.get(end_id)
                             if ep:
                                 if (ep['pdf_x'], ep['pdf_y']) not in pdf_coords:
                                     pdf_coords.append((ep['pdf_x'], ep['pdf_y']))
@@ -3923,13 +4907,9 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                         ex, ey = pdf_coords[-1]
                         needed = total_positions - len(ids)
                         # insert interior points between start and end
-                        insert_ids = []
-                        for i in range(1, total_positions - 1):
-                            t = i / (total_positions - 1)
-                            ix = sx * (1 - t) + ex * t
-                            iy = sy * (1 - t) + ey * t
-                            pid = find_or_create_point(ix, iy, z_level)
-                            insert_ids.append(pid)
+                        ixs = (sx * (1 - interior_t) + ex * interior_t).tolist()
+                        iys = (sy * (1 - interior_t) + ey * interior_t).tolist()
+                        insert_ids = [find_or_create_point(ix, iy, z_level) for ix, iy in zip(ixs, iys)]
                         # final assembly: start, interiors, end
                         final_ids = []
                         if start_id is not None:
@@ -3979,93 +4959,82 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             curve['arc_point_ids'] = ids
 
         # Now write points, lines, curves and SQL (points may have been created above)
-        with open(points_file, 'w') as f:
+        # ensure real coords exist (batch transform of any points missing them)
+        self.fill_real_coords(self.user_points)
+        # Rows are streamed through a 1 MB write buffer instead of being collected first
+        with open(points_file, 'w', buffering=1 << 20) as f:
             f.write("ID,X,Y,Z\n")
-            for point in self.user_points:
-                # ensure real coords exist
-                if 'real_x' not in point or 'real_y' not in point:
-                    rx, ry = self.transform_point(point.get('pdf_x', 0.0), point.get('pdf_y', 0.0))
-                    point['real_x'] = round(rx, 2)
-                    point['real_y'] = round(ry, 2)
-                # Swap Y and Z, and export as integers
-                x = int(round(point['real_x']))
-                z = int(round(point['real_y']))  # real_y becomes Z
-                y = int(round(point.get('z', 0.0)))  # z becomes Y
-                f.write(f"{point['id']},{x},{y},{z}\n")
-
-        with open(lines_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['LineID', 'StartPointID', 'EndPointID', 'StartPointZ', 'EndPointZ'])
-            for line in self.lines:
-                start_id = line['start_id']
-                end_id = line['end_id']
-                start_z = next((p.get('z') for p in self.user_points if p['id'] == start_id), None)
-                end_z = next((p.get('z') for p in self.user_points if p['id'] == end_id), None)
-                writer.writerow([line['id'], start_id, end_id, start_z, end_z])
-
-        with open(curves_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            # Per-user requirement: Position,PointID,LineID (exactly total_positions rows per curve)
-            writer.writerow(['Position', 'PointID', 'LineID'])
-            for curve in self.curves:
-                line_id = next((l['id'] for l in self.lines if
-                                (l['start_id'] == curve.get('start_id') and l['end_id'] == curve.get('end_id')) or
-                                (l['start_id'] == curve.get('end_id') and l['end_id'] == curve.get('start_id'))
-                                ), 0)
-                base_line_id = curve.get('base_line_id', line_id)
-                ids = curve.get('arc_point_ids', [])
-                for pos in range(total_positions):
-                    pid = ids[pos] if pos < len(ids) else ids[-1]
-                    writer.writerow([pos, pid, base_line_id])
+            # Swap Y and Z (real_y becomes Z, z becomes Y), and export as integers
+            f.writelines(
+                f"{point['id']},{int(round(point['real_x']))},{int(round(point.get('z', 0.0)))},{int(round(point['real_y']))}\n"
+                for point in self.user_points
+            )
 
-        # Generate SQL file with IDENTITY_INSERT
-        with open(sql_file, 'w') as f:
-            f.write("-- SQL Insert Script for SeasPathDB\n")
-            f.write("-- Generated from 3DMaker Export\n\n")
+        # Lines CSV (Z values as stored; empty fields for missing endpoints)
+        write_lines_z_csv(lines_file, self.lines, points_by_id)
 
+        # Endpoint pair -> first matching line id
+        lines_by_endpoints = {}
+        for l in self.lines:
+            lines_by_endpoints.setdefault(frozenset((l['start_id'], l['end_id'])), l['id'])
+
+        # Resolve (position, point id, edge id) rows for every curve once;
+        # shared by the curves CSV and the SQL curve section
+        curve_rows = []
+        for curve in self.curves:
+            line_id = lines_by_endpoints.get(frozenset((curve.get('start_id'), curve.get('end_id'))), 0)
+            edge_id = curve.get('base_line_id', line_id)
+            ids = curve.get('arc_point_ids', [])
+            for pos in range(total_positions):
+                pid = ids[pos] if pos < len(ids) else ids[-1]
+                curve_rows.append((pos, pid, edge_id))
+
+        with open(curves_file, 'w', newline='', buffering=1 << 20) as f:
+            # Per-user requirement: Position,PointID,LineID (exactly total_positions rows per curve);
+            # rows are formatted directly with csv.writer's CRLF ending; a null
+            # base_line_id is written as an empty field, as csv.writer did
+            f.write("Position,PointID,LineID\r\n")
+            f.writelines(f"{pos},{pid},{'' if edge_id is None else edge_id}\r\n"
+                         for pos, pid, edge_id in curve_rows)
+
+        # Generate SQL file with IDENTITY_INSERT
+        parts = [
+            "-- SQL Insert Script for SeasPathDB\n",
+            "-- Generated from 3DMaker Export\n\n",
             # Remove existing data first (Curves, Lines, Points)
-            f.write("-- Clear existing data (order: Curves, Lines, Points)\n")
-            f.write("DELETE FROM SeasPathDB.dbo.Visualization_Curve;\n")
-            f.write("DELETE FROM SeasPathDB.dbo.Visualization_Edge;\n")
-            f.write("DELETE FROM SeasPathDB.dbo.Visualization_Coordinate;\n\n")
-
-            # Points table
-            f.write("-- Insert Visualization_Coordinate (Points)\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate ON;\n")
-            for point in self.user_points:
-                # Swap Y and Z, and export as integers
-                x = int(round(point['real_x']))
-                z = int(round(point['real_y']))  # real_y becomes Z
-                y = int(round(point.get('z', 0.0)))  # z becomes Y
-                desc = point.get('description', '3D Visualisation')
-                f.write(f"INSERT INTO SeasPathDB.dbo.Visualization_Coordinate (Id, X, Y, Z, Description) ")
-                f.write(f"VALUES ({point['id']}, {x}, {y}, {z}, '{desc}');\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate OFF;\n\n")
-
-            # Lines table
-            f.write("-- Insert Visualization_Edge (Lines)\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge ON;\n")
-            for line in self.lines:
-                f.write(f"INSERT INTO SeasPathDB.dbo.Visualization_Edge (Id, TailCoordenate, HeadCoordenate) ")
-                f.write(f"VALUES ({line['id']}, {line['start_id']}, {line['end_id']});\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge OFF;\n\n")
-
-            # Curves table
-            f.write("-- Insert Visualization_Curve (Curves)\n")
-            # Id column removed as requested
-            # f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve ON;\n")
-            for curve in self.curves:
-                line_id = next((l['id'] for l in self.lines if
-                                (l['start_id'] == curve.get('start_id') and l['end_id'] == curve.get('end_id')) or
-                                (l['start_id'] == curve.get('end_id') and l['end_id'] == curve.get('start_id'))
-                                ), 0)
-                edge_id = curve.get('base_line_id', line_id)
-                ids = curve.get('arc_point_ids', [])
-                for position in range(total_positions):
-                    pid = ids[position] if position < len(ids) else ids[-1]
-                    f.write(f"INSERT INTO SeasPathDB.dbo.Visualization_Curve (PositionNumber, CoordinateId, EdgeId) ")
-                    f.write(f"VALUES ({position}, {pid}, {edge_id});\n")
-            # f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve OFF;\n")
+            "-- Clear existing data (order: Curves, Lines, Points)\n",
+            "DELETE FROM SeasPathDB.dbo.Visualization_Curve;\n",
+            "DELETE FROM SeasPathDB.dbo.Visualization_Edge;\n",
+            "DELETE FROM SeasPathDB.dbo.Visualization_Coordinate;\n\n",
+        ]
+
+        # Points table
+        parts.append("-- Insert Visualization_Coordinate (Points)\n")
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate ON;\n")
+        # Swap Y and Z (real_y becomes Z, z becomes Y), and export as integers
+        parts.extend(sql_batches(SQL_COORD_INSERT, (
+            _SQL_COORD.format(id=point['id'],
+                              x=int(round(point['real_x'])),
+                              y=int(round(point.get('z', 0.0))),
+                              z=int(round(point['real_y'])),
+                              desc=point.get('description', '3D Visualisation'))
+            for point in self.user_points
+        )))
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate OFF;\n\n")
+
+        # Lines table
+        parts.append("-- Insert Visualization_Edge (Lines)\n")
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge ON;\n")
+        parts.extend(sql_batches(SQL_EDGE_INSERT, (SQL_EDGE.format_map(line) for line in self.lines)))
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge OFF;\n\n")
+
+        # Curves table
+        parts.append("-- Insert Visualization_Curve (Curves)\n")
+        # Id column removed as requested (no IDENTITY_INSERT for Visualization_Curve)
+        parts.extend(sql_batches(_SQL_CURVE_INSERT, (_SQL_CURVE.format(*row) for row in curve_rows)))
+
+        with open(sql_file, 'w', buffering=1 << 20) as f:
+            f.writelines(parts)
 
         messagebox.showinfo("Export Success", f"Exported data to {export_dir}\nFiles: {project_name}_points.txt, {project_name}_lines.txt, {project_name}_curves.txt, {project_name}_insert.sql")
 
@@ -4097,7 +5066,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             return (kind, item)
         
         # Multiple candidates: ask user which to select
-        from tkinter import simpledialog, messagebox
         choices = []
         for idx, (kind, item, dist) in enumerate(filtered, start=1):
             if kind == 'point':
@@ -4106,8 +5074,8 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             elif kind == 'line':
                 # Attempt to determine average Z of line endpoints
                 try:
-                    s = next(p for p in self.user_points if p['id'] == item['start_id'])
-                    e = next(p for p in self.user_points if p['id'] == item['end_id'])
+                    s = self._get_point_by_id(item['start_id'])
+                    e = self._get_point_by_id(item['end_id'])
                     z = (float(s.get('z', 0)) + float(e.get('z', 0))) / 2.0
                 except Exception:
                     z = 'n/a'
@@ -4155,7 +5123,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         entity_type, entity = selected
 
         # Ask for Z values with last used value as default
-        from tkinter import simpledialog
         prompt_text = "Enter Z values (comma-delimited):\nExample: 1,2,3"
         if self._last_z_value:
             prompt_text += f"\n\nLast used: {self._last_z_value}"
@@ -4169,25 +5136,29 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             return
 
         try:
-            z_values = [float(z.strip()) for z in z_input.split(',')]
+            # one C-level conversion of all fields; empty or non-numeric fields raise
+            z_array = np.array(z_input.split(','), dtype=np.float64)
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid Z values.")
             return
+        # plain floats so the duplicated point dicts serialize like any other
+        z_values = z_array.tolist()
         
         # Remember this Z value for next time
         self._last_z_value = z_input
 
-        # Duplicate based on entity type
-        if entity_type == 'point':
-            self.duplicate_point(entity, z_values)
-        elif entity_type == 'line':
-            self.duplicate_line(entity, z_values)
-        elif entity_type in ('curve', 'curve_arc', 'curve_baseline'):
-            self.duplicate_curve(entity, z_values)
+        # Duplicate based on entity type; views are refreshed once when the batch closes
+        with self._batch_updates():
+            if entity_type == 'point':
+                self.duplicate_point(entity, z_values)
+            elif entity_type == 'line':
+                self.duplicate_line(entity, z_values)
+            elif entity_type in ('curve', 'curve_arc', 'curve_baseline'):
+                self.duplicate_curve(entity, z_values)
 
-        self.redraw_markers()
-        self.update_points_label()
-        self.update_status(f"Duplicated {entity_type} at {len(z_values)} Z levels.")
+            self.redraw_markers()
+            self.update_points_label()
+            self.update_status(f"Duplicated {entity_type} at {len(z_values)} Z levels.")
 
     def export_pdf_to_png(self):
         """Export current PDF page to PNG at full resolution."""
@@ -4196,7 +5167,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             return
         
         # Ask for output file
-        from tkinter import filedialog
         
         initial_file = "export.png"
         if self._project_path:
@@ -4248,91 +5218,187 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 return existing
         return None
 
+    def _coord_index(self):
+        """Map integer-rounded (real_x, real_y, z) -> first point with those coords.
+
+        Same matching rule as find_point_by_coords, built once so the lookups
+        made while duplicating do not each rescan user_points.
+        """
+        index = {}
+        for p in self.user_points:
+            try:
+                key = (int(round(p.get('real_x', p.get('pdf_x', 0)))),
+                       int(round(p.get('real_y', p.get('pdf_y', 0)))),
+                       int(round(p.get('z', 0))))
+            except Exception:
+                continue
+            index.setdefault(key, p)
+        return index
+
     def duplicate_point(self, point, z_values):
-        for z in z_values:
-            new_point = point.copy()
-            # Use centralized helper to allocate a new point id
-            new_id = self.next_point_id()
-            new_point['id'] = new_id
-            new_point['z'] = z
-            self.user_points.append(new_point)
+        # Allocate all ids up front and add the copies in one extend
+        new_ids = self.next_point_ids(len(z_values))
+        new_points = [{**point, 'id': new_id, 'z': z} for new_id, z in zip(new_ids, z_values)]
+        self.user_points += new_points
+        self._picker_dirty = True
         self.mark_modified()
 
-    def duplicate_line(self, line, z_values):
+    def duplicate_line(self, line, z_values, dup_cache=None):
+        """Duplicate a line at each Z level.
+
+        dup_cache maps (source point id, z) -> duplicated point id. Pass the same
+        dict when duplicating several lines in one go so shared endpoints are
+        resolved once instead of by a coordinate scan per line.
+        """
+        if dup_cache is None:
+            dup_cache = {}
         # Check if this line is a baseline for any curve
         line_id = line.get('id')
         curve_using_line = next((c for c in self.curves if c.get('base_line_id') == line_id), None)
         
         if curve_using_line:
             # This line is a curve baseline - duplicate the entire curve instead
-            self.duplicate_curve(curve_using_line, z_values)
+            self.duplicate_curve(curve_using_line, z_values, dup_cache)
             return
         
         # Regular line duplication
+        # Get start and end points (local copy: staged points are added to it below)
+        pbid = dict(self.points_by_id)
+        start = pbid[line['start_id']]
+        end = pbid[line['end_id']]
+        # Loop invariants and bound methods hoisted out of the per-Z loop
+        start_real_x = start.get('real_x', start.get('pdf_x', 0))
+        start_real_y = start.get('real_y', start.get('pdf_y', 0))
+        end_real_x = end.get('real_x', end.get('pdf_x', 0))
+        end_real_y = end.get('real_y', end.get('pdf_y', 0))
+        start_xy = (int(round(start_real_x)), int(round(start_real_y)))
+        end_xy = (int(round(end_real_x)), int(round(end_real_y)))
+        coords = self._coord_index()
+        next_point_id = self.next_point_id
+        next_line_id = self.next_line_id
+        # New points are collected and appended with one extend; they are indexed
+        # by id and coords right away so later levels see them
+        new_points = []
         for z in z_values:
-            # Get start and end points
-            start = next(p for p in self.user_points if p['id'] == line['start_id'])
-            end = next(p for p in self.user_points if p['id'] == line['end_id'])
-
+            z_key = int(round(z))
             # Determine or create start point at new Z level
-            start_real_x = start.get('real_x', start.get('pdf_x', 0))
-            start_real_y = start.get('real_y', start.get('pdf_y', 0))
-            existing_start = self.find_point_by_coords(start_real_x, start_real_y, z)
-            if existing_start:
-                start_id = existing_start['id']
-            else:
-                start_id = self.next_point_id()
-                new_start = start.copy()
-                new_start['id'] = start_id
-                new_start['z'] = z
-                self.user_points.append(new_start)
+            start_id = dup_cache.get((start['id'], z))
+            if start_id is None:
+                existing_start = coords.get(start_xy + (z_key,))
+                if existing_start:
+                    start_id = existing_start['id']
+                else:
+                    start_id = next_point_id()
+                    new_start = start.copy()
+                    new_start['id'] = start_id
+                    new_start['z'] = z
+                    new_points.append(new_start)
+                    pbid[start_id] = new_start
+                    coords[start_xy + (z_key,)] = new_start
+                dup_cache[(start['id'], z)] = start_id
 
             # Determine or create end point at new Z level
-            end_real_x = end.get('real_x', end.get('pdf_x', 0))
-            end_real_y = end.get('real_y', end.get('pdf_y', 0))
-            existing_end = self.find_point_by_coords(end_real_x, end_real_y, z)
-            if existing_end:
-                end_id = existing_end['id']
-            else:
-                end_id = self.next_point_id()
-                new_end = end.copy()
-                new_end['id'] = end_id
-                new_end['z'] = z
-                self.user_points.append(new_end)
+            end_id = dup_cache.get((end['id'], z))
+            if end_id is None:
+                existing_end = coords.get(end_xy + (z_key,))
+                if existing_end:
+                    end_id = existing_end['id']
+                else:
+                    end_id = next_point_id()
+                    new_end = end.copy()
+                    new_end['id'] = end_id
+                    new_end['z'] = z
+                    new_points.append(new_end)
+                    pbid[end_id] = new_end
+                    coords[end_xy + (z_key,)] = new_end
+                dup_cache[(end['id'], z)] = end_id
 
             # Create new line id
-            new_lid = self.next_line_id()
+            new_lid = next_line_id()
 
             new_line = line.copy()
             new_line['id'] = new_lid
             new_line['start_id'] = start_id
             new_line['end_id'] = end_id
             self.lines.append(new_line)
+        self.user_points += new_points
+        self._picker_dirty = True
         self.mark_modified()
 
-    def duplicate_curve(self, curve, z_values):
-        for z in z_values:
+    def duplicate_curve(self, curve, z_values, dup_cache=None):
+        """Duplicate a curve (arc points and baseline) at each Z level; see duplicate_line for dup_cache."""
+        if dup_cache is None:
+            dup_cache = {}
+        # id -> point index, copied once and kept current by add_point below
+        pbid = dict(self.points_by_id)
+        # rounded coords -> point, replaces a find_point_by_coords scan per lookup
+        coords = self._coord_index()
+        next_point_id = self.next_point_id
+        # New points are collected and appended with one extend at the end
+        new_points = []
+
+        def add_point(point):
+            new_points.append(point)
+            pbid[point['id']] = point
+
+        # Arc source points and their coordinates do not depend on Z
+        arc_sources = []
+        for arc_point_id in curve['arc_point_ids']:
+            orig_point = pbid[arc_point_id]
+            arc_sources.append((orig_point,
+                                orig_point.get('real_x', orig_point.get('pdf_x', 0)),
+                                orig_point.get('real_y', orig_point.get('pdf_y', 0))))
+        # Coordinate keys for every (level, arc point) pair at once: the rounded
+        # source x/y tiled per level next to the level z repeated per source
+        n_levels, n_arc = len(z_values), len(arc_sources)
+        if n_levels == 1:
+            # single level (the usual case): plain rounding beats the array setup
+            z_key = int(round(z_values[0]))
+            arc_keys = [[(int(round(rx)), int(round(ry)), z_key) for _, rx, ry in arc_sources]]
+        else:
+            src_xy = np.array([(rx, ry) for _, rx, ry in arc_sources], dtype=np.float64).reshape(n_arc, 2)
+            level_z = np.asarray(z_values, dtype=np.float64)
+            arc_keys = np.rint(np.column_stack([np.tile(src_xy, (n_levels, 1)), np.repeat(level_z, n_arc)]))
+            arc_keys = arc_keys.astype(np.int64).reshape(n_levels, n_arc, 3).tolist()
+        # Neither does the baseline and its endpoints
+        base_line_id = curve.get('base_line_id')
+        base_line = start = end = None
+        if base_line_id:
+            base_line = self._get_line_by_id(base_line_id)
+            if base_line:
+                start = pbid.get(base_line['start_id'])
+                end = pbid.get(base_line['end_id'])
+        if start and end:
+            start_real_x = start.get('real_x', start.get('pdf_x', 0))
+            start_real_y = start.get('real_y', start.get('pdf_y', 0))
+            end_real_x = end.get('real_x', end.get('pdf_x', 0))
+            end_real_y = end.get('real_y', end.get('pdf_y', 0))
+
+        for z, level_keys in zip(z_values, arc_keys):
             # Duplicate all arc points at new Z level
             new_arc_point_ids = []
-            for arc_point_id in curve['arc_point_ids']:
-                orig_point = next(p for p in self.user_points if p['id'] == arc_point_id)
-                real_x = orig_point.get('real_x', orig_point.get('pdf_x', 0))
-                real_y = orig_point.get('real_y', orig_point.get('pdf_y', 0))
-                existing = self.find_point_by_coords(real_x, real_y, z)
-                if existing:
-                    new_arc_point_ids.append(existing['id'])
-                    continue
-                new_point = orig_point.copy()
-                new_pid = self.next_point_id()
-                new_point['id'] = new_pid
-                new_point['z'] = z
-                self.user_points.append(new_point)
+            for (orig_point, _, _), ckey in zip(arc_sources, level_keys):
+                key = (orig_point['id'], z)
+                new_pid = dup_cache.get(key)
+                if new_pid is None:
+                    ckey = tuple(ckey)
+                    existing = coords.get(ckey)
+                    if existing:
+                        new_pid = existing['id']
+                    else:
+                        new_point = orig_point.copy()
+                        new_pid = next_point_id()
+                        new_point['id'] = new_pid
+                        new_point['z'] = z
+                        add_point(new_point)
+                        coords[ckey] = new_point
+                    dup_cache[key] = new_pid
                 new_arc_point_ids.append(new_pid)
 
             # Build new arc_points_real list so 3D view uses the duplicated Z level
             new_arc_points_real = []
             for pid in new_arc_point_ids:
-                point_ref = next((p for p in self.user_points if p['id'] == pid), None)
+                point_ref = pbid.get(pid)
                 if not point_ref:
                     continue
                 rx = int(round(point_ref.get('real_x', point_ref.get('pdf_x', 0))))
@@ -4341,52 +5407,50 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 new_arc_points_real.append((rx, ry, rz))
 
             # Duplicate the baseline if it exists
-            base_line_id = curve.get('base_line_id')
             new_base_line_id = 0
             new_start_id = None
             new_end_id = None
-            
-            if base_line_id:
-                base_line = next((l for l in self.lines if l.get('id') == base_line_id), None)
-                if base_line:
-                    # Get baseline endpoints
-                    start = next((p for p in self.user_points if p['id'] == base_line['start_id']), None)
-                    end = next((p for p in self.user_points if p['id'] == base_line['end_id']), None)
-                    
-                    if start and end:
-                        # Create new start point
-                        start_real_x = start.get('real_x', start.get('pdf_x', 0))
-                        start_real_y = start.get('real_y', start.get('pdf_y', 0))
-                        existing_start = self.find_point_by_coords(start_real_x, start_real_y, z)
-                        if existing_start:
-                            new_start_id = existing_start['id']
-                        else:
-                            new_start = start.copy()
-                            new_start_id = self.next_point_id()
-                            new_start['id'] = new_start_id
-                            new_start['z'] = z
-                            self.user_points.append(new_start)
-                        
-                        # Create new end point
-                        end_real_x = end.get('real_x', end.get('pdf_x', 0))
-                        end_real_y = end.get('real_y', end.get('pdf_y', 0))
-                        existing_end = self.find_point_by_coords(end_real_x, end_real_y, z)
-                        if existing_end:
-                            new_end_id = existing_end['id']
-                        else:
-                            new_end = end.copy()
-                            new_end_id = self.next_point_id()
-                            new_end['id'] = new_end_id
-                            new_end['z'] = z
-                            self.user_points.append(new_end)
-                        
-                        # Create new baseline
-                        new_base_line = base_line.copy()
-                        new_base_line_id = self.next_line_id()
-                        new_base_line['id'] = new_base_line_id
-                        new_base_line['start_id'] = new_start_id
-                        new_base_line['end_id'] = new_end_id
-                        self.lines.append(new_base_line)
+
+            if start and end:
+                # Create new start point (usually already resolved as the first arc point)
+                new_start_id = dup_cache.get((start['id'], z))
+                if new_start_id is None:
+                    ckey = (int(round(start_real_x)), int(round(start_real_y)), int(round(z)))
+                    existing_start = coords.get(ckey)
+                    if existing_start:
+                        new_start_id = existing_start['id']
+                    else:
+                        new_start = start.copy()
+                        new_start_id = next_point_id()
+                        new_start['id'] = new_start_id
+                        new_start['z'] = z
+                        add_point(new_start)
+                        coords[ckey] = new_start
+                    dup_cache[(start['id'], z)] = new_start_id
+
+                # Create new end point
+                new_end_id = dup_cache.get((end['id'], z))
+                if new_end_id is None:
+                    ckey = (int(round(end_real_x)), int(round(end_real_y)), int(round(z)))
+                    existing_end = coords.get(ckey)
+                    if existing_end:
+                        new_end_id = existing_end['id']
+                    else:
+                        new_end = end.copy()
+                        new_end_id = next_point_id()
+                        new_end['id'] = new_end_id
+                        new_end['z'] = z
+                        add_point(new_end)
+                        coords[ckey] = new_end
+                    dup_cache[(end['id'], z)] = new_end_id
+
+                # Create new baseline
+                new_base_line = base_line.copy()
+                new_base_line_id = self.next_line_id()
+                new_base_line['id'] = new_base_line_id
+                new_base_line['start_id'] = new_start_id
+                new_base_line['end_id'] = new_end_id
+                self.lines.append(new_base_line)
 
             # Create new curve
             new_curve = curve.copy()
@@ -4405,11 +5469,12 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 new_curve['end_id'] = new_end_id
                 
             self.curves.append(new_curve)
+        self.user_points += new_points
+        self._picker_dirty = True
         self.mark_modified()
 
     def merge_duplicate_points(self):
         """Merge all points with identical 3D coordinates into the point with lowest ID."""
-        from tkinter import messagebox
         
         if not self.user_points:
             messagebox.showinfo("Merge Duplicates", "No points to merge.")
@@ -4525,10 +5590,11 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             issues.append(f"Found {duplicate_points_count} duplicate points (same X, Y, Z).")
 
         # 2. Check lines for start and end point on the same z level
+        pbid = self.points_by_id
         lines_with_z_mismatch = []
         for line in self.lines:
-            start = next((p for p in self.user_points if p['id'] == line['start_id']), None)
-            end = next((p for p in self.user_points if p['id'] == line['end_id']), None)
+            start = pbid.get(line['start_id'])
+            end = pbid.get(line['end_id'])
             
             if start and end:
                 if abs(float(start.get('z', 0)) - float(end.get('z', 0))) > 0.001:
@@ -4545,29 +5611,29 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             
             # Check start point
             if 'start_id' in curve:
-                p = next((p for p in self.user_points if p['id'] == curve['start_id']), None)
+                p = pbid.get(curve['start_id'])
                 if p and abs(float(p.get('z', 0)) - curve_z) > 0.001:
                     mismatch = True
             
             # Check end point
             if 'end_id' in curve:
-                p = next((p for p in self.user_points if p['id'] == curve['end_id']), None)
+                p = pbid.get(curve['end_id'])
                 if p and abs(float(p.get('z', 0)) - curve_z) > 0.001:
                     mismatch = True
             
             # Check arc points
             for pid in curve.get('arc_point_ids', []):
-                p = next((p for p in self.user_points if p['id'] == pid), None)
+                p = pbid.get(pid)
                 if p and abs(float(p.get('z', 0)) - curve_z) > 0.001:
                     mismatch = True
             
             # Check base line
             base_line_id = curve.get('base_line_id')
             if base_line_id:
-                line = next((l for l in self.lines if l['id'] == base_line_id), None)
+                line = self._get_line_by_id(base_line_id)
                 if line:
-                    start = next((p for p in self.user_points if p['id'] == line['start_id']), None)
-                    end = next((p for p in self.user_points if p['id'] == line['end_id']), None)
+                    start = pbid.get(line['start_id'])
+                    end = pbid.get(line['end_id'])
                     if start and abs(float(start.get('z', 0)) - curve_z) > 0.001:
                         mismatch = True
                     if end and abs(float(end.get('z', 0)) - curve_z) > 0.001:
@@ -4579,7 +5645,6 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         if curves_with_z_mismatch:
             issues.append(f"Found {len(curves_with_z_mismatch)} curves with Z level inconsistencies (IDs: {', '.join(map(str, curves_with_z_mismatch[:10]))}{'...' if len(curves_with_z_mismatch) > 10 else ''}).")
 
-        from tkinter import messagebox
         if not issues:
             messagebox.showinfo("Project Audit", "Audit passed! No issues found.")
         else:
@@ -4774,9 +5839,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
     def _build_line_curve_adjacency(self, valid_point_ids=None):
         adjacency = {}
-        for line in self.lines:
-            if line.get('hidden', False):
-                continue
+        for line in self._visible(self.lines):
             start_id = line.get('start_id')
             end_id = line.get('end_id')
             if start_id is None or end_id is None:
@@ -4786,9 +5849,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             edge = {'type': 'line', 'id': line.get('id'), 'target': end_id, 'source': start_id}
             adjacency.setdefault(start_id, []).append(edge)
 
-        for curve in self.curves:
-            if curve.get('hidden', False):
-                continue
+        for curve in self._visible(self.curves):
             start_id = curve.get('start_id')
             end_id = curve.get('end_id')
             if start_id is None or end_id is None:
@@ -4881,40 +5942,14 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
 
     def hide_all_elements(self):
-        # Hide existing points
-        for marker_id in self.point_markers.values():
-            self.canvas.itemconfig(marker_id, state='hidden')
-        # Hide existing lines
-        for line in self.lines:
-            if 'canvas_id' in line:
-                self.canvas.itemconfig(line['canvas_id'], state='hidden')
-            if 'text_id' in line:
-                self.canvas.itemconfig(line['text_id'], state='hidden')
-        # Hide existing curves and their markers
-        for curve in self.curves:
-            if 'canvas_id' in curve:
-                self.canvas.itemconfig(curve['canvas_id'], state='hidden')
-            for marker_id in curve.get('arc_point_marker_ids', []):
-                self.canvas.itemconfig(marker_id, state='hidden')
+        # Hide existing points, lines (with labels), curves and their markers in one Tcl call
+        self.canvas.itemconfigure(_TOGGLEABLE_TAGS, state='hidden')
         self.elements_hidden = True
         self.update_status("All existing elements hidden. New elements will be visible.")
 
     def show_all_elements(self):
-        # Show all points
-        for marker_id in self.point_markers.values():
-            self.canvas.itemconfig(marker_id, state='normal')
-        # Show all lines
-        for line in self.lines:
-            if 'canvas_id' in line:
-                self.canvas.itemconfig(line['canvas_id'], state='normal')
-            if 'text_id' in line:
-                self.canvas.itemconfig(line['text_id'], state='normal')
-        # Show all curves and their markers
-        for curve in self.curves:
-            if 'canvas_id' in curve:
-                self.canvas.itemconfig(curve['canvas_id'], state='normal')
-            for marker_id in curve.get('arc_point_marker_ids', []):
-                self.canvas.itemconfig(marker_id, state='normal')
+        # Show all points, lines, curves and their markers
+        self.canvas.itemconfigure(_TOGGLEABLE_TAGS, state='normal')
         self.elements_hidden = False
         self.update_status("All elements shown.")
 
@@ -4943,6 +5978,7 @@ class PDFViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             except Exception as e:
                 print(f"Could not delete backup file: {e}")
         
+        self._cancel_render()
         self.master.destroy()
 
     def mark_modified(self):
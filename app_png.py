@@ -7,13 +7,12 @@ import shutil
 import datetime
 import os
 import numpy as np
-import json
-import csv
+from collections import OrderedDict
 from calibration import CalibrationMixin
 from points_lines import PointsLinesMixin
 from curves import CurvesMixin
 from deletion import DeletionMixin
-from utils import UtilsMixin
+from utils import UtilsMixin, ListSnapshotCache, index_by_id
 
 # digitizer helpers (migration, id allocation, schema validation)
 try:
@@ -25,6 +24,17 @@ except Exception:
     migrate_project = None
     validate_project = None
 
+from digitizer.jsonio import load_json, dump_json
+from digitizer.kernels import padded_bounds
+from digitizer.exporter import (write_lines_z_csv, sql_batches, SQL_COORD_INSERT,
+                                 SQL_EDGE_INSERT, SQL_EDGE)
+
+
+# Viewer-specific row templates for the SQL export (shared ones are in digitizer.exporter)
+_SQL_COORD = "({id}, {x}, {y}, {z}, '3D Visualisation')"
+_SQL_CURVE_INSERT = "INSERT INTO SeasPathDB.dbo.Visualization_Curve (Id, PositionNumber, CoordinateId, EdgeId) VALUES\n"
+_SQL_CURVE = "({0}, {1}, {2}, {3})"
+
 
 class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixin, UtilsMixin):
     def __init__(self, root):
@@ -46,6 +56,12 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.image_path = None
         self.current_page = 0
         self.total_pages = 0
+        # zoom -> (PIL image, PhotoImage, bytes) LRU of resized renders, so returning to a
+        # previous zoom level skips the LANCZOS resize; cleared by close_file()
+        self._pix_cache = OrderedDict()
+        self._pix_cache_max = 8
+        self._pix_cache_budget = 256 * 1024 * 1024
+        self._pix_cache_bytes = 0
         self.zoom_level = 1.0
         self.photo_image = None
         self.canvas_image = None
@@ -58,6 +74,8 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.reference_points_image = []
         self.reference_points_real = []
         self.user_points = []
+        # id -> point dict shared by redraws; see _point_index()
+        self._pt_by_id = ListSnapshotCache(index_by_id)
         
         # Track backup file created on project load for cleanup
         self._current_backup_file = None
@@ -99,6 +117,8 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self.point_markers = {}
         self.point_labels = {}
         self.calibration_markers = {}
+        # display options the marker items were last styled with (see redraw_markers)
+        self._marker_style = None
         self.zoom_entry = None
         self.points_label = None
         self.calib_status = None
@@ -250,6 +270,11 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         # 3D view tab (matplotlib) - created lazily
         self.view3d_frame = tk.Frame(self.notebook)
         self.notebook.add(self.view3d_frame, text="3D View")
+        # Editor lists and the 3D plot are only refreshed while their tab is
+        # showing; the tab change handler catches up whatever went stale meanwhile
+        self._editor_lists_stale = False
+        self._3d_dirty = True
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_notebook_tab_changed, add='+')
 
         self.canvas.bind("<MouseWheel>", self.on_mousewheel)
         self.canvas.bind("<Button-4>", self.on_mousewheel)
@@ -379,6 +404,9 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         self._3d_curve_color = 'purple'
         self._3d_theme = 'default'
         self._3d_show_grid = True
+        # per-point/per-line id labels are one Text artist each; they can be turned
+        # off from the 3D toolbar when they dominate redraw time on large projects
+        self._3d_show_labels = True
         self._3d_elev = 30
         self._3d_azim = -60
 
@@ -421,7 +449,10 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         grid_btn.config(variable=grid_btn_var)
         grid_btn.pack(side='left', padx=(8, 0))
 
-        self._3d_toolbar_vars = {'theme_cb': theme_cb, 'grid_var': grid_btn_var}
+        labels_var = tk.BooleanVar(value=self._3d_show_labels)
+        tk.Checkbutton(toolbar, text='Labels', variable=labels_var, command=self.toggle_3d_labels).pack(side='left')
+
+        self._3d_toolbar_vars = {'theme_cb': theme_cb, 'grid_var': grid_btn_var, 'labels_var': labels_var}
 
         self._3d_canvas.get_tk_widget().pack(fill='both', expand=True)
         # Add Matplotlib navigation toolbar (rotate/pan/zoom)
@@ -814,9 +845,18 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 pass
             self.update_status(f'Z-Level validation found {len(issues)} inconsistencies')
 
+    def _point_index(self):
+        """Return an id -> point dict for self.user_points.
+
+        The dict is kept in a ListSnapshotCache and reused until the list
+        changes, so the lookups made by one redraw (and successive redraws of an
+        unchanged project) share a single build.
+        """
+        return self._pt_by_id.get(self.user_points)
+
     def _get_point_by_id(self, pid):
         try:
-            return next((p for p in self.user_points if p.get('id') == pid), None)
+            return self._point_index().get(pid)
         except Exception:
             return None
 
@@ -937,6 +977,69 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self.update_status(f'Created {changed} new end point(s) and updated lines')
 
     def refresh_editor_lists(self):
+        # The treeviews are only rebuilt while the Editor tab is showing; when
+        # hidden they are marked stale and caught up by _on_notebook_tab_changed
+        try:
+            visible = bool(self.points_tv.winfo_ismapped())
+        except Exception:
+            visible = True
+        if visible:
+            self._editor_lists_stale = False
+            self._refresh_editor_trees()
+        else:
+            self._editor_lists_stale = True
+
+        # Update combobox options for point IDs
+        try:
+            ids = [p['id'] for p in self.user_points]
+            self.line_start_cb['values'] = ids
+            self.line_end_cb['values'] = ids
+        except Exception:
+            pass
+        # Ensure UI updates immediately
+        try:
+            self.master.update_idletasks()
+        except Exception:
+            pass
+
+        # Update Lines/Curves counters if present (keep in sync with lists)
+        try:
+            if hasattr(self, 'lines_label') and self.lines_label is not None:
+                try:
+                    self.lines_label.config(text=f"Lines: {len(self.lines)}")
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        try:
+            if hasattr(self, 'curves_label') and self.curves_label is not None:
+                try:
+                    self.curves_label.config(text=f"Curves: {len(self.curves)}")
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+    def _on_notebook_tab_changed(self, event=None):
+        """Catch up the editor lists and 3D plot skipped while their tab was hidden."""
+        try:
+            current = self.notebook.select()
+        except Exception:
+            return
+        try:
+            if self._editor_lists_stale and current == str(self.editor_frame):
+                self._editor_lists_stale = False
+                self._refresh_editor_trees()
+        except Exception:
+            pass
+        try:
+            if self._3d_dirty and current == str(self.view3d_frame):
+                self.update_3d_plot()
+        except Exception:
+            pass
+
+    def _refresh_editor_trees(self):
+        """Repopulate the points/lines/curves/RFID treeviews of the Editor tab."""
         # Points
         try:
             # treeview: clear and populate
@@ -978,8 +1081,8 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     if 'z' in l:
                         zval = l.get('z')
                     else:
-                        s = next((p for p in self.user_points if p['id'] == start), None)
-                        e = next((p for p in self.user_points if p['id'] == end), None)
+                        s = self._get_point_by_id(start)
+                        e = self._get_point_by_id(end)
                         if s is not None and e is not None:
                             zval = (float(s.get('z', 0)) + float(e.get('z', 0))) / 2.0
                 except Exception:
@@ -1008,37 +1111,6 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         except Exception:
             pass
 
-        # Update combobox options for point IDs
-        try:
-            ids = [p['id'] for p in self.user_points]
-            self.line_start_cb['values'] = ids
-            self.line_end_cb['values'] = ids
-        except Exception:
-            pass
-        # Ensure UI updates immediately
-        try:
-            self.master.update_idletasks()
-        except Exception:
-            pass
-
-        # Update Lines/Curves counters if present (keep in sync with lists)
-        try:
-            if hasattr(self, 'lines_label') and self.lines_label is not None:
-                try:
-                    self.lines_label.config(text=f"Lines: {len(self.lines)}")
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if hasattr(self, 'curves_label') and self.curves_label is not None:
-                try:
-                    self.curves_label.config(text=f"Curves: {len(self.curves)}")
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
     def _treeview_sort(self, tree, column):
         """Sort a Treeview by `column`. Toggles ascending/descending each click."""
         try:
@@ -1975,8 +2047,8 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 return
 
             # validate points exist
-            s = next((p for p in self.user_points if p['id'] == start_id), None)
-            e = next((p for p in self.user_points if p['id'] == end_id), None)
+            s = self._get_point_by_id(start_id)
+            e = self._get_point_by_id(end_id)
             if s is None or e is None:
                 messagebox.showerror('Invalid ID', 'One or both point IDs do not exist.')
                 return
@@ -2031,7 +2103,7 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     src_id = int(self.points_tv.item(iid, 'values')[0])
                 except Exception:
                     continue
-                src = next((p for p in self.user_points if p['id'] == src_id), None)
+                src = self._get_point_by_id(src_id)
                 if src is None:
                     continue
                 # create duplicate with same Z initially; user can edit Z afterwards via editor
@@ -2298,6 +2370,16 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
     # note: clearing of 'just_duplicated' is handled when the user makes an edit
 
     def update_3d_plot(self):
+        # Matplotlib redraws are only worth doing while the 3D tab is showing
+        try:
+            visible = self.notebook.select() == str(self.view3d_frame)
+        except Exception:
+            visible = True
+        if not visible:
+            self._3d_dirty = True
+            return
+        self._3d_dirty = False
+
         # Initialize if needed
         if not self._3d_initialized:
             self._init_3d_canvas()
@@ -2308,79 +2390,77 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         ax.cla()
 
         # Apply theme
-        if self._3d_theme == 'dark':
-            ax.set_facecolor('#222222')
-            self._3d_fig.patch.set_facecolor('#222222')
-        else:
-            ax.set_facecolor('white')
-            self._3d_fig.patch.set_facecolor('white')
+        self._apply_3d_theme()
+
+        # (k, 3) coordinate blocks of everything plotted; reduced once for autoscaling
+        extents = []
 
-        # Prepare accumulators for autoscaling and plotting
-        all_x = []
-        all_y = []
-        all_z = []
+        show_labels = self._3d_show_labels
+        label_color = 'white' if self._3d_theme == 'dark' else 'black'
 
-        # Plot points (mirror along Y by negating Y coordinates)
+        # Plot points (mirror along Y by negating Y coordinates) with a single scatter call
         pts = [p for p in self.user_points if not p.get('hidden', False)]
-        xs = [p.get('real_x', p.get('image_x')) for p in pts]
-        ys = [-(p.get('real_y', p.get('image_y'))) for p in pts]
-        zs = [float(p.get('z', 0)) for p in pts]
-        if xs and ys and zs:
+        n_pts = len(pts)
+        xs = np.fromiter((p.get('real_x', p.get('image_x', 0.0)) for p in pts), dtype=np.float64, count=n_pts)
+        ys = -np.fromiter((p.get('real_y', p.get('image_y', 0.0)) for p in pts), dtype=np.float64, count=n_pts)
+        zs = np.fromiter((float(p.get('z', 0)) for p in pts), dtype=np.float64, count=n_pts)
+        if n_pts:
             ax.scatter(xs, ys, zs, c=self._3d_point_color, s=self._3d_point_size)
+            extents.append(np.column_stack((xs, ys, zs)))
             # Add labels for each visible point (ID) near the point marker
-            try:
-                for p in pts:
-                    px = p.get('real_x', p.get('image_x'))
-                    py = -(p.get('real_y', p.get('image_y')))
-                    pz = float(p.get('z', 0))
-                    pid = p.get('id')
-                    if pid is not None:
-                        ax.text(px, py, pz + 0.01, str(pid), color='white' if self._3d_theme == 'dark' else 'black', fontsize=8)
-                    all_x.append(px)
-                    all_y.append(py)
-                    all_z.append(pz)
-            except Exception:
-                pass
+            if show_labels:
+                try:
+                    for p, px, py, pz in zip(pts, xs.tolist(), ys.tolist(), zs.tolist()):
+                        pid = p.get('id')
+                        if pid is not None:
+                            ax.text(px, py, pz + 0.01, str(pid), color=label_color, fontsize=8)
+                except Exception:
+                    pass
 
-        # Plot lines (use safe lookups so missing keys don't abort the entire 3D update)
+        # Plot lines: fill one (n, 2, 3) segment array and draw it as a single
+        # Line3DCollection instead of one ax.plot artist per line
+        pt_by_id = self._point_index()
+        segs = np.empty((len(self.lines), 2, 3), dtype=np.float64)
+        line_ids = []
         for line in self.lines:
             try:
                 # Skip lines flagged hidden
                 if line.get('hidden', False):
                     continue
-                start = next(p for p in self.user_points if p['id'] == line['start_id'])
-                end = next(p for p in self.user_points if p['id'] == line['end_id'])
+                start = pt_by_id[line['start_id']]
+                end = pt_by_id[line['end_id']]
                 # Safe coordinate extraction with fallbacks
-                sx = start.get('real_x', start.get('image_x', 0.0))
-                sy = -(start.get('real_y', start.get('image_y', 0.0)))
-                sz = float(start.get('z', 0.0))
-
-                ex = end.get('real_x', end.get('image_x', 0.0))
-                ey = -(end.get('real_y', end.get('image_y', 0.0)))
-                ez = float(end.get('z', 0.0))
-
-                ax.plot([sx, ex], [sy, ey], [sz, ez], c=self._3d_line_color)
-
-                # Add a label at the midpoint of the line
-                try:
-                    mid_x = (sx + ex) / 2.0
-                    mid_y = (sy + ey) / 2.0
-                    mid_z = (sz + ez) / 2.0
-                    label_color = 'white' if self._3d_theme == 'dark' else 'black'
-                    lid = line.get('id')
-                    if lid is not None:
-                        ax.text(mid_x, mid_y, mid_z + 0.01, str(lid), color=label_color, fontsize=8)
-                except Exception:
-                    pass
-                # include endpoints in autoscale
-                all_x.extend([sx, ex])
-                all_y.extend([sy, ey])
-                all_z.extend([sz, ez])
+                segs[len(line_ids)] = (
+                    (start.get('real_x', start.get('image_x', 0.0)),
+                     -(start.get('real_y', start.get('image_y', 0.0))),
+                     float(start.get('z', 0.0))),
+                    (end.get('real_x', end.get('image_x', 0.0)),
+                     -(end.get('real_y', end.get('image_y', 0.0))),
+                     float(end.get('z', 0.0))))
+                line_ids.append(line.get('id'))
             except Exception:
                 # If anything goes wrong for this line, skip it but continue plotting others
                 continue
+        segs = segs[:len(line_ids)]
+        if len(segs):
+            try:
+                from mpl_toolkits.mplot3d.art3d import Line3DCollection
+                ax.add_collection3d(Line3DCollection(segs, colors=self._3d_line_color))
+            except Exception:
+                pass
+            # include endpoints in autoscale
+            extents.append(segs.reshape(-1, 3))
+            # Add a label at the midpoint of each line
+            if show_labels:
+                try:
+                    for lid, (mid_x, mid_y, mid_z) in zip(line_ids, segs.mean(axis=1).tolist()):
+                        if lid is not None:
+                            ax.text(mid_x, mid_y, mid_z + 0.01, str(lid), color=label_color, fontsize=8)
+                except Exception:
+                    pass
 
-        # Plot curves
+        # Plot curves (collected into one Line3DCollection below)
+        curve_segs = []
         for curve in self.curves:
             # Skip curves flagged hidden
             if curve.get('hidden', False):
@@ -2401,7 +2481,7 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                         z = None
                         if i < len(ids):
                             pid = ids[i]
-                            p = next((u for u in self.user_points if u['id'] == pid), None)
+                            p = pt_by_id.get(pid)
                             if p:
                                 z = float(p.get('z', 0))
                         if z is None:
@@ -2409,7 +2489,7 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                         pts.append((x, y, z))
             else:
                 for pid in curve.get('arc_point_ids', []):
-                    p = next((u for u in self.user_points if u['id'] == pid), None)
+                    p = pt_by_id.get(pid)
                     if p:
                         pts.append((p.get('real_x', p.get('image_x')), p.get('real_y', p.get('image_y')), float(p.get('z', 0))))
 
@@ -2419,25 +2499,21 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             xs = [t[0] for t in pts]
             ys = [-(t[1]) for t in pts]
             zs = [t[2] for t in pts]
-            ax.plot(xs, ys, zs, c=self._3d_curve_color)
-            all_x.extend(xs)
-            all_y.extend(ys)
-            all_z.extend(zs)
+            curve_segs.append(list(zip(xs, ys, zs)))
+            extents.append(np.column_stack((xs, ys, zs)))
+        if curve_segs:
+            try:
+                from mpl_toolkits.mplot3d.art3d import Line3DCollection
+                ax.add_collection3d(Line3DCollection(curve_segs, colors=self._3d_curve_color))
+            except Exception:
+                pass
         # Autoscale axes to include all plotted items with padding to avoid clipping
         try:
-            if all_x and all_y and all_z:
-                xmin, xmax = min(all_x), max(all_x)
-                ymin, ymax = min(all_y), max(all_y)
-                zmin, zmax = min(all_z), max(all_z)
+            if extents:
+                bounds = np.ascontiguousarray(np.concatenate(extents), dtype=np.float64)
                 # add small padding (8%) or minimal epsilon
-                def pad(a, b):
-                    rng = b - a
-                    padv = max(1e-6, rng * 0.08)
-                    return a - padv, b + padv
-
-                nx0, nx1 = pad(xmin, xmax)
-                ny0, ny1 = pad(ymin, ymax)
-                nz0, nz1 = pad(zmin, zmax)
+                lo, hi = padded_bounds(bounds, 0.08, 1e-6)
+                (nx0, ny0, nz0), (nx1, ny1, nz1) = lo.tolist(), hi.tolist()
                 ax.set_xlim3d(nx0, nx1)
                 ax.set_ylim3d(ny0, ny1)
                 ax.set_zlim3d(nz0, nz1)
@@ -2574,6 +2650,20 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         except Exception:
             pass
 
+    def _apply_3d_theme(self):
+        """Colour the 3D axes, figure and id labels for the current theme without touching data."""
+        dark = self._3d_theme == 'dark'
+        face = '#222222' if dark else 'white'
+        self._3d_ax.set_facecolor(face)
+        self._3d_fig.patch.set_facecolor(face)
+        # every Text on the axes is a point/line id label
+        label_color = 'white' if dark else 'black'
+        for text in self._3d_ax.texts:
+            try:
+                text.set_color(label_color)
+            except Exception:
+                pass
+
     def set_3d_theme(self, theme_name: str):
         if theme_name not in ('default', 'dark'):
             return
@@ -2585,7 +2675,15 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 cb.set(theme_name)
         except Exception:
             pass
-        self.update_3d_plot()
+        # Only colours change; recolour the live axes instead of replotting everything
+        if not self._3d_initialized:
+            self.update_3d_plot()
+            return
+        try:
+            self._apply_3d_theme()
+            self._3d_canvas.draw_idle()
+        except Exception:
+            self.update_3d_plot()
 
     def toggle_3d_grid(self):
         try:
@@ -2595,6 +2693,14 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self._3d_show_grid = not self._3d_show_grid
         self.update_3d_plot()
 
+    def toggle_3d_labels(self):
+        try:
+            var = self._3d_toolbar_vars.get('labels_var')
+            self._3d_show_labels = bool(var.get())
+        except Exception:
+            self._3d_show_labels = not self._3d_show_labels
+        self.update_3d_plot()
+
     def load_config(self):
         if os.path.exists(self.config_file):
             self.config.read(self.config_file)
@@ -2816,6 +2922,8 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 messagebox.showerror("Error", f"Could not open image: {e}")
 
     def close_file(self):
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
         if self.source_image:
             self.source_image = None
             self.image_path = None
@@ -2826,6 +2934,34 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self.calibration_markers.clear()
             self.update_status("Image closed")
 
+    def _zoomed_image(self, zoom_key, width, height):
+        """Return (PIL image, PhotoImage) of the source image at the given zoom, cached."""
+        cached = self._pix_cache.get(zoom_key)
+        if cached is not None:
+            self._pix_cache.move_to_end(zoom_key)
+            return cached[:2]
+        # Resize image for current zoom; at 1:1 the source image itself is used
+        if zoom_key == 1.0:
+            pil_img = self.source_image
+        else:
+            # Use high-quality resampling
+            pil_img = self.source_image.resize((width, height), Image.Resampling.LANCZOS)
+        photo = ImageTk.PhotoImage(pil_img)
+        # Tk keeps 4 bytes per pixel for the PhotoImage; a resized PIL copy adds one
+        # byte per band on top (the 1:1 entry shares the already loaded source image)
+        pixels = pil_img.width * pil_img.height
+        nbytes = pixels * 4
+        if pil_img is not self.source_image:
+            nbytes += pixels * len(pil_img.getbands())
+        self._pix_cache[zoom_key] = (pil_img, photo, nbytes)
+        self._pix_cache_bytes += nbytes
+        # evict least recently used zoom levels, always keeping the newest
+        while len(self._pix_cache) > 1 and (len(self._pix_cache) > self._pix_cache_max
+                                            or self._pix_cache_bytes > self._pix_cache_budget):
+            _, (_, _, old_bytes) = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= old_bytes
+        return pil_img, photo
+
     def display_page(self):
         if not self.source_image:
             print("DEBUG: No source_image")
@@ -2843,23 +2979,15 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 messagebox.showwarning("Zoom Limit", f"Cannot zoom to {new_width}x{new_height}. Maximum canvas size is {max_canvas_size}x{max_canvas_size}")
                 return
             
-            # Resize image for current zoom
-            if self.zoom_level == 1.0:
-                pil_img = self.source_image.copy()
-            else:
-                # Use high-quality resampling
-                pil_img = self.source_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            self._last_rendered_pil = pil_img
-            
-            # Create PhotoImage in smaller chunks if needed
             try:
-                self.photo_image = ImageTk.PhotoImage(pil_img)
+                pil_img, self.photo_image = self._zoomed_image(round(self.zoom_level, 6), new_width, new_height)
                 print(f"DEBUG: PhotoImage created: {self.photo_image.width()}x{self.photo_image.height()}")
             except MemoryError:
                 messagebox.showerror("Memory Error", "Image is too large to display at this zoom level. Try zooming out.")
                 return
             
+            self._last_rendered_pil = pil_img
+            
             self.canvas.delete("all")
             self.canvas_image = self.canvas.create_image(0, 0, anchor="nw", image=self.photo_image)
             print(f"DEBUG: Canvas image created with ID: {self.canvas_image}")
@@ -2954,142 +3082,177 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             except Exception:
                 pass
 
+    @staticmethod
+    def _oval_boxes(xy, size):
+        """Return [x-size, y-size, x+size, y+size] rows for an (N, 2) array of centers."""
+        return np.hstack([xy - size, xy + size]).tolist()
+
     def redraw_markers(self):
-        # Remove existing canvas items for our element tags so redraw reflects size/font changes
-        try:
-            self.canvas.delete("user_point")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("point_label")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("user_line")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("line_label")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("user_curve")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("arc_point")
-        except Exception:
-            pass
-        try:
-            self.canvas.delete("calibration_point")
-        except Exception:
-            pass
+        """Bring the canvas markers in line with the data, reusing existing items.
 
-        self.point_markers.clear()
-        self.point_labels.clear()
-        self.calibration_markers.clear()
-        size = getattr(self, 'point_marker_size', 5)
+        Items left from the previous draw are moved with canvas.coords; items of
+        new entities are created and those no longer backed by data deleted in
+        one call. Display options are applied per tag, and only when they changed.
+        """
+        canvas = self.canvas
+        coords = canvas.coords
 
-        for i, (px, py) in enumerate(self.reference_points_image):
-            x = px * self.zoom_level
-            y = py * self.zoom_level
-            m_id = self.canvas.create_oval(x - size, y - size, x + size, y + size,
-                                          outline="red", fill="red", tags="calibration_point", width=2)
-            self.calibration_markers[i] = m_id
+        def unclaimed(tag):
+            # items currently carrying `tag`; whatever is not reused below gets deleted
+            try:
+                return set(canvas.find_withtag(tag))
+            except Exception:
+                return set()
 
-        for point in self.user_points:
-            if 'pdf_x' in point and 'pdf_y' in point:
-                x = point['pdf_x'] * self.zoom_level
-                y = point['pdf_y'] * self.zoom_level
-                clr = getattr(self, 'point_color_2d', 'blue')
-                m_id = self.canvas.create_oval(x - size, y - size, x + size, y + size,
-                                              outline=clr, fill=clr, tags="user_point", width=2)
-                self.point_markers[point['id']] = m_id
-                # create or update a label for the point id
-                # always compute a safe label font size (at least 1)
-                lbl_size = max(1, int(getattr(self, 'label_font_size', 10) or 10))
-                text_x = x + (size + 6)
-                text_y = y - (size + 2)
-                # if a previous text canvas id exists, remove it to avoid stale references
+        free_cal = unclaimed("calibration_point")
+        free_pts = unclaimed("user_point")
+        free_lbl = unclaimed("point_label")
+        free_lines = unclaimed("user_line")
+        free_line_lbl = unclaimed("line_label")
+        free_curves = unclaimed("user_curve")
+        free_arc = unclaimed("arc_point")
+
+        size = getattr(self, 'point_marker_size', 5)
+        clr = getattr(self, 'point_color_2d', 'blue')
+        lw = getattr(self, 'line_width_2d', 4)
+        lclr = getattr(self, 'line_color_2d', 'orange')
+        cwidth = getattr(self, 'curve_width_2d', 2)
+        cclr = getattr(self, 'curve_color_2d', 'purple')
+        # always compute a safe label font size (at least 1)
+        point_font = ("Helvetica", max(1, int(getattr(self, 'label_font_size', 10) or 10)))
+        line_font = ("Helvetica", max(1, int(getattr(self, 'label_font_size', 12) or 12)))
+
+        # Restyle surviving items with one itemconfigure per tag when an option changed
+        style = (clr, lw, lclr, cwidth, cclr, point_font, line_font)
+        if style != self._marker_style:
+            for tag, opts in (("user_point", {'outline': clr, 'fill': clr}),
+                              ("point_label", {'fill': clr, 'font': point_font}),
+                              ("user_line", {'fill': lclr, 'width': lw}),
+                              ("line_label", {'fill': lclr, 'font': line_font}),
+                              ("user_curve", {'fill': cclr, 'width': cwidth}),
+                              ("arc_point", {'outline': cclr, 'fill': cclr})):
                 try:
-                    old_tid = point.get('text_id') or self.point_labels.get(point['id'])
-                    if old_tid:
-                        try:
-                            self.canvas.delete(old_tid)
-                        except Exception:
-                            pass
+                    canvas.itemconfigure(tag, **opts)
                 except Exception:
                     pass
-                # create a fresh label with the current font size
+            self._marker_style = style
+
+        zoom = self.zoom_level
+        # Scale all calibration points in one vectorized pass
+        ref_scaled = np.asarray(self.reference_points_image, dtype=np.float64).reshape(-1, 2) * zoom
+        old_cal = dict(self.calibration_markers)
+        self.calibration_markers.clear()
+        for i, box in enumerate(self._oval_boxes(ref_scaled, size)):
+            m_id = old_cal.get(i)
+            if m_id in free_cal:
+                free_cal.discard(m_id)
+                coords(m_id, *box)
+            else:
+                m_id = canvas.create_oval(*box,
+                                          outline="red", fill="red", tags="calibration_point", width=2)
+            self.calibration_markers[i] = m_id
+
+        # Scale user point coordinates in one vectorized pass
+        drawable = [p for p in self.user_points if 'pdf_x' in p and 'pdf_y' in p]
+        pts_scaled = np.array([(p['pdf_x'], p['pdf_y']) for p in drawable], dtype=np.float64).reshape(-1, 2) * zoom
+        pts_boxes = self._oval_boxes(pts_scaled, size)
+        old_markers = dict(self.point_markers)
+        old_labels = dict(self.point_labels)
+        self.point_markers.clear()
+        self.point_labels.clear()
+        markers = self.point_markers
+        scaled = pts_scaled.tolist()
+        for point, (x, y), box in zip(drawable, scaled, pts_boxes):
+            pid = point['id']
+            m_id = old_markers.get(pid)
+            if m_id in free_pts:
+                free_pts.discard(m_id)
+                coords(m_id, *box)
+            else:
+                m_id = canvas.create_oval(*box,
+                                          outline=clr, fill=clr, tags="user_point", width=2)
+            markers[pid] = m_id
+            # label for the point id, placed up and to the right of the marker
+            text_x = x + (size + 6)
+            text_y = y - (size + 2)
+            try:
+                t_id = old_labels.get(pid) or point.get('text_id')
+                if t_id in free_lbl:
+                    free_lbl.discard(t_id)
+                    coords(t_id, text_x, text_y)
+                else:
+                    t_id = canvas.create_text(text_x, text_y, text=str(pid), fill=clr, tags="point_label", font=point_font)
+                self.point_labels[pid] = t_id
                 try:
-                    t_id = self.canvas.create_text(text_x, text_y, text=str(point['id']), fill=clr, tags="point_label", font=("Helvetica", lbl_size))
-                    self.point_labels[point['id']] = t_id
-                    try:
-                        point['text_id'] = t_id
-                    except Exception:
-                        pass
+                    point['text_id'] = t_id
                 except Exception:
                     pass
+            except Exception:
+                pass
 
+        # Line endpoints are read from the already scaled point rows
+        row_of = {p['id']: i for i, p in enumerate(drawable)}
         for line in self.lines:
-            start = next(p for p in self.user_points if p['id'] == line['start_id'])
-            end = next(p for p in self.user_points if p['id'] == line['end_id'])
-            x1 = start['pdf_x'] * self.zoom_level
-            y1 = start['pdf_y'] * self.zoom_level
-            x2 = end['pdf_x'] * self.zoom_level
-            y2 = end['pdf_y'] * self.zoom_level
-            lw = getattr(self, 'line_width_2d', 4)
-            lclr = getattr(self, 'line_color_2d', 'orange')
-            line_id = self.canvas.create_line(x1, y1, x2, y2, fill=lclr, width=lw, tags="user_line")
-            if 'canvas_id' in line:
-                try:
-                    self.canvas.delete(line['canvas_id'])
-                except:
-                    pass
+            s_row = row_of.get(line['start_id'])
+            e_row = row_of.get(line['end_id'])
+            if s_row is None or e_row is None:
+                continue
+            x1, y1 = scaled[s_row]
+            x2, y2 = scaled[e_row]
+            line_id = line.get('canvas_id')
+            if line_id in free_lines:
+                free_lines.discard(line_id)
+                coords(line_id, x1, y1, x2, y2)
+            else:
+                line_id = canvas.create_line(x1, y1, x2, y2, fill=lclr, width=lw, tags="user_line")
             line['canvas_id'] = line_id
             mid_x = (x1 + x2) / 2
             mid_y = (y1 + y2) / 2
             text_offset = 15
             text_y = mid_y - text_offset if y1 < y2 else mid_y + text_offset
-            # robust text label handling: treat falsy or missing text_id as absent
-            # always recreate line label to ensure font/position are correct
-            try:
-                old_tid = line.get('text_id')
-                if old_tid:
-                    try:
-                        self.canvas.delete(old_tid)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            # treat a falsy, missing or already deleted text_id as absent
             try:
-                lbl_size = max(1, int(getattr(self, 'label_font_size', 12) or 12))
-                t_id = self.canvas.create_text(mid_x, text_y, text=str(line['id']), fill=lclr, tags="line_label", font=("Helvetica", lbl_size))
+                t_id = line.get('text_id')
+                if t_id in free_line_lbl:
+                    free_line_lbl.discard(t_id)
+                    coords(t_id, mid_x, text_y)
+                else:
+                    t_id = canvas.create_text(mid_x, text_y, text=str(line['id']), fill=lclr, tags="line_label", font=line_font)
                 line['text_id'] = t_id
             except Exception:
                 pass
 
+        arc_size = 4
         for curve in self.curves:
-            coords = []
-            for px, py in curve['arc_points_pdf']:
-                coords.extend([px * self.zoom_level, py * self.zoom_level])
-            cwidth = getattr(self, 'curve_width_2d', 2)
-            cclr = getattr(self, 'curve_color_2d', 'purple')
-            curve_id = self.canvas.create_line(*coords, fill=cclr, width=cwidth, smooth=True, splinesteps=36, tags="user_curve")
-            if 'canvas_id' in curve:
-                try:
-                    self.canvas.delete(curve['canvas_id'])
-                except:
-                    pass
+            arc_scaled = np.asarray(curve['arc_points_pdf'], dtype=np.float64).reshape(-1, 2) * zoom
+            flat = arc_scaled.ravel().tolist()
+            curve_id = curve.get('canvas_id')
+            if curve_id in free_curves:
+                free_curves.discard(curve_id)
+                coords(curve_id, *flat)
+            else:
+                curve_id = canvas.create_line(*flat, fill=cclr, width=cwidth, smooth=True, splinesteps=36, tags="user_curve")
             curve['canvas_id'] = curve_id
-            size = 4
-            curve['arc_point_marker_ids'] = []
-            for px, py in curve['arc_points_pdf']:
-                x = px * self.zoom_level
-                y = py * self.zoom_level
-                marker_id = self.canvas.create_oval(x - size, y - size, x + size, y + size,
+            old_ids = curve.get('arc_point_marker_ids') or []
+            marker_ids = []
+            for k, box in enumerate(self._oval_boxes(arc_scaled, arc_size)):
+                marker_id = old_ids[k] if k < len(old_ids) else None
+                if marker_id in free_arc:
+                    free_arc.discard(marker_id)
+                    coords(marker_id, *box)
+                else:
+                    marker_id = canvas.create_oval(*box,
                                                    outline=cclr, fill=cclr, tags="arc_point", width=2)
-                curve['arc_point_marker_ids'].append(marker_id)
+                marker_ids.append(marker_id)
+            curve['arc_point_marker_ids'] = marker_ids
+
+        # Drop items whose entity is gone, all in one call
+        stale = free_cal | free_pts | free_lbl | free_lines | free_line_lbl | free_curves | free_arc
+        if stale:
+            try:
+                canvas.delete(*stale)
+            except Exception:
+                pass
 
         self.canvas.tag_raise("calibration_point")
         self.canvas.tag_raise("user_point")
@@ -3339,8 +3502,7 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         except Exception:
             pass
         try:
-            with open(project_path, 'w') as f:
-                json.dump(project_data, f, indent=4)
+            dump_json(project_data, project_path)
             messagebox.showinfo("Saved", f"Project saved to {project_path}")
             self.update_status(f"Project saved to {project_path}")
         except Exception as e:
@@ -3364,8 +3526,7 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
         if not project_path:
             return
         try:
-            with open(project_path, 'r') as f:
-                project_data = json.load(f)
+            project_data = load_json(project_path)
 
             # Backup original project before any migration
             try:
@@ -3553,13 +3714,29 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
 
         # Ensure each curve has a fixed number of positions (interior + 2 endpoints)
         total_positions = max(2, int(getattr(self, 'curve_interior_points', 4)) + 2)
+        # interpolation parameters of the interior positions (i / (n - 1) for 0 < i < n - 1)
+        interior_t = np.arange(1, total_positions - 1) / (total_positions - 1)
+
+        # Existing points hashed by their image_x/image_y quantized to the match tolerance, so
+        # find_or_create_point probes a few cells instead of scanning every point
+        tol = 1e-6
+        coord_index = {}
+        for p in self.user_points:
+            try:
+                key = (int(round(p['image_x'] / tol)), int(round(p['image_y'] / tol)))
+            except (KeyError, TypeError, ValueError, OverflowError):
+                continue
+            coord_index.setdefault(key, p)
 
         def find_or_create_point(px, py, z_val=None):
-            # Try to find an existing point by Image coords (exact match, small tolerance)
-            tol = 1e-6
-            for p in self.user_points:
-                if abs(p.get('image_x', 1e12) - px) < tol and abs(p.get('image_y', 1e12) - py) < tol:
-                    return p['id']
+            # Try to find an existing point by Image coords (exact match, small tolerance);
+            # a match can sit in a neighbouring cell when it straddles a rounding boundary
+            kx, ky = int(round(px / tol)), int(round(py / tol))
+            for gx in (kx, kx - 1, kx + 1):
+                for gy in (ky, ky - 1, ky + 1):
+                    p = coord_index.get((gx, gy))
+                    if p is not None and abs(p['image_x'] - px) < tol and abs(p['image_y'] - py) < tol:
+                        return p['id']
             # Create new point
             rx, ry = self.transform_point(px, py)
             # Use centralized helper to allocate a new point id
@@ -3573,6 +3750,7 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                 'z': float(z_val) if z_val is not None else 0.0
             }
             self.user_points.append(new_pt)
+            coord_index.setdefault((kx, ky), new_pt)
             return new_id
 
         # Reconstruct or normalize arc_point_ids for each curve (may create new points)
@@ -3615,12 +3793,12 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                     # ensure start/end Image present
                     try:
                         if start_id is not None:
-                            sp = next((p for p in self.user_points if p['id'] == start_id), None)
+                            sp = self._get_point_by_id(start_id)
                             if sp:
                                 if (sp['image_x'], sp['image_y']) not in Image_coords:
                                     Image_coords.insert(0, (sp['image_x'], sp['image_y']))
                         if end_id is not None:
-                            ep = next((p for p in self.user_points if p['id'] == end_id), None)
+                            ep = self._get_point_by_id(end_id)
                             if ep:
                                 if (ep['image_x'], ep['image_y']) not in Image_coords:
                                     Image_coords.append((ep['image_x'], ep['image_y']))
@@ -3632,13 +3810,9 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
                         ex, ey = Image_coords[-1]
                         needed = total_positions - len(ids)
                         # insert interior points between start and end
-                        insert_ids = []
-                        for i in range(1, total_positions - 1):
-                            t = i / (total_positions - 1)
-                            ix = sx * (1 - t) + ex * t
-                            iy = sy * (1 - t) + ey * t
-                            pid = find_or_create_point(ix, iy, z_level)
-                            insert_ids.append(pid)
+                        ixs = (sx * (1 - interior_t) + ex * interior_t).tolist()
+                        iys = (sy * (1 - interior_t) + ey * interior_t).tolist()
+                        insert_ids = [find_or_create_point(ix, iy, z_level) for ix, iy in zip(ixs, iys)]
                         # final assembly: start, interiors, end
                         final_ids = []
                         if start_id is not None:
@@ -3688,85 +3862,82 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             curve['arc_point_ids'] = ids
 
         # Now write points, lines, curves and SQL (points may have been created above)
-        with open(points_file, 'w') as f:
+        # Each file is assembled as a list of preformatted rows and written with one call
+        for point in self.user_points:
+            # ensure real coords exist
+            if 'real_x' not in point or 'real_y' not in point:
+                rx, ry = self.transform_point(point.get('image_x', 0.0), point.get('image_y', 0.0))
+                point['real_x'] = round(rx, 2)
+                point['real_y'] = round(ry, 2)
+        with open(points_file, 'w', buffering=1 << 20) as f:
             f.write("ID,X,Y,Z\n")
-            for point in self.user_points:
-                # ensure real coords exist
-                if 'real_x' not in point or 'real_y' not in point:
-                    rx, ry = self.transform_point(point.get('image_x', 0.0), point.get('image_y', 0.0))
-                    point['real_x'] = round(rx, 2)
-                    point['real_y'] = round(ry, 2)
-                f.write(f"{point['id']},{point['real_x']},{point['real_y']},{point.get('z', 0.0)}\n")
-
-        with open(lines_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['LineID', 'StartPointID', 'EndPointID', 'StartPointZ', 'EndPointZ'])
-            for line in self.lines:
-                start_id = line['start_id']
-                end_id = line['end_id']
-                start_z = next((p.get('z') for p in self.user_points if p['id'] == start_id), None)
-                end_z = next((p.get('z') for p in self.user_points if p['id'] == end_id), None)
-                writer.writerow([line['id'], start_id, end_id, start_z, end_z])
-
-        with open(curves_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            # Per-user requirement: Position,PointID,LineID (exactly total_positions rows per curve)
-            writer.writerow(['Position', 'PointID', 'LineID'])
-            for curve in self.curves:
-                line_id = next((l['id'] for l in self.lines if
-                                (l['start_id'] == curve.get('start_id') and l['end_id'] == curve.get('end_id')) or
-                                (l['start_id'] == curve.get('end_id') and l['end_id'] == curve.get('start_id'))
-                                ), 0)
-                base_line_id = curve.get('base_line_id', line_id)
-                ids = curve.get('arc_point_ids', [])
-                for pos in range(total_positions):
-                    pid = ids[pos] if pos < len(ids) else ids[-1]
-                    writer.writerow([pos, pid, base_line_id])
+            f.writelines(
+                f"{point['id']},{point['real_x']},{point['real_y']},{point.get('z', 0.0)}\n"
+                for point in self.user_points
+            )
 
-        # Generate SQL file with IDENTITY_INSERT
-        with open(sql_file, 'w') as f:
-            f.write("-- SQL Insert Script for SeasPathDB\n")
-            f.write("-- Generated from 3DMaker Export\n\n")
+        # Lines CSV (Z values as stored; empty fields for missing endpoints)
+        write_lines_z_csv(lines_file, self.lines, self._point_index())
+
+        # Endpoint pair -> first matching line id, in either direction
+        lines_by_endpoints = {}
+        for l in self.lines:
+            lines_by_endpoints.setdefault(frozenset((l['start_id'], l['end_id'])), l['id'])
 
+        # Resolve (position, point id, edge id) rows for every curve once;
+        # shared by the curves CSV and the SQL curve section
+        curve_rows = []
+        for curve in self.curves:
+            line_id = lines_by_endpoints.get(frozenset((curve.get('start_id'), curve.get('end_id'))), 0)
+            edge_id = curve.get('base_line_id', line_id)
+            ids = curve.get('arc_point_ids', [])
+            for pos in range(total_positions):
+                pid = ids[pos] if pos < len(ids) else ids[-1]
+                curve_rows.append((pos, pid, edge_id))
+
+        with open(curves_file, 'w', newline='', buffering=1 << 20) as f:
+            # Per-user requirement: Position,PointID,LineID (exactly total_positions rows per curve);
+            # a null base_line_id is written as an empty field, as csv.writer did
+            f.write("Position,PointID,LineID\r\n")
+            f.writelines(f"{pos},{pid},{'' if edge_id is None else edge_id}\r\n"
+                         for pos, pid, edge_id in curve_rows)
+
+        # Generate SQL file with IDENTITY_INSERT
+        parts = [
+            "-- SQL Insert Script for SeasPathDB\n",
+            "-- Generated from 3DMaker Export\n\n",
             # Remove existing data first (Curves, Lines, Points)
-            f.write("-- Clear existing data (order: Curves, Lines, Points)\n")
-            f.write("DELETE FROM SeasPathDB.dbo.Visualization_Curve;\n")
-            f.write("DELETE FROM SeasPathDB.dbo.Visualization_Edge;\n")
-            f.write("DELETE FROM SeasPathDB.dbo.Visualization_Coordinate;\n\n")
-
-            # Points table
-            f.write("-- Insert Visualization_Coordinate (Points)\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate ON;\n")
-            for point in self.user_points:
-                f.write(f"INSERT INTO SeasPathDB.dbo.Visualization_Coordinate (Id, X, Y, Z, Description) ")
-                f.write(f"VALUES ({point['id']}, {point['real_x']}, {point['real_y']}, {point.get('z', 0.0)}, '3D Visualisation');\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate OFF;\n\n")
-
-            # Lines table
-            f.write("-- Insert Visualization_Edge (Lines)\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge ON;\n")
-            for line in self.lines:
-                f.write(f"INSERT INTO SeasPathDB.dbo.Visualization_Edge (Id, TailCoordenate, HeadCoordenate) ")
-                f.write(f"VALUES ({line['id']}, {line['start_id']}, {line['end_id']});\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge OFF;\n\n")
-
-            # Curves table
-            f.write("-- Insert Visualization_Curve (Curves)\n")
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve ON;\n")
-            curve_row_id = 1
-            for curve in self.curves:
-                line_id = next((l['id'] for l in self.lines if
-                                (l['start_id'] == curve.get('start_id') and l['end_id'] == curve.get('end_id')) or
-                                (l['start_id'] == curve.get('end_id') and l['end_id'] == curve.get('start_id'))
-                                ), 0)
-                edge_id = curve.get('base_line_id', line_id)
-                ids = curve.get('arc_point_ids', [])
-                for position in range(total_positions):
-                    pid = ids[position] if position < len(ids) else ids[-1]
-                    f.write(f"INSERT INTO SeasPathDB.dbo.Visualization_Curve (Id, PositionNumber, CoordinateId, EdgeId) ")
-                    f.write(f"VALUES ({curve_row_id}, {position}, {pid}, {edge_id});\n")
-                    curve_row_id += 1
-            f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve OFF;\n")
+            "-- Clear existing data (order: Curves, Lines, Points)\n",
+            "DELETE FROM SeasPathDB.dbo.Visualization_Curve;\n",
+            "DELETE FROM SeasPathDB.dbo.Visualization_Edge;\n",
+            "DELETE FROM SeasPathDB.dbo.Visualization_Coordinate;\n\n",
+        ]
+
+        # Points table
+        parts.append("-- Insert Visualization_Coordinate (Points)\n")
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate ON;\n")
+        parts.extend(sql_batches(SQL_COORD_INSERT, (
+            _SQL_COORD.format(id=point['id'], x=point['real_x'], y=point['real_y'], z=point.get('z', 0.0))
+            for point in self.user_points
+        )))
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Coordinate OFF;\n\n")
+
+        # Lines table
+        parts.append("-- Insert Visualization_Edge (Lines)\n")
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge ON;\n")
+        parts.extend(sql_batches(SQL_EDGE_INSERT, (SQL_EDGE.format_map(line) for line in self.lines)))
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Edge OFF;\n\n")
+
+        # Curves table
+        parts.append("-- Insert Visualization_Curve (Curves)\n")
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve ON;\n")
+        parts.extend(sql_batches(_SQL_CURVE_INSERT, (
+            _SQL_CURVE.format(row_id, *row) for row_id, row in enumerate(curve_rows, start=1)
+        )))
+        parts.append("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve OFF;\n")
+
+        with open(sql_file, 'w', buffering=1 << 20) as f:
+            f.writelines(parts)
 
         messagebox.showinfo("Export Success", f"Exported data to {export_dir}\nFiles: {project_name}_points.txt, {project_name}_lines.txt, {project_name}_curves.txt, {project_name}_insert.sql")
 
@@ -3821,10 +3992,11 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self.user_points.append(new_point)
 
     def duplicate_line(self, line, z_values):
+        # Get start and end points
+        pt_by_id = self._point_index()
+        start = pt_by_id[line['start_id']]
+        end = pt_by_id[line['end_id']]
         for z in z_values:
-            # Get start and end points
-            start = next(p for p in self.user_points if p['id'] == line['start_id'])
-            end = next(p for p in self.user_points if p['id'] == line['end_id'])
 
             # Create new points at new Z level
             # allocate new start/end point ids
@@ -3855,11 +4027,12 @@ class PNGViewerApp(CalibrationMixin, PointsLinesMixin, CurvesMixin, DeletionMixi
             self.lines.append(new_line)
 
     def duplicate_curve(self, curve, z_values):
+        pt_by_id = self._point_index()
         for z in z_values:
             # Duplicate all arc points at new Z level
             new_arc_point_ids = []
             for arc_point_id in curve['arc_point_ids']:
-                orig_point = next(p for p in self.user_points if p['id'] == arc_point_id)
+                orig_point = pt_by_id[arc_point_id]
                 new_point = orig_point.copy()
                 # Allocate new intermediate arc point id
                 new_pid = self.next_point_id()
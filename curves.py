@@ -1,5 +1,18 @@
 import numpy as np
-from math import atan2, cos, sin, sqrt
+from functools import lru_cache
+from math import sqrt
+
+
+@lru_cache(maxsize=None)
+def _arc_fractions(num_points):
+    """Interior sample positions along an arc as fractions of its extent.
+
+    The interior count is a fixed setting, so this is computed once per count.
+    """
+    fractions = np.linspace(0.0, 1.0, num_points + 2)[1:-1]
+    fractions.flags.writeable = False
+    return fractions
+
 
 class CurvesMixin:
     # Removed older/buggy handlers; keep the working `handle_curves_click`
@@ -60,8 +73,8 @@ class CurvesMixin:
             curvature_pdf_x = canvas_x / self.zoom_level
             curvature_pdf_y = canvas_y / self.zoom_level
             p_ids = self.current_curve_points
-            start_point = next(p for p in self.user_points if p['id'] == p_ids[self.A])
-            end_point = next(p for p in self.user_points if p['id'] == p_ids[self.B])
+            start_point = self._get_point_by_id(p_ids[self.A])
+            end_point = self._get_point_by_id(p_ids[self.B])
             p_start = (start_point['pdf_x'], start_point['pdf_y'])
             p_end = (end_point['pdf_x'], end_point['pdf_y'])
             p_curve = (curvature_pdf_x, curvature_pdf_y)
@@ -90,15 +103,11 @@ class CurvesMixin:
             extent_angle = end_angle - start_angle
             # Number of interior arc points is configurable via the app setting
             num_points = getattr(self, 'curve_interior_points', 4)
-            # angles vector includes endpoints; we then exclude them to get interior points
-            angles = np.linspace(start_angle, end_angle, num_points + 2)  # +2 for endpoints
-            angles = angles[1:-1]  # Exclude the endpoint angles
-            arc_points_pdf = []
-            for angle in angles:
-                rad = np.radians(angle % 360)
-                x = cx + radius * cos(rad)
-                y = cy + radius * sin(rad)
-                arc_points_pdf.append((x, y))
+            # interior angles only (endpoints excluded), all sampled in one vectorized pass
+            rads = np.radians(start_angle + _arc_fractions(int(num_points)) * extent_angle)
+            xs = (cx + radius * np.cos(rads)).tolist()
+            ys = (cy + radius * np.sin(rads)).tolist()
+            arc_points_pdf = list(zip(xs, ys))
             # Prepend first clicked point and append second clicked point
             arc_points_pdf = [p_start] + arc_points_pdf + [p_end]
             arc_points_real = []
@@ -116,8 +125,9 @@ class CurvesMixin:
                 z_val = to_int(z_candidate)
             if z_val is None:
                 z_val = to_int(self.elevation_var.get(), default=0)
-            for px, py in arc_points_pdf:
-                real_x, real_y = self.transform_point(px, py)
+            # Transform all arc points in one vectorized call
+            arc_real_xy = self.transform_points(arc_points_pdf).tolist()
+            for (px, py), (real_x, real_y) in zip(arc_points_pdf, arc_real_xy):
                 # store integer X,Y for display/export and integer Z for 3D plotting
                 rx = int(round(real_x))
                 ry = int(round(real_y))
@@ -1,5 +1,12 @@
-from tkinter import messagebox
+from tkinter import messagebox, simpledialog
 from datetime import datetime
+from utils import points_to_array, ListSnapshotCache
+from digitizer.spatial import PointIndex
+
+
+def _build_picker(points):
+    table = points_to_array(points)
+    return PointIndex(table['pdf_x'], table['pdf_y'])
 
 
 class DeletionMixin:
@@ -29,6 +36,20 @@ class DeletionMixin:
         else:
             self.update_status("No item close enough to delete")
 
+    def _point_picker(self):
+        """Return a PointIndex over user_points, rebuilding it only when points changed.
+
+        Staleness is detected by ListSnapshotCache; setting _picker_dirty forces
+        a rebuild after in-place edits it cannot see.
+        """
+        cache = getattr(self, '_picker_cache', None)
+        if cache is None:
+            cache = self._picker_cache = ListSnapshotCache(_build_picker)
+        if getattr(self, '_picker_dirty', False):
+            cache.invalidate()
+            self._picker_dirty = False
+        return cache.get(self.user_points)
+
     def find_items_near(self, pdf_x, pdf_y):
         """Return a list of nearby candidates (kind, item, dist) without prompting.
         Same proximity rules as find_closest_item.
@@ -40,17 +61,16 @@ class DeletionMixin:
             pdf_tolerance_sq = 25.0
 
         candidates = []
-        for point in self.user_points:
-            if 'pdf_x' in point and 'pdf_y' in point:
-                dist = (point['pdf_x'] - pdf_x) ** 2 + (point['pdf_y'] - pdf_y) ** 2
-                if dist <= pdf_tolerance_sq:
-                    candidates.append(('point', point, dist))
+        # Query the spatial index (points without pdf coords are NaN and never match)
+        hits, d2 = self._point_picker().within(pdf_x, pdf_y, pdf_tolerance_sq)
+        for i, dist in zip(hits.tolist(), d2.tolist()):
+            candidates.append(('point', self.user_points[i], dist))
 
+        points_by_id = {p['id']: p for p in self.user_points if 'id' in p}
         for line in self.lines:
-            try:
-                start = next(p for p in self.user_points if p['id'] == line['start_id'])
-                end = next(p for p in self.user_points if p['id'] == line['end_id'])
-            except StopIteration:
+            start = points_by_id.get(line.get('start_id'))
+            end = points_by_id.get(line.get('end_id'))
+            if start is None or end is None:
                 continue
             dist = self.point_to_line_distance(pdf_x, pdf_y, start, end)
             if dist <= pdf_tolerance_sq:
@@ -87,7 +107,6 @@ class DeletionMixin:
 
         # Multiple candidates: ask user which to select. Present a simple numbered list with Z values where available.
         try:
-            from tkinter import simpledialog, messagebox
             choices = []
             for idx, (kind, item, dist) in enumerate(candidates, start=1):
                 if kind == 'point':
@@ -96,8 +115,8 @@ class DeletionMixin:
                 elif kind == 'line':
                     # Attempt to determine average Z of line endpoints
                     try:
-                        s = next(p for p in self.user_points if p['id'] == item['start_id'])
-                        e = next(p for p in self.user_points if p['id'] == item['end_id'])
+                        s = self._get_point_by_id(item['start_id'])
+                        e = self._get_point_by_id(item['end_id'])
                         z = (float(s.get('z', 0)) + float(e.get('z', 0))) / 2.0
                     except Exception:
                         z = 'n/a'
@@ -125,6 +144,7 @@ class DeletionMixin:
             return (kind, item)
 
     def delete_point(self, point):
+        self._picker_dirty = True
         pid = point.get('id')
         # Check if this point is part of any curve arc points
         curves_involving = [c for c in list(self.curves) if pid in c.get('arc_point_ids', [])]
@@ -186,16 +206,12 @@ class DeletionMixin:
     def delete_line(self, line):
         lid = line.get('id')
         self.lines = [l for l in self.lines if l.get('id') != lid]
-        if 'canvas_id' in line:
-            try:
-                self.canvas.delete(line['canvas_id'])
-            except Exception:
-                pass
-        if 'text_id' in line:
-            try:
-                self.canvas.delete(line['text_id'])
-            except Exception:
-                pass
+        for cid in (line.get('canvas_id'), line.get('text_id')):
+            if cid is not None:
+                try:
+                    self.canvas.delete(cid)
+                except Exception:
+                    pass
         # Log line deletion
         try:
             self.deletion_log.append({'action': 'delete_line', 'line_id': lid, 'time': datetime.now().isoformat()})
@@ -264,7 +280,7 @@ class DeletionMixin:
     def _remove_orphan_curve_point(self, point_id):
         if point_id is None:
             return False
-        point = next((p for p in self.user_points if p.get('id') == point_id), None)
+        point = self._get_point_by_id(point_id)
         if not point:
             return False
         if self._point_has_other_references(point_id):
@@ -8,7 +8,15 @@ Assumes the project data is canonical (migration/validation already applied).
 """
 import os
 import csv
-from typing import Dict, Any
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator
+
+# Statement prefixes and row templates shared by the viewers' SQL export
+SQL_COORD_INSERT = "INSERT INTO SeasPathDB.dbo.Visualization_Coordinate (Id, X, Y, Z, Description) VALUES\n"
+SQL_EDGE_INSERT = "INSERT INTO SeasPathDB.dbo.Visualization_Edge (Id, TailCoordenate, HeadCoordenate) VALUES\n"
+SQL_EDGE = "({id}, {start_id}, {end_id})"
+# SQL Server accepts at most 1000 rows in a single VALUES list
+SQL_BATCH_ROWS = 1000
 
 
 def export_project(project: Dict[str, Any], export_dir: str, project_name: str):
@@ -101,3 +109,30 @@ def export_project(project: Dict[str, Any], export_dir: str, project_name: str):
         f.write("SET IDENTITY_INSERT SeasPathDB.dbo.Visualization_Curve OFF;\n")
 
     return {'points_file': points_file, 'lines_file': lines_file, 'curves_file': curves_file, 'sql_file': sql_file}
+
+
+def write_lines_z_csv(lines_file: str, lines, points_by_id: Dict[Any, Dict[str, Any]]):
+    """Write the viewers' lines CSV: `LineID,StartPointID,EndPointID,StartPointZ,EndPointZ`.
+
+    Z values are written as stored on the points (csv.writer formatting, so a
+    whole float stays `250.0`); a missing endpoint or Z leaves the field empty.
+    """
+    with open(lines_file, 'w', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(['LineID', 'StartPointID', 'EndPointID', 'StartPointZ', 'EndPointZ'])
+        writer.writerows(
+            [line['id'], line['start_id'], line['end_id'],
+             (points_by_id.get(line['start_id']) or {}).get('z'),
+             (points_by_id.get(line['end_id']) or {}).get('z')]
+            for line in lines
+        )
+
+
+def sql_batches(prefix: str, rows: Iterable[str]) -> Iterator[str]:
+    """Yield multi-row INSERT statements of at most SQL_BATCH_ROWS rows each."""
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, SQL_BATCH_ROWS))
+        if not chunk:
+            return
+        yield prefix + ",\n".join(chunk) + ";\n"
@@ -15,6 +15,12 @@ class IDAllocator:
         self.point_counter += 1
         return pid
 
+    def allocate_point_ids(self, n: int) -> range:
+        """Reserve n consecutive point ids in one step."""
+        start = self.point_counter
+        self.point_counter += n
+        return range(start, start + n)
+
     def next_line_id(self) -> int:
         lid = self.line_counter
         self.line_counter += 1
@@ -40,4 +46,12 @@ class IDAllocator:
         pmax = max((p.get('id', 0) for p in project.get('points', [])), default=0)
         lmax = max((l.get('id', 0) for l in project.get('lines', [])), default=0)
         cmax = max((c.get('id', 0) for c in project.get('curves', [])), default=0)
-        return cls(start_point=pmax+1, start_line=lmax+1, start_curve=cmax+1)
+        # Saved counters may be ahead of the maxima when the newest items were
+        # deleted; honour them so those ids are not handed out again
+        saved = project.get('id_counters') or {}
+        try:
+            return cls(start_point=max(pmax + 1, int(saved.get('point_counter', 0))),
+                       start_line=max(lmax + 1, int(saved.get('line_counter', 0))),
+                       start_curve=max(cmax + 1, int(saved.get('curve_counter', 0))))
+        except (TypeError, ValueError, AttributeError):
+            return cls(start_point=pmax+1, start_line=lmax+1, start_curve=cmax+1)
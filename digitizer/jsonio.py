@@ -0,0 +1,67 @@
+"""
+JSON load/save helpers for project files.
+Uses orjson when it is installed (much faster on large .dig files) and
+falls back to the standard library json module otherwise.
+"""
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_nonfinite(data: Any) -> bool:
+    """True if a NaN or infinite float appears anywhere in data."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def load_json(path: str) -> Any:
+    """Read and parse a JSON file.
+
+    Files written by the stdlib encoder may contain NaN/Infinity, which
+    orjson rejects; those are parsed again with the stdlib decoder.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw.decode('utf-8'))
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: str, indent: int = 4) -> None:
+    """Serialize data to a JSON file.
+
+    orjson only supports 2-space indentation, so `indent` applies to the
+    stdlib fallback only. If orjson rejects the data (e.g. non-string dict
+    keys) the stdlib encoder is used instead. orjson writes NaN as null,
+    which the float() conversions on load cannot read back, so data
+    holding NaN/Infinity is also written by the stdlib encoder.
+    """
+    if orjson is not None and not _has_nonfinite(data):
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            payload = None
+        if payload is not None:
+            with open(path, 'wb') as f:
+                f.write(payload)
+            return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
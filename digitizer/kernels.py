@@ -0,0 +1,75 @@
+"""
+Numeric kernels for hit-testing points on the canvas and fitting the 3D view.
+Compiled with numba when it is installed; plain NumPy is used otherwise.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _points_within_loop(xs, ys, px, py, tol_sq):
+    """Indices and squared distances of points within sqrt(tol_sq) of (px, py)."""
+    n = xs.shape[0]
+    hits = np.empty(n, np.int64)
+    dists = np.empty(n, np.float64)
+    k = 0
+    for i in range(n):
+        dx = xs[i] - px
+        dy = ys[i] - py
+        d2 = dx * dx + dy * dy
+        # NaN coordinates (points without pdf position) never compare true
+        if d2 <= tol_sq:
+            hits[k] = i
+            dists[k] = d2
+            k += 1
+    return hits[:k], dists[:k]
+
+
+def _points_within_numpy(xs, ys, px, py, tol_sq):
+    d2 = (xs - px) ** 2 + (ys - py) ** 2
+    hits = np.nonzero(d2 <= tol_sq)[0]
+    return hits, d2[hits]
+
+
+# fastmath is left off: it lets the compiler assume no NaNs, which the loop relies on
+points_within = njit(cache=True)(_points_within_loop) if njit is not None else _points_within_numpy
+
+
+def _padded_bounds_loop(xyz, frac, min_pad):
+    """Per-axis (lo, hi) of an (N, 3) array, widened by frac of the range (at least min_pad)."""
+    lo = xyz[0].copy()
+    hi = xyz[0].copy()
+    for i in range(1, xyz.shape[0]):
+        for j in range(3):
+            v = xyz[i, j]
+            if v < lo[j]:
+                lo[j] = v
+            elif v > hi[j]:
+                hi[j] = v
+    for j in range(3):
+        pad = (hi[j] - lo[j]) * frac
+        if pad < min_pad:
+            pad = min_pad
+        lo[j] -= pad
+        hi[j] += pad
+    return lo, hi
+
+
+def _padded_bounds_numpy(xyz, frac, min_pad):
+    lo = xyz.min(axis=0)
+    hi = xyz.max(axis=0)
+    pad = np.maximum(min_pad, (hi - lo) * frac)
+    return lo - pad, hi + pad
+
+
+padded_bounds = njit(cache=True)(_padded_bounds_loop) if njit is not None else _padded_bounds_numpy
+
+
+def warm_kernels():
+    """Trigger JIT compilation up front so the first click does not pay for it."""
+    one = np.zeros(1, np.float64)
+    points_within(one, one, 0.0, 0.0, 1.0)
+    padded_bounds(np.zeros((1, 3), np.float64), 0.08, 1e-6)
@@ -0,0 +1,37 @@
+"""
+Static spatial index over point positions used for canvas picking.
+Points are sorted by x once; a query binary-searches the x window around the
+click and only distance-tests the points inside it.
+"""
+from math import sqrt
+
+import numpy as np
+
+from digitizer.kernels import points_within
+
+
+class PointIndex:
+    def __init__(self, xs, ys):
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        # NaN positions sort to the end and are never inside a search window
+        self._order = np.argsort(xs, kind='stable')
+        self._xs = np.ascontiguousarray(xs[self._order])
+        self._ys = np.ascontiguousarray(ys[self._order])
+
+    def __len__(self):
+        return self._order.size
+
+    def within(self, px, py, tol_sq):
+        """Return (indices, squared distances) of points within sqrt(tol_sq) of (px, py).
+
+        Indices refer to the arrays the index was built from and are returned
+        in ascending order.
+        """
+        r = sqrt(tol_sq)
+        lo = int(np.searchsorted(self._xs, px - r, side='left'))
+        hi = int(np.searchsorted(self._xs, px + r, side='right'))
+        hits, d2 = points_within(self._xs[lo:hi], self._ys[lo:hi], float(px), float(py), float(tol_sq))
+        idx = self._order[lo:hi][hits]
+        keep = np.argsort(idx, kind='stable')
+        return idx[keep], d2[keep]
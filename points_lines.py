@@ -85,8 +85,8 @@ class PointsLinesMixin:
                 self.current_line_points.clear()
                 return
             
-            start_point = next(p for p in self.user_points if p['id'] == start_id)
-            end_point = next(p for p in self.user_points if p['id'] == end_id)
+            start_point = self._get_point_by_id(start_id)
+            end_point = self._get_point_by_id(end_id)
             x1 = start_point['pdf_x'] * self.zoom_level
             y1 = start_point['pdf_y'] * self.zoom_level
             x2 = end_point['pdf_x'] * self.zoom_level
@@ -225,8 +225,8 @@ class PointsLinesMixin:
         self.update_status(f"Selected point {closest_point['id']} for line ({len(self.current_line_points)}/2)")
         if len(self.current_line_points) == 2:
             start_id, end_id = self.current_line_points
-            start_point = next(p for p in self.user_points if p['id'] == start_id)
-            end_point = next(p for p in self.user_points if p['id'] == end_id)
+            start_point = self._get_point_by_id(start_id)
+            end_point = self._get_point_by_id(end_id)
             x1 = start_point['pdf_x'] * self.zoom_level
             y1 = start_point['pdf_y'] * self.zoom_level
             x2 = end_point['pdf_x'] * self.zoom_level
@@ -238,7 +238,8 @@ class PointsLinesMixin:
                 'id': self.next_line_id(),
                 'start_id': start_id,
                 'end_id': end_id,
-                'canvas_id': line_id
+                'canvas_id': line_id,
+                'hidden': False
             }
             self.lines.append(line_data)
             self.mark_modified()
@@ -530,6 +531,9 @@ class PointsLinesMixin:
             pass
 
     def update_points_label(self):
+        if getattr(self, '_batch_depth', 0):
+            self._batch_pending['points_label'] = True
+            return
         self.points_label.config(text=f"Points: {len(self.user_points)}")
 
     def update_lines_label(self):
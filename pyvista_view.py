@@ -2,6 +2,7 @@
 PyVista-based 3D visualization for the digitizer application.
 """
 import tkinter as tk
+import numpy as np
 try:
     import pyvista as pv
     from pyvistaqt import BackgroundPlotter
@@ -146,34 +147,21 @@ class PyVistaViewMixin:
         if picked_point is None:
             return
         
-        # Get the visible points list (same as used in rendering)
-        visible_points = [p for p in self.user_points if not p.get('hidden', False)]
+        # Get the visible points (same rows as used in rendering)
+        rows, _, points_coords = self._pyvista_visible_points()
         
         nearest_point = None
         
         # If we have the exact mesh point index, use it directly
-        if point_idx is not None and 0 <= point_idx < len(visible_points):
-            nearest_point = visible_points[point_idx]
+        if point_idx is not None and 0 <= point_idx < len(rows):
+            nearest_point = self.user_points[rows[point_idx]]
             print(f"Using mesh index {point_idx} -> point ID {nearest_point.get('id')}")
-        else:
+        elif len(rows):
             # Fallback: Find nearest user point to the picked location
-            min_dist = float('inf')
-            
-            for point in visible_points:
-                px = point.get('real_x', point.get('pdf_x', 0))
-                py = -(point.get('real_y', point.get('pdf_y', 0)))
-                pz = float(point.get('z', 0))
-                
-                dist = ((px - picked_point[0])**2 + 
-                       (py - picked_point[1])**2 + 
-                       (pz - picked_point[2])**2)**0.5
-                
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest_point = point
-            
-            if nearest_point:
-                print(f"Fallback search found point ID {nearest_point.get('id')} at distance {min_dist:.2f}")
+            dists = np.linalg.norm(points_coords - np.asarray(picked_point, dtype=np.float64)[:3], axis=1)
+            k = int(np.argmin(dists))
+            nearest_point = self.user_points[rows[k]]
+            print(f"Fallback search found point ID {nearest_point.get('id')} at distance {dists[k]:.2f}")
         
         if nearest_point:
             self._3d_selected_point_id = nearest_point.get('id')
@@ -191,6 +179,21 @@ class PyVistaViewMixin:
             self.update_pyvista_plot()
 
     
+    def _pyvista_visible_points(self):
+        """Return (rows, ids, coords) of the non-hidden points.
+
+        rows index self.user_points, coords is the (N, 3) plotted position (Y
+        mirrored); the hidden flags come from the point table as a boolean mask.
+        """
+        table = self.point_table()
+        rows = np.flatnonzero(~table['hidden'])
+        vis = table[rows]
+        coords = np.column_stack((
+            np.nan_to_num(np.where(np.isnan(vis['real_x']), vis['pdf_x'], vis['real_x'])),
+            -np.nan_to_num(np.where(np.isnan(vis['real_y']), vis['pdf_y'], vis['real_y'])),
+            np.nan_to_num(vis['z'])))
+        return rows, vis['id'], coords
+
     def update_pyvista_plot(self):
         """Update the PyVista 3D visualization."""
         if not PYVISTA_AVAILABLE:
@@ -234,31 +237,18 @@ class PyVistaViewMixin:
             selected_point_id = getattr(self, '_3d_selected_point_id', None)
             
             # Plot points
-            visible_points = [p for p in self.user_points if not p.get('hidden', False)]
-            if visible_points:
-                points_coords = []
-                point_colors = []
-                point_sizes = []
-                
-                for point in visible_points:
-                    px = point.get('real_x', point.get('pdf_x', 0))
-                    py = -(point.get('real_y', point.get('pdf_y', 0)))
-                    pz = float(point.get('z', 0))
-                    points_coords.append([px, py, pz])
-                
+            _, point_ids, points_coords = self._pyvista_visible_points()
+            if len(point_ids):
                 # Create point cloud with per-point colors
                 point_cloud = pv.PolyData(points_coords)
                 
-                # Assign colors efficiently
-                colors_rgb = []
-                for point in visible_points:
-                    pid = point.get('id')
-                    if pid == selected_point_id:
-                        colors_rgb.append([0, 255, 0])  # lime
-                    elif pid in highlight_endpoints:
-                        colors_rgb.append([255, 0, 255])  # magenta
-                    else:
-                        colors_rgb.append([0, 0, 255])  # blue
+                # Assign colors with masks: blue, magenta for highlighted endpoints,
+                # lime for the selected point
+                is_highlight = np.isin(point_ids, list(highlight_endpoints))
+                is_selected = (point_ids == selected_point_id) if selected_point_id is not None else np.zeros(len(point_ids), dtype=bool)
+                colors_rgb = np.tile(np.array([0, 0, 255], dtype=np.uint8), (len(point_ids), 1))
+                colors_rgb[is_highlight] = (255, 0, 255)
+                colors_rgb[is_selected] = (0, 255, 0)
                 
                 point_cloud['colors'] = colors_rgb
                 
@@ -271,13 +261,9 @@ class PyVistaViewMixin:
                 )
                 
                 # Add labels ONLY for selected and highlighted points
-                labels_coords = []
-                labels_text = []
-                for i, point in enumerate(visible_points):
-                    pid = point.get('id')
-                    if pid and (pid == selected_point_id or pid in highlight_endpoints):
-                        labels_coords.append(points_coords[i])
-                        labels_text.append(str(pid))
+                label_mask = (is_selected | is_highlight) & (point_ids != 0)
+                labels_coords = points_coords[label_mask].tolist()
+                labels_text = [str(pid) for pid in point_ids[label_mask].tolist()]
                 
                 if labels_coords:
                     plotter.add_point_labels(
@@ -292,13 +278,11 @@ class PyVistaViewMixin:
                     )
             
             # Plot lines
-            for line in self.lines:
-                if line.get('hidden', False):
-                    continue
-                
+            points_by_id = {p['id']: p for p in self.user_points if 'id' in p}
+            for line in self._visible(self.lines):
                 try:
-                    start = next(p for p in self.user_points if p['id'] == line['start_id'])
-                    end = next(p for p in self.user_points if p['id'] == line['end_id'])
+                    start = points_by_id[line['start_id']]
+                    end = points_by_id[line['end_id']]
                     
                     sx = start.get('real_x', start.get('pdf_x', 0))
                     sy = -(start.get('real_y', start.get('pdf_y', 0)))
@@ -320,10 +304,7 @@ class PyVistaViewMixin:
                     continue
             
             # Plot curves
-            for curve in self.curves:
-                if curve.get('hidden', False):
-                    continue
-                
+            for curve in self._visible(self.curves):
                 pts = []
                 if curve.get('arc_points_real'):
                     arc = curve['arc_points_real']
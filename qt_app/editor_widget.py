@@ -22,7 +22,7 @@ class PointsTableModel(QAbstractTableModel):
     
     def rowCount(self, parent=QModelIndex()):
         if self.project:
-            return len(self.project.points)
+            return self.project.point_count
         return len(self.points)
     
     def columnCount(self, parent=QModelIndex()):
@@ -125,7 +125,7 @@ class LinesTableModel(QAbstractTableModel):
     
     def rowCount(self, parent=QModelIndex()):
         if self.project:
-            return len(self.project.lines)
+            return self.project.line_count
         return len(self.lines)
     
     def columnCount(self, parent=QModelIndex()):
@@ -255,7 +255,7 @@ class CurvesTableModel(QAbstractTableModel):
     
     def rowCount(self, parent=QModelIndex()):
         if self.project:
-            return len(self.project.curves)
+            return self.project.curve_count
         return len(self.curves)
     
     def columnCount(self, parent=QModelIndex()):
@@ -1,12 +1,12 @@
 """
 File import/export operations for digitizer projects.
 """
-import json
 import csv
 import datetime
 import shutil
 from pathlib import Path
 from typing import Optional
+from digitizer.jsonio import load_json, dump_json
 from .models import ProjectData
 
 
@@ -21,8 +21,7 @@ class ImportExport:
             # Add PDF path if it exists
             if project.pdf_path:
                 data['pdf_path'] = project.pdf_path
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            dump_json(data, file_path, indent=2)
             project.project_path = file_path
             project.modified = False
             return True
@@ -34,8 +33,7 @@ class ImportExport:
     def load_project(project: ProjectData, file_path: str) -> bool:
         """Load project from JSON file."""
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            data = load_json(file_path)
             project.from_dict(data)
             # Load PDF path if it exists
             if 'pdf_path' in data:
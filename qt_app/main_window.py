@@ -477,7 +477,10 @@ class MainWindow(QMainWindow):
                     self.set_mode('coordinates')
                 
                 self.project_loaded.emit()
-                self.update_status(f"Loaded: {Path(file_path).name} - {len(self.project.points)} points, {len(self.project.lines)} lines, {len(self.project.curves)} curves")
+                msg = f"Loaded: {Path(file_path).name} - {self.project.point_count} points, {self.project.line_count} lines, {self.project.curve_count} curves"
+                if self.project.dropped_lines_on_load:
+                    msg += f" (removed {self.project.dropped_lines_on_load} zero-length line(s))"
+                self.update_status(msg)
             else:
                 QMessageBox.critical(self, "Error", "Failed to load project")
     
@@ -1227,11 +1230,9 @@ class MainWindow(QMainWindow):
                 return
             
             # Create duplicates
-            new_points = []
-            for z_value in z_values:
-                new_point = self.operations.duplicate_point(point, z_value)
+            new_points = self.operations.duplicate_point_multi(point, z_values)
+            for new_point in new_points:
                 self.pdf_viewer.add_point_marker(new_point.id, new_point.pdf_x, new_point.pdf_y)
-                new_points.append(new_point)
             
             self.pdf_viewer.refresh_markers()
             self._refresh_all_views()
@@ -1879,7 +1880,10 @@ class MainWindow(QMainWindow):
                     if self.project.transformation_matrix is not None:
                         self.set_mode('coordinates')
                     
-                    self.update_status(f"Auto-loaded: {autoload_path.name} ({len(self.project.points)} points, {len(self.project.lines)} lines, {len(self.project.curves)} curves)")
+                    msg = f"Auto-loaded: {autoload_path.name} ({self.project.point_count} points, {self.project.line_count} lines, {self.project.curve_count} curves)"
+                    if self.project.dropped_lines_on_load:
+                        msg += f" - removed {self.project.dropped_lines_on_load} zero-length line(s)"
+                    self.update_status(msg)
                     self.project_loaded.emit()
             except Exception as e:
                 # Silently fail auto-load, user can manually open if needed
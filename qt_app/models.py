@@ -7,7 +7,7 @@ from typing import List, Dict, Any, Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """Represents a 3D point in the digitizer."""
     id: int
@@ -55,7 +55,7 @@ class Point:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     """Represents a line between two points."""
     id: int
@@ -86,7 +86,7 @@ class Line:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Curve:
     """Represents a curve with start, end, and interior points."""
     id: int
@@ -141,6 +141,11 @@ class ProjectData:
         self.project_path: Optional[str] = None
         self.modified: bool = False
         
+        # Undirected endpoint pairs of existing lines (duplicate detection)
+        self._line_keys: set = set()
+        # Zero-length lines removed by the last from_dict (for the UI to report)
+        self.dropped_lines_on_load: int = 0
+        
         # ID allocation
         self._next_point_id = 1
         self._next_line_id = 1
@@ -154,6 +159,13 @@ class ProjectData:
         self._next_point_id += 1
         return result
     
+    def allocate_point_ids(self, n: int) -> range:
+        """Reserve n consecutive point IDs in one step."""
+        max_id = max((p.id for p in self.points), default=0)
+        start = max(self._next_point_id, max_id + 1)
+        self._next_point_id = start + n
+        return range(start, start + n)
+    
     def allocate_line_id(self) -> int:
         """Get next available line ID."""
         max_id = max((l.id for l in self.lines), default=0)
@@ -170,6 +182,37 @@ class ProjectData:
         self._next_curve_id += 1
         return result
     
+    @property
+    def point_count(self) -> int:
+        """Number of points in the project."""
+        return len(self.points)
+    
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the project."""
+        return len(self.lines)
+    
+    @property
+    def curve_count(self) -> int:
+        """Number of curves in the project."""
+        return len(self.curves)
+    
+    def rebuild_line_keys(self):
+        """Rebuild the endpoint-pair index after bulk changes to self.lines."""
+        self._line_keys = {frozenset((l.start_id, l.end_id)) for l in self.lines}
+    
+    def has_line(self, start_id: int, end_id: int) -> bool:
+        """Check whether a line joins the two points (in either direction)."""
+        return frozenset((start_id, end_id)) in self._line_keys
+    
+    def add_line_key(self, start_id: int, end_id: int):
+        """Record a line's endpoint pair after appending it to self.lines."""
+        self._line_keys.add(frozenset((start_id, end_id)))
+    
+    def discard_line_key(self, start_id: int, end_id: int):
+        """Forget a line's endpoint pair after removing it from self.lines."""
+        self._line_keys.discard(frozenset((start_id, end_id)))
+    
     def get_point(self, point_id: int) -> Optional[Point]:
         """Find point by ID."""
         return next((p for p in self.points if p.id == point_id), None)
@@ -215,13 +258,22 @@ class ProjectData:
             result['transformation_matrix'] = self.transformation_matrix.tolist()
         return result
     
-    def from_dict(self, data: Dict[str, Any]):
-        """Load entire project from dictionary."""
+    def from_dict(self, data: Dict[str, Any]) -> int:
+        """Load entire project from dictionary.
+        
+        Returns the number of zero-length lines dropped (also kept in
+        dropped_lines_on_load).
+        """
         # Handle both 'points' and 'user_points' for compatibility
         points_data = data.get('user_points') or data.get('points', [])
         self.points = [Point.from_dict(p) for p in points_data]
         
         self.lines = [Line.from_dict(l) for l in data.get('lines', [])]
+        # Drop zero-length lines (start == end) left behind by older versions
+        valid_lines = [l for l in self.lines if l.start_id != l.end_id]
+        dropped_lines = len(self.lines) - len(valid_lines)
+        self.lines = valid_lines
+        self.rebuild_line_keys()
         self.curves = [Curve.from_dict(c) for c in data.get('curves', [])]
         
         # Handle both old and new calibration point formats
@@ -235,12 +287,20 @@ class ProjectData:
         else:
             self.transformation_matrix = None
         
+        # Seed ID allocation from the loaded data
+        self._next_point_id = max((p.id for p in self.points), default=0) + 1
+        self._next_line_id = max((l.id for l in self.lines), default=0) + 1
+        self._next_curve_id = max((c.id for c in self.curves), default=0) + 1
+        
         self.modified = False
+        self.dropped_lines_on_load = dropped_lines
+        return dropped_lines
     
     def clear(self):
         """Clear all data."""
         self.points.clear()
         self.lines.clear()
+        self._line_keys.clear()
         self.curves.clear()
         self.reference_points_pdf.clear()
         self.reference_points_real.clear()
@@ -249,6 +309,7 @@ class ProjectData:
         self.pdf_path = None
         self.project_path = None
         self.modified = False
+        self.dropped_lines_on_load = 0
         self._next_point_id = 1
         self._next_line_id = 1
         self._next_curve_id = 1
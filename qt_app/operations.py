@@ -45,6 +45,30 @@ class Operations:
             source_point.description
         )
     
+    def duplicate_point_multi(self, source_point: Point, z_values: List[float]) -> List[Point]:
+        """Duplicate a point at several Z values, allocating all IDs at once."""
+        real_x, real_y = self.geometry.transform_point(source_point.pdf_x, source_point.pdf_y)
+        real_x = int(round(real_x))
+        real_y = int(round(real_y))
+        ids = self.project.allocate_point_ids(len(z_values))
+        
+        new_points = [
+            Point(
+                id=point_id,
+                real_x=real_x,
+                real_y=real_y,
+                z=int(round(z)),
+                pdf_x=source_point.pdf_x,
+                pdf_y=source_point.pdf_y,
+                description=source_point.description
+            )
+            for point_id, z in zip(ids, z_values)
+        ]
+        self.project.points.extend(new_points)
+        if new_points:
+            self.project.modified = True
+        return new_points
+    
     def delete_point(self, point_id: int, force: bool = False) -> Tuple[bool, str]:
         """
         Delete a point. Returns (success, message).
@@ -79,8 +103,8 @@ class Operations:
         if not self.project.get_point(end_id):
             return None
         
-        # Prevent zero-length lines
-        if start_id == end_id:
+        # Prevent zero-length and duplicate lines (O(1) via endpoint-pair set)
+        if start_id == end_id or self.project.has_line(start_id, end_id):
             return None
         
         line_id = self.project.allocate_line_id()
@@ -91,6 +115,7 @@ class Operations:
             description=description
         )
         self.project.lines.append(line)
+        self.project.add_line_key(start_id, end_id)
         self.project.modified = True
         return line
     
@@ -114,6 +139,7 @@ class Operations:
             return False, "Line not found"
         
         self.project.lines.remove(line)
+        self.project.discard_line_key(line.start_id, line.end_id)
         self.project.deletion_log.append({
             'type': 'line',
             'id': line_id,
@@ -176,20 +202,16 @@ class Operations:
         if angle_diff > 180:
             angle_diff -= 360
         
-        # Generate points
+        # Generate all interior points in one vectorized pass
+        t = np.arange(1, num_interior + 2, dtype=np.float64) / (num_interior + 2)
+        angle_rad = np.radians(start_angle + t * angle_diff)
+
+        xs = np.rint(center_pos[0] + radius * np.cos(angle_rad)).astype(int)
+        ys = np.rint(center_pos[1] + radius * np.sin(angle_rad)).astype(int)
+        zs = np.rint(start_pos[2] + t * (end_pos[2] - start_pos[2])).astype(int)  # Linear Z interpolation
+
         arc_points = [start_pos]
-        
-        for i in range(1, num_interior + 2):
-            t = i / (num_interior + 2)
-            angle = start_angle + t * angle_diff
-            angle_rad = np.radians(angle)
-            
-            x = center_pos[0] + radius * np.cos(angle_rad)
-            y = center_pos[1] + radius * np.sin(angle_rad)
-            z = start_pos[2] + t * (end_pos[2] - start_pos[2])  # Linear Z interpolation
-            
-            arc_points.append((int(round(x)), int(round(y)), int(round(z))))
-        
+        arc_points.extend(zip(xs.tolist(), ys.tolist(), zs.tolist()))
         arc_points.append(end_pos)
         return arc_points
     
@@ -358,6 +380,7 @@ class Operations:
             else:
                 remaining_lines.append(line)
         self.project.lines = remaining_lines
+        self.project.rebuild_line_keys()
 
         # Remove curves
         remaining_curves = []
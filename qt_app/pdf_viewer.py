@@ -168,9 +168,9 @@ class PDFViewer(QWidget):
             
             # Render at zoom level
             mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-            pix = page.get_pixmap(matrix=mat)
+            pix = page.get_pixmap(matrix=mat, alpha=False)
             
-            # Convert to QImage
+            # Convert to QImage (no alpha channel, so samples are packed RGB)
             img_format = QImage.Format.Format_RGB888 if pix.n == 3 else QImage.Format.Format_RGBA8888
             qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, img_format)
             
@@ -0,0 +1,101 @@
+"""
+Tests for ProjectData bookkeeping: line endpoint-pair dedupe, bulk point id
+allocation and id counter seeding on load.
+Run with: python -m qt_app.test_project_data (or pytest)
+"""
+from qt_app.models import ProjectData, Point, Line
+from qt_app.geometry import GeometryEngine
+from qt_app.operations import Operations
+
+
+def _project_with_points(*ids):
+    p = ProjectData()
+    for pid in ids:
+        p.points.append(Point(id=pid, real_x=0, real_y=0, z=0, pdf_x=0, pdf_y=0))
+    return p
+
+
+def test_line_keys_are_undirected():
+    p = ProjectData()
+    assert not p.has_line(1, 2)
+    p.add_line_key(1, 2)
+    assert p.has_line(1, 2)
+    assert p.has_line(2, 1)
+    p.discard_line_key(2, 1)
+    assert not p.has_line(1, 2)
+    # discarding an unknown pair is a no-op
+    p.discard_line_key(5, 6)
+
+
+def test_create_line_rejects_duplicates_and_zero_length():
+    p = _project_with_points(1, 2, 3)
+    ops = Operations(p, GeometryEngine())
+    line = ops.create_line(1, 2)
+    assert line is not None
+    assert ops.create_line(1, 2) is None
+    assert ops.create_line(2, 1) is None
+    assert ops.create_line(3, 3) is None
+    assert ops.create_line(2, 3) is not None
+    assert p.line_count == 2
+
+    ok, _ = ops.delete_line(line.id)
+    assert ok
+    assert not p.has_line(1, 2)
+    assert ops.create_line(2, 1) is not None
+
+
+def test_rebuild_line_keys_after_bulk_change():
+    p = _project_with_points(1, 2, 3)
+    p.lines = [Line(id=1, start_id=1, end_id=2), Line(id=2, start_id=2, end_id=3)]
+    p.rebuild_line_keys()
+    assert p.has_line(3, 2)
+    p.lines = p.lines[:1]
+    p.rebuild_line_keys()
+    assert not p.has_line(2, 3)
+
+
+def test_allocate_point_ids_reserves_consecutive_range():
+    p = _project_with_points(1, 2, 7)
+    ids = p.allocate_point_ids(3)
+    assert list(ids) == [8, 9, 10]
+    # the single-id allocator continues after the reserved block
+    assert p.allocate_point_id() == 11
+    assert list(p.allocate_point_ids(0)) == []
+    assert p.allocate_point_id() == 12
+
+
+def test_from_dict_seeds_counters_and_drops_zero_length_lines():
+    p = ProjectData()
+    dropped = p.from_dict({
+        'user_points': [
+            {'id': 3, 'pdf_x': 0, 'pdf_y': 0, 'z': '250'},
+            {'id': 9, 'pdf_x': 1, 'pdf_y': 1, 'z': 0},
+        ],
+        'lines': [
+            {'id': 4, 'start_id': 3, 'end_id': 9},
+            {'id': 6, 'start_id': 9, 'end_id': 9},
+        ],
+        'curves': [{'id': 2, 'start_id': 3, 'end_id': 9}],
+    })
+    assert dropped == 1
+    assert p.dropped_lines_on_load == 1
+    assert [l.id for l in p.lines] == [4]
+    assert p.has_line(9, 3)
+    assert p.points[0].z == 250.0
+    assert p.allocate_point_id() == 10
+    assert p.allocate_line_id() == 5
+    assert p.allocate_curve_id() == 3
+
+    p.clear()
+    assert p.dropped_lines_on_load == 0
+    assert not p.has_line(3, 9)
+    assert p.allocate_point_id() == 1
+
+
+if __name__ == '__main__':
+    test_line_keys_are_undirected()
+    test_create_line_rejects_duplicates_and_zero_length()
+    test_rebuild_line_keys_after_bulk_change()
+    test_allocate_point_ids_reserves_consecutive_range()
+    test_from_dict_seeds_counters_and_drops_zero_length_lines()
+    print("✓ ProjectData line keys, id allocation and load seeding")
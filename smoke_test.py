@@ -66,26 +66,21 @@ except Exception as e:
     print('delete_point raised:', e)
     sys.exit(2)
 
-# verify
-ok = True
+# verify (collect messages and write them in one go)
+messages = []
 if any(c.get('id') == 100 for c in app.curves):
-    print('Curve 100 still present (should be deleted)')
-    ok = False
+    messages.append('Curve 100 still present (should be deleted)\n')
 if any(l.get('id') == 10 for l in app.lines):
-    print('Line 10 still present (should be deleted)')
-    ok = False
+    messages.append('Line 10 still present (should be deleted)\n')
 if any(p.get('id') == 3 for p in app.user_points):
-    print('Point 3 still present (should be deleted)')
-    ok = False
+    messages.append('Point 3 still present (should be deleted)\n')
 if not any(entry.get('action','') == 'delete_curve_due_to_point' for entry in app.deletion_log):
-    print('Deletion log missing delete_curve_due_to_point entry')
-    ok = False
+    messages.append('Deletion log missing delete_curve_due_to_point entry\n')
+ok = not messages
 
 messagebox.askyesno = _orig_ask
 
-if ok:
-    print('SMOKE TEST PASSED')
-    sys.exit(0)
-else:
-    print('SMOKE TEST FAILED')
-    sys.exit(3)
+messages.append('SMOKE TEST PASSED\n' if ok else 'SMOKE TEST FAILED\n')
+sys.stdout.write(''.join(messages))
+sys.stdout.flush()
+sys.exit(0 if ok else 3)
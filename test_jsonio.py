@@ -0,0 +1,56 @@
+"""
+Round-trip tests for the project JSON helpers in digitizer.jsonio.
+NaN values and non-ASCII text must survive a save/load cycle whether or
+not orjson is installed.
+Run with: python test_jsonio.py (or pytest)
+"""
+import json
+import math
+import os
+import tempfile
+
+from digitizer.jsonio import load_json, dump_json
+
+
+def _sample_project():
+    return {
+        'user_points': [
+            {'id': 1, 'x': 10.0, 'y': 20.0, 'z': float('nan'), 'description': 'Höhe 12 m – Süd'},
+            {'id': 2, 'x': 30.0, 'y': 40.0, 'z': 250.0, 'description': '測点'},
+        ],
+        'lines': [{'id': 3, 'start_id': 1, 'end_id': 2}],
+    }
+
+
+def test_nan_and_non_ascii_round_trip():
+    data = _sample_project()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project.dig')
+        dump_json(data, path)
+        loaded = load_json(path)
+    points = loaded['user_points']
+    # NaN must come back as a float, not None, so float(p.get('z')) still works
+    assert math.isnan(float(points[0]['z']))
+    assert points[1]['z'] == 250.0
+    assert points[0]['description'] == 'Höhe 12 m – Süd'
+    assert points[1]['description'] == '測点'
+    assert loaded['lines'] == data['lines']
+
+
+def test_load_stdlib_file_with_nan_and_utf8_text():
+    # a file as written by the stdlib encoder without ASCII escaping
+    data = _sample_project()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project.dig')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        loaded = load_json(path)
+    assert math.isnan(loaded['user_points'][0]['z'])
+    assert loaded['user_points'][1]['description'] == '測点'
+
+
+if __name__ == '__main__':
+    test_nan_and_non_ascii_round_trip()
+    print("✓ NaN and non-ASCII text survive dump_json/load_json")
+    test_load_stdlib_file_with_nan_and_utf8_text()
+    print("✓ stdlib-written files with NaN and UTF-8 text load")
@@ -0,0 +1,80 @@
+"""
+Regression test for the lines CSV written by the viewers' export.
+The file must match the original csv.writer output byte for byte, in
+particular whole-number float Z values must keep their decimal point.
+Run with: python test_lines_export.py (or pytest)
+"""
+import csv
+import json
+import os
+import tempfile
+
+from digitizer.exporter import write_lines_z_csv
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _baseline_lines_csv(path, lines, points_by_id):
+    # the lines writer as it was before the export was optimized
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['LineID', 'StartPointID', 'EndPointID', 'StartPointZ', 'EndPointZ'])
+        writer.writerows(
+            [line['id'], line['start_id'], line['end_id'],
+             points_by_id.get(line['start_id'], {}).get('z'),
+             points_by_id.get(line['end_id'], {}).get('z')]
+            for line in lines
+        )
+
+
+def _export_both(lines, points):
+    points_by_id = {p['id']: p for p in points}
+    with tempfile.TemporaryDirectory() as tmp:
+        new_path = os.path.join(tmp, 'new_lines.txt')
+        old_path = os.path.join(tmp, 'old_lines.txt')
+        write_lines_z_csv(new_path, lines, points_by_id)
+        _baseline_lines_csv(old_path, lines, points_by_id)
+        with open(new_path, 'rb') as f:
+            new = f.read()
+        with open(old_path, 'rb') as f:
+            old = f.read()
+    return new, old
+
+
+def test_whole_float_z_keeps_decimal_point():
+    points = [
+        {'id': 1, 'z': 250.0},
+        {'id': 2, 'z': 0.0},
+        {'id': 3, 'z': 1600.5},
+        {'id': 4, 'z': '250'},
+    ]
+    lines = [
+        {'id': 10, 'start_id': 1, 'end_id': 2},
+        {'id': 11, 'start_id': 3, 'end_id': 4},
+        {'id': 12, 'start_id': 1, 'end_id': 99},  # dangling endpoint -> empty Z
+    ]
+    new, old = _export_both(lines, points)
+    assert new == old
+    assert new == (b"LineID,StartPointID,EndPointID,StartPointZ,EndPointZ\r\n"
+                   b"10,1,2,250.0,0.0\r\n"
+                   b"11,3,4,1600.5,250\r\n"
+                   b"12,1,99,250.0,\r\n")
+
+
+def test_sample_projects_match_baseline():
+    for name in ('zf.dig', 'bare.dig', 'demo.dig', '1.dig'):
+        path = os.path.join(HERE, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        points = data.get('user_points') or data.get('points', [])
+        new, old = _export_both(data.get('lines', []), points)
+        assert new == old, name
+
+
+if __name__ == '__main__':
+    test_whole_float_z_keeps_decimal_point()
+    print("✓ whole-number float Z values keep their decimal point")
+    test_sample_projects_match_baseline()
+    print("✓ sample projects match the baseline lines export")
@@ -0,0 +1,58 @@
+"""
+Tests for utils.ListSnapshotCache, the staleness check shared by the
+viewers' id indexes, point arrays and deletion picker.
+Run with: python test_list_cache.py (or pytest)
+"""
+from utils import ListSnapshotCache, index_by_id
+
+
+def _counting_cache():
+    builds = []
+
+    def build(items):
+        builds.append(len(items))
+        return index_by_id(items)
+
+    return ListSnapshotCache(build), builds
+
+
+def test_reused_until_list_changes():
+    cache, builds = _counting_cache()
+    points = [{'id': 1}, {'id': 2}]
+    first = cache.get(points)
+    assert cache.get(points) is first
+    assert builds == [2]
+
+    points.append({'id': 3})          # length change
+    assert 3 in cache.get(points)
+    points[-1] = {'id': 4}            # same length, new last entry
+    assert 4 in cache.get(points)
+    points[0] = {'id': 5}             # same length, new first entry
+    assert 5 in cache.get(points)
+    assert cache.get(list(points)) is not cache.get(points)  # another list object
+    assert builds == [2, 3, 3, 3, 3, 3]
+
+
+def test_invalidate_forces_rebuild():
+    cache, builds = _counting_cache()
+    points = [{'id': 1}, {'id': 2}, {'id': 3}]
+    cache.get(points)
+    points[1] = {'id': 7}             # middle edit is not detected on its own
+    assert 7 not in cache.get(points)
+    cache.invalidate()
+    assert 7 in cache.get(points)
+    assert builds == [3, 3]
+
+
+def test_index_by_id_first_entry_wins():
+    a, b = {'id': 1, 'n': 'a'}, {'id': 1, 'n': 'b'}
+    assert index_by_id([a, b, None])[1] is a
+
+
+if __name__ == '__main__':
+    test_reused_until_list_changes()
+    print("✓ cached value is reused until the list changes")
+    test_invalidate_forces_rebuild()
+    print("✓ invalidate() forces a rebuild")
+    test_index_by_id_first_entry_wins()
+    print("✓ index_by_id keeps the first entry for a repeated id")
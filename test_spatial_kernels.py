@@ -0,0 +1,89 @@
+"""
+Tests for the canvas hit-test index (digitizer.spatial) and the numeric
+kernels behind it (digitizer.kernels). The pure-Python loop versions are
+called directly, so they are checked even when numba is not installed.
+Run with: python test_spatial_kernels.py (or pytest)
+"""
+import numpy as np
+
+from digitizer.kernels import (_points_within_loop, _points_within_numpy,
+                               _padded_bounds_loop, _padded_bounds_numpy)
+from digitizer.spatial import PointIndex
+
+
+def _sample_points(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(0.0, 100.0, n)
+    ys = rng.uniform(0.0, 100.0, n)
+    # points without a pdf position are NaN and must never be hit
+    xs[::17] = np.nan
+    ys[::23] = np.nan
+    # a few exact duplicates and points on a shared x column
+    xs[5] = xs[6] = 50.0
+    ys[5] = ys[6] = 50.0
+    xs[7] = 50.0
+    return xs, ys
+
+
+def _brute_force(xs, ys, px, py, tol_sq):
+    d2 = (xs - px) ** 2 + (ys - py) ** 2
+    hits = [i for i in range(xs.size) if d2[i] <= tol_sq]
+    return np.array(hits, dtype=np.int64), d2[hits]
+
+
+def test_point_index_matches_brute_force():
+    xs, ys = _sample_points()
+    index = PointIndex(xs, ys)
+    assert len(index) == xs.size
+    queries = [(50.0, 50.0, 4.0), (0.0, 0.0, 100.0), (99.0, 1.0, 25.0),
+               (33.3, 66.6, 0.0), (50.0, 50.0, 0.0), (-500.0, -500.0, 1.0)]
+    for px, py, tol_sq in queries:
+        hits, d2 = index.within(px, py, tol_sq)
+        exp_hits, exp_d2 = _brute_force(xs, ys, px, py, tol_sq)
+        assert hits.tolist() == exp_hits.tolist(), (px, py, tol_sq)
+        assert np.allclose(d2, exp_d2)
+        assert not np.isnan(xs[hits]).any() and not np.isnan(ys[hits]).any()
+
+
+def test_point_index_all_nan_and_empty():
+    nan = np.full(3, np.nan)
+    hits, d2 = PointIndex(nan, nan).within(0.0, 0.0, 1e12)
+    assert hits.size == 0 and d2.size == 0
+    hits, d2 = PointIndex([], []).within(0.0, 0.0, 1.0)
+    assert hits.size == 0 and d2.size == 0
+
+
+def test_points_within_loop_matches_numpy():
+    xs, ys = _sample_points()
+    for px, py, tol_sq in [(50.0, 50.0, 4.0), (10.0, 90.0, 400.0), (50.0, 50.0, 0.0)]:
+        loop_hits, loop_d2 = _points_within_loop(xs, ys, px, py, tol_sq)
+        np_hits, np_d2 = _points_within_numpy(xs, ys, px, py, tol_sq)
+        assert loop_hits.tolist() == np_hits.tolist()
+        assert np.array_equal(loop_d2, np_d2)
+
+
+def test_padded_bounds_loop_matches_numpy():
+    rng = np.random.default_rng(3)
+    blocks = [
+        rng.normal(size=(50, 3)) * [10.0, 200.0, 0.5],
+        np.array([[1.0, 2.0, 3.0]]),                      # single point: min_pad applies
+        np.array([[5.0, 5.0, 5.0], [5.0, 9.0, 5.0]]),     # flat axes
+        np.array([[3.0, 1.0, 2.0], [2.0, 0.0, 1.0], [1.0, -1.0, 0.0]]),  # decreasing
+    ]
+    for xyz in blocks:
+        xyz = np.ascontiguousarray(xyz, dtype=np.float64)
+        loop_lo, loop_hi = _padded_bounds_loop(xyz, 0.08, 1e-6)
+        np_lo, np_hi = _padded_bounds_numpy(xyz, 0.08, 1e-6)
+        assert np.allclose(loop_lo, np_lo) and np.allclose(loop_hi, np_hi)
+        assert (loop_lo < loop_hi).all()
+
+
+if __name__ == '__main__':
+    test_point_index_matches_brute_force()
+    print("✓ PointIndex.within matches a brute-force search (NaN points skipped)")
+    test_point_index_all_nan_and_empty()
+    print("✓ PointIndex handles all-NaN and empty inputs")
+    test_points_within_loop_matches_numpy()
+    print("✓ points_within loop and NumPy versions agree")
+    test_padded_bounds_loop_matches_numpy()
+    print("✓ padded_bounds loop and NumPy versions agree")
@@ -0,0 +1,27 @@
+"""
+Tests for the multi-row INSERT batching shared by the viewers' SQL export.
+Run with: python test_sql_batches.py (or pytest)
+"""
+from digitizer.exporter import sql_batches, SQL_BATCH_ROWS, SQL_EDGE_INSERT, SQL_EDGE
+
+
+def test_batches_split_at_row_limit():
+    rows = [SQL_EDGE.format(id=i, start_id=i, end_id=i + 1) for i in range(SQL_BATCH_ROWS * 2 + 1)]
+    statements = list(sql_batches(SQL_EDGE_INSERT, rows))
+    assert len(statements) == 3
+    for stmt in statements:
+        assert stmt.startswith(SQL_EDGE_INSERT)
+        assert stmt.endswith(";\n")
+    assert statements[0].count("\n(") == SQL_BATCH_ROWS
+    assert statements[2] == SQL_EDGE_INSERT + "(2000, 2000, 2001);\n"
+
+
+def test_no_rows_no_statement():
+    assert list(sql_batches(SQL_EDGE_INSERT, iter(()))) == []
+
+
+if __name__ == '__main__':
+    test_batches_split_at_row_limit()
+    print("✓ INSERT statements are split at SQL_BATCH_ROWS rows")
+    test_no_rows_no_statement()
+    print("✓ an empty table writes no INSERT statement")
@@ -1,6 +1,82 @@
 import numpy as np
 from math import atan2, cos, sin
 
+# Column layout of a point table; see points_to_array
+POINT_DTYPE = np.dtype([
+    ('id', np.int64),
+    ('pdf_x', np.float64),
+    ('pdf_y', np.float64),
+    ('real_x', np.float64),
+    ('real_y', np.float64),
+    ('z', np.float64),
+    ('hidden', np.bool_),
+])
+
+
+def _as_float(value):
+    # z may be stored as a string by older projects; unusable values become NaN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def points_to_array(points):
+    """Build a structured (SoA-style) array from point dicts.
+
+    Missing coordinates become NaN so vectorized comparisons simply skip them;
+    row i always corresponds to points[i].
+    """
+    nan = float('nan')
+    rows = [(p.get('id', -1), p.get('pdf_x', nan), p.get('pdf_y', nan),
+             p.get('real_x', nan), p.get('real_y', nan), _as_float(p.get('z', nan)),
+             bool(p.get('hidden', False)))
+            for p in points]
+    return np.array(rows, dtype=POINT_DTYPE)
+
+
+def index_by_id(items):
+    """Return an id -> dict index of `items`; the first entry wins for a repeated id."""
+    index = {}
+    for item in items:
+        try:
+            index.setdefault(item.get('id'), item)
+        except Exception:
+            continue
+    return index
+
+
+class ListSnapshotCache:
+    """A value derived from a list of entity dicts, rebuilt only when the list changes.
+
+    The viewers mutate their point/line/curve lists in many places, so rather
+    than invalidating at every edit the cached value is checked against the
+    list object, its length and its first/last entries. Edits that keep all
+    four (e.g. moving a point in place) must call invalidate().
+    """
+
+    __slots__ = ('_build', '_sig', '_value')
+
+    def __init__(self, build):
+        self._build = build
+        self._sig = None
+        self._value = None
+
+    def get(self, items):
+        """Return the cached value for `items`, rebuilding it if the list changed."""
+        first = items[0] if items else None
+        last = items[-1] if items else None
+        sig = self._sig
+        if (sig is None or sig[0] is not items or sig[1] != len(items)
+                or sig[2] is not first or sig[3] is not last):
+            self._value = self._build(items)
+            self._sig = (items, len(items), first, last)
+        return self._value
+
+    def invalidate(self):
+        self._sig = None
+        self._value = None
+
 
 class UtilsMixin:
     """Utility mixin providing coordinate transformation and angle helpers.
@@ -23,6 +99,38 @@ class UtilsMixin:
         real_point = self.transformation_matrix @ pdf_point
         return float(real_point[self.A]), float(real_point[self.B])
 
+    def transform_points(self, pdf_points):
+        """Transform many PDF points at once.
+
+        `pdf_points` is any (N, 2) array-like. Returns an (N, 2) float array of
+        real-world coordinates (the input itself if no matrix is available).
+        """
+        pts = np.asarray(pdf_points, dtype=np.float64).reshape(-1, 2)
+        M = getattr(self, "transformation_matrix", None)
+        if M is None:
+            return pts
+        # homogeneous transform of all points in a single matmul: [x y 1] @ M.T
+        return pts @ M[0:2, 0:2].T + M[0:2, 2]
+
+    def fill_real_coords(self, points):
+        """Give points lacking real_x/real_y their transformed coordinates.
+
+        All such points go through transform_points in one batch; values are
+        rounded to 2 decimals like single-point edits. Returns the count filled.
+        """
+        missing = [p for p in points if 'real_x' not in p or 'real_y' not in p]
+        if not missing:
+            return 0
+        real = self.transform_points([(p.get('pdf_x', 0.0), p.get('pdf_y', 0.0)) for p in missing])
+        for p, (rx, ry) in zip(missing, real.tolist()):
+            p['real_x'] = round(rx, 2)
+            p['real_y'] = round(ry, 2)
+        return len(missing)
+
+    def point_table(self):
+        """Return user_points as a POINT_DTYPE array for vectorized queries."""
+        return points_to_array(getattr(self, "user_points", []))
+
     def angle_from_center(self, center, point):
         """Return angle in degrees from `center` to `point` in range [0,360)."""
         dx = point[self.A] - center[self.A]